@@ -0,0 +1,5 @@
+from .layouts import map_requests, data_capacity, validate_layout
+from .simulator import simulate_array, generate_workload
+
+__all__ = ['map_requests', 'data_capacity', 'validate_layout',
+           'simulate_array', 'generate_workload']
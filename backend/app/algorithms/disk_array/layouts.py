@@ -0,0 +1,89 @@
+# disk_array/layouts.py
+import numpy as np
+
+MIN_DISKS = {"RAID0": 1, "RAID1": 2, "RAID5": 3, "RAID10": 4}
+
+def validate_layout(level, disks):
+    """Raise ValueError if the array cannot be built with this many disks"""
+    if level not in MIN_DISKS:
+        raise ValueError(f"Unknown RAID level: {level}")
+    if disks < MIN_DISKS[level]:
+        raise ValueError(f"{level} needs at least {MIN_DISKS[level]} disks")
+    if level == "RAID10" and disks % 2:
+        raise ValueError("RAID10 needs an even number of disks")
+
+def data_capacity(level, disks, blocks_per_disk, stripe_unit):
+    """Number of logical blocks the array can address"""
+    validate_layout(level, disks)
+    per_disk = blocks_per_disk // stripe_unit * stripe_unit  # whole stripe units only
+    data_disks = {
+        "RAID0": disks,
+        "RAID1": 1,
+        "RAID5": disks - 1,
+        "RAID10": disks // 2,
+    }[level]
+    return data_disks * per_disk
+
+def _add_copies(ids, disk, physical, extra, writes):
+    """Append one extra operation per write request on disk `extra`"""
+    written = np.flatnonzero(writes)
+    return (
+        np.concatenate((ids, written)),
+        np.concatenate((disk, extra[written])),
+        np.concatenate((physical, physical[written])),
+    )
+
+def map_requests(level, disks, blocks, writes, stripe_unit=8):
+    """
+    Map logical block requests onto physical per-disk operations
+
+    The whole batch is mapped with array arithmetic. Reads go to one copy
+    (mirrors alternate by request index); writes touch every copy, and on
+    RAID5 the parity disk of the stripe as well (left-symmetric rotation).
+
+    Args:
+        level: 'RAID0', 'RAID1', 'RAID5' or 'RAID10'
+        disks: Number of disks in the array
+        blocks: Array of logical block numbers
+        writes: Boolean array, True for write requests
+        stripe_unit: Blocks per stripe unit (chunk)
+
+    Returns:
+        logical: Logical request index of every operation
+        disk: Disk of every operation
+        physical: Block on that disk of every operation
+    """
+    validate_layout(level, disks)
+    blocks = np.asarray(blocks, dtype=np.int64)
+    writes = np.asarray(writes, dtype=bool)
+    ids = np.arange(len(blocks), dtype=np.int64)
+    chunk, offset = np.divmod(blocks, stripe_unit)
+
+    if level == "RAID0":
+        row, disk = np.divmod(chunk, disks)
+        return ids, disk, row * stripe_unit + offset
+
+    if level == "RAID1":
+        # Reads round-robin over the mirrors, writes go to all of them
+        reads = np.flatnonzero(~writes)
+        written = np.flatnonzero(writes)
+        logical = np.concatenate((reads, np.repeat(written, disks)))
+        disk = np.concatenate((
+            reads % disks,
+            np.tile(np.arange(disks, dtype=np.int64), len(written)),
+        ))
+        return logical, disk, blocks[logical]
+
+    if level == "RAID10":
+        row, pair = np.divmod(chunk, disks // 2)
+        physical = row * stripe_unit + offset
+        primary = 2 * pair
+        disk = np.where(writes, primary, primary + ids % 2)
+        return _add_copies(ids, disk, physical, primary + 1, writes)
+
+    # RAID5: parity rotates from the last disk backwards, data follows it
+    row, index = np.divmod(chunk, disks - 1)
+    physical = row * stripe_unit + offset
+    parity = (disks - 1) - row % disks
+    disk = (parity + 1 + index) % disks
+    return _add_copies(ids, disk, physical, parity, writes)
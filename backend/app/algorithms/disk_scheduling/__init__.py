@@ -4,5 +4,21 @@ from .scan import scan
 from .cscan import cscan
 from .look import look
 from .clook import clook
+from .pending import TimedRequest
+from .deadline import DeadlineQueue, deadline_expired
+from .nstep_scan import NStepScanQueue
+from .fscan import FScanQueue
+from .dynamic import simulate_arrivals
+from .drive_model import DriveModel
+from .merge import merge_requests, IntervalIndex
+from .sptf import sptf, sptf_order, request_angles, positioning_profile
+from .trace import TraceReader, TraceReplay, replay_trace, TRACE_RECORD
+from .compare import compare_schedules, COMPARE_ALGORITHMS
 
-__all__ = ['fcfs_disk', 'sstf', 'scan', 'cscan', 'look', 'clook']
\ No newline at end of file
+__all__ = ['fcfs_disk', 'sstf', 'scan', 'cscan', 'look', 'clook',
+           'simulate_arrivals', 'TimedRequest',
+           'DeadlineQueue', 'deadline_expired', 'NStepScanQueue', 'FScanQueue', 'DriveModel',
+           'merge_requests', 'IntervalIndex',
+           'sptf', 'sptf_order', 'request_angles', 'positioning_profile',
+           'TraceReader', 'TraceReplay', 'replay_trace', 'TRACE_RECORD',
+           'compare_schedules', 'COMPARE_ALGORITHMS']
\ No newline at end of file
@@ -1,4 +1,5 @@
 # disk_scheduling/clook.py
+from .kernels import split_around_head, directional_order
 
 def clook(requests, initial_head, direction='right'):
     """
@@ -13,19 +14,8 @@ def clook(requests, initial_head, direction='right'):
     Returns:
         sequence: Order of serviced requests
     """
-    sequence = []
+    # Sort once and split around the head; the order is a slice of that array
+    ordered, split = split_around_head(requests, initial_head)
+    sequence = directional_order(ordered, split, direction, circular=True)
     
-    # Separate requests into left and right of head
-    left = sorted([r for r in requests if r < initial_head])
-    right = sorted([r for r in requests if r >= initial_head])
-    
-    if direction == 'right':
-        # Service right side, jump to leftmost request, continue
-        sequence.extend(right)
-        sequence.extend(left)
-    else:  # direction == 'left'
-        # Service left side (reverse), jump to rightmost, continue (reverse)
-        sequence.extend(reversed(left))
-        sequence.extend(reversed(right))
-    
-    return sequence
\ No newline at end of file
+    return sequence.tolist()
\ No newline at end of file
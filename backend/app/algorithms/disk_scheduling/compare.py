@@ -0,0 +1,47 @@
+# disk_scheduling/compare.py
+import numpy as np
+from .kernels import directional_order, sstf_walk
+
+COMPARE_ALGORITHMS = ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+def compare_schedules(requests, initial_head, direction='right', algorithms=COMPARE_ALGORITHMS):
+    """
+    Service orders of several algorithms from one shared sort of the queue
+
+    The queue is argsorted once (stably) and split around the head. SCAN,
+    C-SCAN, LOOK and C-LOOK are slices of that sorted array, and SSTF walks
+    its distinct cylinders, whose first queue positions fall out of the
+    stable sort. Orders match the individual algorithm functions.
+
+    Args:
+        requests: List (or array) of cylinder positions
+        initial_head: Initial position of disk head
+        direction: 'right' or 'left', for the directional algorithms
+        algorithms: Names from COMPARE_ALGORITHMS
+
+    Returns:
+        sequences: Dict of algorithm -> int64 array of serviced requests
+    """
+    queue = np.asarray(requests, dtype=np.int64)
+    order = np.argsort(queue, kind='stable')
+    ordered = queue[order]
+    split = int(np.searchsorted(ordered, initial_head, side='left'))
+
+    sequences = {}
+    for algo in algorithms:
+        if algo == "FCFS":
+            sequences[algo] = queue
+        elif algo in ("SCAN", "LOOK"):
+            sequences[algo] = directional_order(ordered, split, direction, circular=False)
+        elif algo in ("C-SCAN", "C-LOOK"):
+            sequences[algo] = directional_order(ordered, split, direction, circular=True)
+        elif algo == "SSTF":
+            # Runs of equal cylinders; stable sort puts the first queue position first
+            starts = np.flatnonzero(np.diff(ordered, prepend=ordered[:1] - 1))
+            counts = np.diff(np.append(starts, len(ordered)))
+            walk = sstf_walk(ordered[starts].tolist(), order[starts].tolist(), initial_head)
+            sequences[algo] = np.repeat(ordered[starts][walk], counts[walk])
+        else:
+            raise ValueError(f"Unknown algorithm: {algo}")
+
+    return sequences
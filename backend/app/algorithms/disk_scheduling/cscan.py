@@ -1,4 +1,5 @@
 # disk_scheduling/cscan.py
+from .kernels import split_around_head, directional_order
 
 def cscan(requests, initial_head, direction='right', disk_size=200):
     """
@@ -14,21 +15,8 @@ def cscan(requests, initial_head, direction='right', disk_size=200):
     Returns:
         sequence: Order of serviced requests
     """
-    sequence = []
+    # Sort once and split around the head; the order is a slice of that array
+    ordered, split = split_around_head(requests, initial_head)
+    sequence = directional_order(ordered, split, direction, circular=True)
     
-    # Separate requests into left and right of head
-    left = sorted([r for r in requests if r < initial_head])
-    right = sorted([r for r in requests if r >= initial_head])
-    
-    if direction == 'right':
-        # Service right side, jump to start, then left side
-        sequence.extend(right)
-        # Jump to beginning (cylinder 0) and service left side
-        sequence.extend(left)
-    else:  # direction == 'left'
-        # Service left side (reverse order), jump to end, then right side (reverse)
-        sequence.extend(reversed(left))
-        # Jump to end and service right side
-        sequence.extend(reversed(right))
-    
-    return sequence
\ No newline at end of file
+    return sequence.tolist()
\ No newline at end of file
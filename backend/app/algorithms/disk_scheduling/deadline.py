@@ -0,0 +1,68 @@
+# disk_scheduling/deadline.py
+from collections import deque
+from .pending import SortedPending
+
+def deadline_expired(arrival, now, deadline):
+    """True once a request that arrived at `arrival` has waited `deadline` by `now`"""
+    return now - arrival >= deadline
+
+class DeadlineQueue:
+    """
+    Deadline Disk Scheduling
+    Elevator order with a FIFO expiry queue that bounds latency
+
+    Pending requests sit both in a cylinder-ordered index and in a FIFO by
+    arrival. Requests are normally dispatched in ascending cylinder order
+    (wrapping to the lowest cylinder), `fifo_batch` at a time. At the start
+    of each batch the oldest request is checked; if it has waited at least
+    `deadline`, the batch restarts from it.
+
+    Args:
+        direction: Unused, deadline sweeps always ascend
+        disk_size: Total number of cylinders
+        deadline: Wait after which a request jumps the elevator order
+        fifo_batch: Requests dispatched between expiry checks
+        cylinders: Every cylinder a request may target
+    """
+
+    def __init__(self, direction='right', disk_size=200, deadline=100.0,
+                 fifo_batch=16, cylinders=(), **options):
+        self.sorted = SortedPending(cylinders)
+        self.fifo = deque()
+        self.deadline = deadline
+        self.fifo_batch = fifo_batch
+        self.batch_left = 0
+        self.taken = set()  # Ranks dispatched from the sorted side, still in the FIFO
+
+    def __len__(self):
+        return len(self.sorted)
+
+    def add(self, request):
+        self.sorted.add(request)
+        self.fifo.append(request)
+
+    def pop(self, head, now):
+        # Lazily drop FIFO entries that were already dispatched
+        while self.fifo and self.fifo[0].rank in self.taken:
+            self.taken.discard(self.fifo.popleft().rank)
+
+        request = None
+        if self.batch_left == 0:
+            self.batch_left = self.fifo_batch
+            # The oldest request is also the earliest pending at its cylinder
+            oldest = self.fifo[0]
+            if deadline_expired(oldest.arrival, now, self.deadline):
+                request = oldest
+
+        if request is None:
+            request = self.sorted.first_at_or_above(head)
+            if request is None:
+                request = self.sorted.first_at_or_above(0)
+
+        self.batch_left -= 1
+        self.sorted.remove(request)
+        if self.fifo[0] is request:
+            self.fifo.popleft()
+        else:
+            self.taken.add(request.rank)
+        return request, []
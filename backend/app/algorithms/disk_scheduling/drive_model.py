@@ -0,0 +1,82 @@
+# disk_scheduling/drive_model.py
+from functools import lru_cache
+import numpy as np
+
+@lru_cache(maxsize=32)
+def _seek_table(cylinders, settle_time, sqrt_coeff, linear_coeff, regime_boundary):
+    """Seek time (ms) for every possible seek distance, shared between requests"""
+    distance = np.arange(cylinders, dtype=float)
+    boundary = min(regime_boundary, max(cylinders - 1, 0))
+
+    # Short seeks are dominated by acceleration (sqrt), long ones by coast (linear)
+    short = settle_time + sqrt_coeff * np.sqrt(distance)
+    long = settle_time + sqrt_coeff * np.sqrt(boundary) + linear_coeff * (distance - boundary)
+    table = np.where(distance <= boundary, short, long)
+    table[0] = 0.0
+    table.setflags(write=False)
+    return table
+
+class DriveModel:
+    """
+    Physical timing model of a hard disk drive
+
+    Seek time follows a two-regime curve: settle + sqrt_coeff * sqrt(d) up to
+    `regime_boundary` cylinders, then continues linearly with `linear_coeff`.
+    The curve is precomputed once into a lookup table indexed by seek
+    distance, so timing a whole sequence is a single vectorized gather.
+
+    Args:
+        cylinders: Total number of cylinders
+        settle_time: Head settle time in ms (paid by every non-zero seek)
+        sqrt_coeff: ms per sqrt(cylinder) in the short-seek regime
+        linear_coeff: ms per cylinder in the long-seek regime
+        regime_boundary: Seek distance (cylinders) where the linear regime starts
+        rpm: Spindle speed
+        transfer_rate: Sustained media transfer rate in MB/s
+        request_size: Bytes transferred per request
+        sectors_per_track: Angular positions per track (used by SPTF)
+    """
+
+    def __init__(self, cylinders=200, settle_time=1.0, sqrt_coeff=0.4,
+                 linear_coeff=0.02, regime_boundary=100, rpm=7200,
+                 transfer_rate=150.0, request_size=4096, sectors_per_track=64):
+        self.cylinders = cylinders
+        self.settle_time = settle_time
+        self.sqrt_coeff = sqrt_coeff
+        self.linear_coeff = linear_coeff
+        self.regime_boundary = regime_boundary
+        self.rpm = rpm
+        self.transfer_rate = transfer_rate
+        self.request_size = request_size
+        self.sectors_per_track = sectors_per_track
+
+        self.seek_table = _seek_table(
+            cylinders, settle_time, sqrt_coeff, linear_coeff, regime_boundary
+        )
+
+    @property
+    def rotation_time(self):
+        """Time (ms) for one full platter revolution"""
+        return 60000.0 / self.rpm
+
+    @property
+    def rotational_latency(self):
+        """Average rotational latency (ms): half a revolution"""
+        return self.rotation_time / 2
+
+    @property
+    def transfer_time(self):
+        """Time (ms) to transfer one request"""
+        return self.request_size / (self.transfer_rate * 1e6) * 1000
+
+    def seek_times(self, sequence, initial_head):
+        """Seek time (ms) of every step in a service sequence"""
+        positions = np.asarray(sequence, dtype=np.int64)
+        distances = np.abs(np.diff(positions, prepend=initial_head))
+        return self.seek_table[distances]
+
+    def service_times(self, sequence, initial_head):
+        """Seek + average rotational latency + transfer time (ms) per request"""
+        return self.seek_times(sequence, initial_head) + (
+            self.rotational_latency + self.transfer_time
+        )
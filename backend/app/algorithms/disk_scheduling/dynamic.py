@@ -0,0 +1,200 @@
+# disk_scheduling/dynamic.py
+from collections import deque
+from functools import partial
+from .pending import TimedRequest, SortedPending
+from .deadline import DeadlineQueue
+from .nstep_scan import NStepScanQueue
+from .fscan import FScanQueue
+
+class FCFSQueue:
+    """Dispatch in arrival order"""
+
+    def __init__(self, direction='right', disk_size=200, **options):
+        self.pending = deque()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, request):
+        self.pending.append(request)
+
+    def pop(self, head, now):
+        return self.pending.popleft(), []
+
+class SSTFQueue:
+    """Dispatch the pending request closest to the head"""
+
+    def __init__(self, direction='right', disk_size=200, cylinders=(), **options):
+        self.pending = SortedPending(cylinders)
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, request):
+        self.pending.add(request)
+
+    def pop(self, head, now):
+        right = self.pending.first_at_or_above(head)
+        left = self.pending.first_at_or_below(head - 1)
+
+        if left is None:
+            request = right
+        elif right is None:
+            request = left
+        else:
+            left_dist = head - left.cylinder
+            right_dist = right.cylinder - head
+            if left_dist != right_dist:
+                request = right if right_dist < left_dist else left
+            else:
+                request = right if right.rank < left.rank else left
+        self.pending.remove(request)
+        return request, []
+
+class ElevatorQueue:
+    """
+    Dispatch in sweep order (SCAN, LOOK, C-SCAN, C-LOOK)
+
+    Args:
+        direction: Initial sweep direction
+        disk_size: Total number of cylinders
+        circular: Wrap around instead of reversing (C-SCAN/C-LOOK)
+        to_edge: Travel to the last cylinder before turning (SCAN/C-SCAN)
+        cylinders: Every cylinder a request may target
+    """
+
+    def __init__(self, direction='right', disk_size=200, circular=False,
+                 to_edge=False, cylinders=(), **options):
+        self.pending = SortedPending(cylinders)
+        self.direction = direction
+        self.disk_size = disk_size
+        self.circular = circular
+        self.to_edge = to_edge
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, request):
+        self.pending.add(request)
+
+    def pop(self, head, now):
+        """Return the next request and the waypoints travelled before it"""
+        request, path = self._next(head)
+        self.pending.remove(request)
+        return request, path
+
+    def _next(self, head):
+        last = self.disk_size - 1
+
+        if self.direction == 'right':
+            request = self.pending.first_at_or_above(head)
+            if request is not None:
+                return request, []
+            if self.circular:
+                path = [last, 0] if self.to_edge else []
+                return self.pending.first_at_or_above(0), path
+            self.direction = 'left'
+            path = [last] if self.to_edge else []
+            return self.pending.first_at_or_below(head), path
+
+        request = self.pending.first_at_or_below(head)
+        if request is not None:
+            return request, []
+        if self.circular:
+            path = [0, last] if self.to_edge else []
+            return self.pending.first_at_or_below(last), path
+        self.direction = 'right'
+        path = [0] if self.to_edge else []
+        return self.pending.first_at_or_above(head), path
+
+DISPATCHERS = {
+    "FCFS": FCFSQueue,
+    "SSTF": SSTFQueue,
+    "SCAN": partial(ElevatorQueue, to_edge=True),
+    "C-SCAN": partial(ElevatorQueue, circular=True, to_edge=True),
+    "LOOK": ElevatorQueue,
+    "C-LOOK": partial(ElevatorQueue, circular=True),
+    "Deadline": DeadlineQueue,
+    "N-Step-SCAN": NStepScanQueue,
+    "FSCAN": FScanQueue,
+}
+
+def simulate_arrivals(requests, initial_head, algorithm='FCFS', direction='right',
+                      disk_size=200, seek_time=1.0, service_time=0.0, options=None,
+                      drive=None):
+    """
+    Event-driven disk scheduling with request arrival times
+
+    Requests join the pending set as the clock passes their arrival time and
+    the scheduler picks the next one whenever the head becomes free. SCAN and
+    C-SCAN travel to the disk edge before turning, LOOK and C-LOOK turn at the
+    last pending request.
+
+    Args:
+        requests: List of (arrival_time, cylinder) tuples
+        initial_head: Initial position of disk head
+        algorithm: Key of DISPATCHERS
+        direction: Initial direction for the sweep algorithms
+        disk_size: Total number of cylinders
+        seek_time: Time to move the head by one cylinder
+        service_time: Fixed transfer time per request
+        options: Extra keyword arguments for the dispatcher (e.g. deadline)
+        drive: Optional DriveModel; when given, seek times come from its seek
+               curve and each request also pays rotational latency + transfer
+
+    Returns:
+        served: List of TimedRequest in service order
+        total_seek: Total head movement (cylinders)
+    """
+    factory = DISPATCHERS.get(algorithm)
+    if factory is None:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    # Sorted dispatchers index the distinct cylinders of the whole workload
+    cylinders = {cylinder for _, cylinder in requests}
+    queue = factory(direction, disk_size, cylinders=cylinders, **(options or {}))
+
+    seek_table = None
+    if drive is not None:
+        seek_table = drive.seek_table.tolist()
+        service_time = drive.rotational_latency + drive.transfer_time
+
+    order = sorted(range(len(requests)), key=lambda i: requests[i][0])
+    incoming = [
+        TimedRequest(rank, requests[i][0], requests[i][1])
+        for rank, i in enumerate(order)
+    ]
+
+    served = []
+    total_seek = 0
+    current_time = 0
+    head = initial_head
+    i = 0
+    n = len(incoming)
+
+    while len(served) < n:
+        while i < n and incoming[i].arrival <= current_time:
+            queue.add(incoming[i])
+            i += 1
+        if not queue:
+            current_time = incoming[i].arrival
+            continue
+
+        request, path = queue.pop(head, current_time)
+        distance = 0
+        travel = 0.0
+        for waypoint in path + [request.cylinder]:
+            leg = abs(waypoint - head)
+            distance += leg
+            if seek_table is not None:
+                travel += seek_table[leg]
+            head = waypoint
+        if seek_table is None:
+            travel = distance * seek_time
+
+        request.start = current_time
+        current_time += travel + service_time
+        request.finish = current_time
+        total_seek += distance
+        served.append(request)
+
+    return served, total_seek
@@ -0,0 +1,19 @@
+# disk_scheduling/fscan.py
+from .nstep_scan import NStepScanQueue
+
+class FScanQueue(NStepScanQueue):
+    """
+    FSCAN Disk Scheduling
+    Freezes every waiting request at the start of a sweep
+
+    Arrivals during a sweep go to the second queue and are served by the
+    next sweep, which bounds each request's wait to about two sweeps.
+
+    Args:
+        direction: Initial sweep direction
+        disk_size: Total number of cylinders
+    """
+
+    def __init__(self, direction='right', disk_size=200, **options):
+        options.pop('batch_size', None)
+        super().__init__(direction, disk_size, batch_size=None)
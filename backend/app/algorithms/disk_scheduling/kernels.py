@@ -0,0 +1,109 @@
+# disk_scheduling/kernels.py
+from bisect import bisect_left
+import numpy as np
+
+def split_around_head(requests, initial_head):
+    """
+    Sort the request queue once and locate the initial head in it
+
+    Args:
+        requests: List (or array) of cylinder positions
+        initial_head: Initial position of disk head
+
+    Returns:
+        ordered: Sorted int64 array of requests
+        split: Index of the first request >= initial_head
+    """
+    ordered = np.sort(np.asarray(requests, dtype=np.int64))
+    split = int(np.searchsorted(ordered, initial_head, side='left'))
+    return ordered, split
+
+def directional_order(ordered, split, direction='right', circular=False):
+    """
+    Service order of a directional (elevator-style) algorithm
+
+    Every directional algorithm is a concatenation of the two sorted halves
+    around the head, so the order is derived from the shared sorted array
+    with slicing only (O(n), no re-sort).
+
+    Args:
+        ordered: Sorted array from split_around_head
+        split: Split index from split_around_head
+        direction: 'right' (towards higher cylinders) or 'left' (towards lower)
+        circular: True for C-SCAN/C-LOOK (wrap around), False for SCAN/LOOK (reverse)
+
+    Returns:
+        sequence: int64 array of serviced requests
+    """
+    left = ordered[:split]
+    right = ordered[split:]
+
+    if direction == 'right':
+        tail = left if circular else left[::-1]
+        return np.concatenate((right, tail))
+
+    tail = right[::-1] if circular else right
+    return np.concatenate((left[::-1], tail))
+
+def seek_profile(sequence, initial_head):
+    """
+    Per-request seek distances and running totals
+
+    Args:
+        sequence: Order of serviced requests
+        initial_head: Initial position of disk head
+
+    Returns:
+        seeks: int64 array of seek distances
+        cumulative: int64 array of cumulative seek after each request
+    """
+    positions = np.asarray(sequence, dtype=np.int64)
+    seeks = np.abs(np.diff(positions, prepend=initial_head))
+    return seeks, np.cumsum(seeks)
+
+
+def sstf_walk(cylinders, first_seen, initial_head):
+    """
+    SSTF visiting order over distinct cylinders
+
+    The serviced cylinders always form a contiguous run of the sorted
+    array, so the closest pending cylinder is the left or right neighbour
+    of that run and each step is O(1). Ties go to the cylinder that
+    appears first in the queue.
+
+    Args:
+        cylinders: Sorted list of distinct cylinders
+        first_seen: First queue position of each cylinder
+        initial_head: Initial position of disk head
+
+    Returns:
+        order: List of indices into cylinders, in service order
+    """
+    order = []
+    current = initial_head
+    right = bisect_left(cylinders, current)
+    left = right - 1
+
+    while left >= 0 or right < len(cylinders):
+        if left < 0:
+            take_right = True
+        elif right >= len(cylinders):
+            take_right = False
+        else:
+            left_dist = current - cylinders[left]
+            right_dist = cylinders[right] - current
+            if left_dist != right_dist:
+                take_right = right_dist < left_dist
+            else:
+                take_right = first_seen[right] < first_seen[left]
+
+        if take_right:
+            current = cylinders[right]
+            order.append(right)
+            right += 1
+        else:
+            current = cylinders[left]
+            order.append(left)
+            left -= 1
+
+    return order
@@ -1,4 +1,5 @@
 # disk_scheduling/look.py
+from .kernels import split_around_head, directional_order
 
 def look(requests, initial_head, direction='right'):
     """
@@ -13,19 +14,8 @@ def look(requests, initial_head, direction='right'):
     Returns:
         sequence: Order of serviced requests
     """
-    sequence = []
+    # Sort once and split around the head; the order is a slice of that array
+    ordered, split = split_around_head(requests, initial_head)
+    sequence = directional_order(ordered, split, direction, circular=False)
     
-    # Separate requests into left and right of head
-    left = sorted([r for r in requests if r < initial_head], reverse=True)
-    right = sorted([r for r in requests if r >= initial_head])
-    
-    if direction == 'right':
-        # Service right side first (up to last request), then left side
-        sequence.extend(right)
-        sequence.extend(left)
-    else:  # direction == 'left'
-        # Service left side first (down to last request), then right side
-        sequence.extend(left)
-        sequence.extend(right)
-    
-    return sequence
\ No newline at end of file
+    return sequence.tolist()
\ No newline at end of file
@@ -0,0 +1,137 @@
+# disk_scheduling/merge.py
+import random
+
+class _Interval:
+    """Treap node: one merged sector interval"""
+    __slots__ = ('start', 'end', 'first', 'count', 'priority', 'left', 'right')
+
+    def __init__(self, start, end, first, count):
+        self.start = start
+        self.end = end          # Exclusive end sector
+        self.first = first      # Earliest queue position merged into it
+        self.count = count      # Number of original requests merged into it
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+
+def _split(node, start):
+    """Split a treap into intervals starting <= start and > start"""
+    if node is None:
+        return None, None
+    if node.start <= start:
+        node.right, right = _split(node.right, start)
+        return node, right
+    left, node.left = _split(node.left, start)
+    return left, node
+
+def _join(left, right):
+    """Join two treaps whose intervals are already in order"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _join(left.right, right)
+        return left
+    right.left = _join(left, right.left)
+    return right
+
+def _last(node):
+    while node.right is not None:
+        node = node.right
+    return node
+
+def _first(node):
+    while node.left is not None:
+        node = node.left
+    return node
+
+def _pop_last(node):
+    """Remove the last interval of a treap; returns (treap, interval)"""
+    if node.right is None:
+        return node.left, node
+    node.right, last = _pop_last(node.right)
+    return node, last
+
+def _pop_first(node):
+    """Remove the first interval of a treap; returns (treap, interval)"""
+    if node.left is None:
+        return node.right, node
+    node.left, first = _pop_first(node.left)
+    return node, first
+
+class IntervalIndex:
+    """
+    Pending block requests as non-overlapping sector intervals
+
+    Intervals live in a treap keyed by start sector. A new request splits
+    it at its start: the last interval on the left is back-merged if it
+    reaches the request, and intervals on the right are front-merged while
+    they start inside it. Split, join and each absorption are O(log n)
+    expected, and every interval is absorbed at most once, so merging n
+    requests costs O(n log n) overall.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+        self.back_merges = 0
+        self.front_merges = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, sector, length, index):
+        merged = _Interval(sector, sector + length, index, 1)
+        left, right = _split(self.root, sector)
+
+        # Back merge: previous interval ends at or after our start
+        if left is not None and _last(left).end >= merged.start:
+            left, prev = _pop_last(left)
+            self._absorb(merged, prev)
+            merged.start = prev.start
+            self.back_merges += 1
+
+        # Front merge: following intervals start at or before our end
+        while right is not None and _first(right).start <= merged.end:
+            right, nxt = _pop_first(right)
+            self._absorb(merged, nxt)
+            self.front_merges += 1
+
+        self.size += 1
+        self.root = _join(_join(left, merged), right)
+
+    def intervals(self):
+        """(start, end, first, count) of every interval, by start sector"""
+        stack, node = [], self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.start, node.end, node.first, node.count
+            node = node.right
+
+    def _absorb(self, merged, other):
+        merged.end = max(merged.end, other.end)
+        merged.first = min(merged.first, other.first)
+        merged.count += other.count
+        self.size -= 1
+
+def merge_requests(blocks):
+    """
+    Merge contiguous or overlapping block requests (elevator merge)
+
+    Args:
+        blocks: List of (start_sector, length) tuples in queue order
+
+    Returns:
+        merged: List of (start_sector, length, merged_count) tuples, ordered
+                by the queue position of their earliest original request
+    """
+    index = IntervalIndex()
+    for i, (sector, length) in enumerate(blocks):
+        index.add(sector, length, i)
+
+    merged = sorted(index.intervals(), key=lambda interval: interval[2])
+    return [(start, end - start, count) for start, end, _, count in merged]
@@ -0,0 +1,60 @@
+# disk_scheduling/nstep_scan.py
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+class NStepScanQueue:
+    """
+    N-step SCAN Disk Scheduling
+    Arrivals wait in FIFO order and are served in batches of at most N
+
+    Each batch is frozen, sorted once (O(k log k)) and swept like an
+    elevator, turning at its last request. Requests that arrive during a
+    sweep wait for a later batch, so a burst near the head cannot hold
+    back older requests indefinitely.
+
+    Args:
+        direction: Initial sweep direction
+        disk_size: Total number of cylinders
+        batch_size: Requests per batch (None freezes everything waiting)
+    """
+
+    def __init__(self, direction='right', disk_size=200, batch_size=8, **options):
+        self.waiting = deque()
+        self.sweep = deque()
+        self.direction = direction
+        self.batch_size = batch_size
+
+    def __len__(self):
+        return len(self.waiting) + len(self.sweep)
+
+    def add(self, request):
+        self.waiting.append(request)
+
+    def pop(self, head, now):
+        if not self.sweep:
+            self._start_sweep(head)
+        return self.sweep.popleft(), []
+
+    def _start_sweep(self, head):
+        """Freeze the next batch and lay out its sweep order"""
+        count = len(self.waiting)
+        if self.batch_size is not None:
+            count = min(count, self.batch_size)
+        batch = sorted(
+            (self.waiting.popleft() for _ in range(count)),
+            key=lambda r: (r.cylinder, r.rank)
+        )
+        cylinders = [r.cylinder for r in batch]
+
+        if self.direction == 'right':
+            split = bisect_left(cylinders, head)
+            ahead, behind = batch[split:], batch[:split][::-1]
+        else:
+            split = bisect_right(cylinders, head)
+            ahead, behind = batch[:split][::-1], batch[split:]
+
+        # The sweep ends moving the other way if it had to turn around
+        if behind:
+            self.direction = 'left' if self.direction == 'right' else 'right'
+        self.sweep.extend(ahead)
+        self.sweep.extend(behind)
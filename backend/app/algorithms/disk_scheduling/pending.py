@@ -0,0 +1,95 @@
+# disk_scheduling/pending.py
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+class TimedRequest:
+    """Disk request that arrives while the head is already moving"""
+    __slots__ = ('rank', 'arrival', 'cylinder', 'start', 'finish')
+
+    def __init__(self, rank, arrival, cylinder):
+        self.rank = rank            # Position in arrival order (tie-breaker)
+        self.arrival = arrival
+        self.cylinder = cylinder
+        self.start = -1             # Dispatch time
+        self.finish = -1            # Completion time
+
+class SortedPending:
+    """
+    Pending requests ordered by (cylinder, arrival rank)
+
+    The cylinders that can ever be requested are known up front, so each
+    one gets a slot holding its pending requests in arrival order, and a
+    Fenwick tree over the slots counts what is pending. Adding, removing
+    and finding the nearest non-empty cylinder on either side of the head
+    are all O(log m) for m distinct cylinders.
+
+    Requests must be added in arrival-rank order, which keeps every slot
+    sorted by rank.
+
+    Args:
+        cylinders: Every cylinder a request may target
+    """
+
+    def __init__(self, cylinders):
+        self.cylinders = sorted(set(cylinders))
+        self.slot = {c: i for i, c in enumerate(self.cylinders)}
+        self.queues = [deque() for _ in self.cylinders]
+        self.tree = [0] * (len(self.cylinders) + 1)
+        self.count = 0
+        self.top = 1 << len(self.cylinders).bit_length()
+
+    def __len__(self):
+        return self.count
+
+    def add(self, request):
+        slot = self.slot[request.cylinder]
+        self.queues[slot].append(request)
+        self._update(slot, 1)
+
+    def remove(self, request):
+        """Remove request, which must be the earliest pending at its cylinder"""
+        slot = self.slot[request.cylinder]
+        if self.queues[slot].popleft() is not request:
+            raise ValueError("Only the earliest request at a cylinder can be removed")
+        self._update(slot, -1)
+
+    def first_at_or_above(self, cylinder):
+        """Earliest-arrived request at the lowest cylinder >= cylinder"""
+        before = self._prefix(bisect_left(self.cylinders, cylinder))
+        if before == self.count:
+            return None
+        return self.queues[self._find(before + 1)][0]
+
+    def first_at_or_below(self, cylinder):
+        """Earliest-arrived request at the highest cylinder <= cylinder"""
+        upto = self._prefix(bisect_right(self.cylinders, cylinder))
+        if upto == 0:
+            return None
+        return self.queues[self._find(upto)][0]
+
+    def _update(self, slot, delta):
+        self.count += delta
+        i = slot + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, slots):
+        """Pending requests in the first `slots` slots"""
+        total = 0
+        while slots > 0:
+            total += self.tree[slots]
+            slots -= slots & -slots
+        return total
+
+    def _find(self, k):
+        """Slot holding the k-th pending request (1-based)"""
+        pos = 0
+        step = self.top
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] < k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return pos
@@ -1,4 +1,5 @@
 # disk_scheduling/scan.py
+from .kernels import split_around_head, directional_order
 
 def scan(requests, initial_head, direction='right', disk_size=200):
     """
@@ -14,25 +15,8 @@ def scan(requests, initial_head, direction='right', disk_size=200):
     Returns:
         sequence: Order of serviced requests
     """
-    sequence = []
+    # Sort once and split around the head; the order is a slice of that array
+    ordered, split = split_around_head(requests, initial_head)
+    sequence = directional_order(ordered, split, direction, circular=False)
     
-    # Separate requests into left and right of head
-    left = sorted([r for r in requests if r < initial_head], reverse=True)
-    right = sorted([r for r in requests if r >= initial_head])
-    
-    if direction == 'right':
-        # Service right side first, go to end, then left side
-        sequence.extend(right)
-        if right and right[-1] != disk_size - 1:
-            # Head goes to end if there are requests on right
-            pass  # We go to end implicitly by servicing all right requests
-        sequence.extend(left)
-    else:  # direction == 'left'
-        # Service left side first, go to start, then right side
-        sequence.extend(left)
-        if left and left[-1] != 0:
-            # Head goes to start if there are requests on left
-            pass  # We go to start implicitly by servicing all left requests
-        sequence.extend(right)
-    
-    return sequence
\ No newline at end of file
+    return sequence.tolist()
\ No newline at end of file
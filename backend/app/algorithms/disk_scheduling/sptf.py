@@ -0,0 +1,143 @@
+# disk_scheduling/sptf.py
+from bisect import bisect_left
+from .drive_model import DriveModel
+
+GOLDEN_RATIO_FRACTION = 0.6180339887498949
+
+def request_angles(count, sectors=None, sectors_per_track=64):
+    """
+    Angular position (fraction of a revolution) of every request
+
+    Without explicit sectors, positions are spread over the track with a
+    golden-ratio sequence so results are reproducible for a given queue.
+    """
+    if sectors is not None:
+        return [s / sectors_per_track for s in sectors]
+    return [(i * GOLDEN_RATIO_FRACTION) % 1.0 for i in range(count)]
+
+def sptf_order(requests, angles, initial_head, drive):
+    """
+    SPTF (Shortest Positioning Time First) service order
+
+    Requests are bucketed by cylinder. Each dispatch walks outwards from
+    the head one occupied cylinder at a time and stops as soon as the seek
+    alone to the next cylinder costs more than the best seek + rotation
+    found so far. Inside a bucket, requests are sorted by angle, so the
+    first one to pass under the head is found by binary search.
+
+    Args:
+        requests: List of cylinder positions
+        angles: Angular position of each request (fraction of a revolution)
+        initial_head: Initial position of disk head
+        drive: DriveModel providing the seek table and rotation time
+
+    Returns:
+        order: Request indices in service order
+    """
+    buckets = {}
+    for i, (cylinder, angle) in enumerate(zip(requests, angles)):
+        buckets.setdefault(cylinder, []).append((angle, i))
+    for bucket in buckets.values():
+        bucket.sort()
+    cylinders = sorted(buckets)
+
+    seek_table = drive.seek_table.tolist()  # scalar lookups are faster on a list
+    rotation = drive.rotation_time
+    transfer = drive.transfer_time
+
+    order = []
+    current_time = 0.0
+    head = initial_head
+
+    while cylinders:
+        best = None  # (positioning time, request index, cylinder, bucket position)
+        right = bisect_left(cylinders, head)
+        left = right - 1
+
+        while left >= 0 or right < len(cylinders):
+            left_dist = head - cylinders[left] if left >= 0 else None
+            right_dist = cylinders[right] - head if right < len(cylinders) else None
+            if right_dist is None or (left_dist is not None and left_dist < right_dist):
+                cylinder, distance = cylinders[left], left_dist
+                left -= 1
+            else:
+                cylinder, distance = cylinders[right], right_dist
+                right += 1
+
+            seek = seek_table[distance]
+            if best is not None and seek > best[0]:
+                break  # every remaining cylinder is farther away
+
+            # First request in this bucket to rotate under the head after the seek
+            bucket = buckets[cylinder]
+            arrival_angle = ((current_time + seek) / rotation) % 1.0
+            candidate = bisect_left(bucket, (arrival_angle, -1)) % len(bucket)
+            angle, index = bucket[candidate]
+            wait = ((angle - arrival_angle) % 1.0) * rotation
+            if best is None or (seek + wait, index) < best[:2]:
+                best = (seek + wait, index, cylinder, candidate)
+
+        positioning, index, cylinder, candidate = best
+        bucket = buckets[cylinder]
+        bucket.pop(candidate)
+        if not bucket:
+            del buckets[cylinder]
+            cylinders.pop(bisect_left(cylinders, cylinder))
+
+        order.append(index)
+        current_time += positioning + transfer
+        head = cylinder
+
+    return order
+
+def sptf(requests, initial_head, drive=None, angles=None):
+    """
+    SPTF (Shortest Positioning Time First) Disk Scheduling
+    Services the request with the smallest seek + rotational delay
+
+    Args:
+        requests: List of cylinder positions
+        initial_head: Initial position of disk head
+        drive: DriveModel (defaults to DriveModel())
+        angles: Optional angular position of each request
+
+    Returns:
+        sequence: Order of serviced requests
+    """
+    drive = drive or DriveModel()
+    if angles is None:
+        angles = request_angles(len(requests), sectors_per_track=drive.sectors_per_track)
+    return [requests[i] for i in sptf_order(requests, angles, initial_head, drive)]
+
+def positioning_profile(cylinders, angles, initial_head, drive):
+    """
+    Time a fixed service order with rotational position awareness
+
+    Args:
+        cylinders: Cylinders in service order
+        angles: Angular positions in the same order
+        initial_head: Initial position of disk head
+        drive: DriveModel
+
+    Returns:
+        seek_times: Seek time (ms) per request
+        rotation_waits: Rotational wait (ms) per request
+    """
+    seek_table = drive.seek_table.tolist()  # scalar lookups are faster on a list
+    rotation = drive.rotation_time
+    transfer = drive.transfer_time
+
+    seek_times = []
+    rotation_waits = []
+    current_time = 0.0
+    head = initial_head
+    for cylinder, angle in zip(cylinders, angles):
+        seek = seek_table[abs(cylinder - head)]
+        arrival_angle = ((current_time + seek) / rotation) % 1.0
+        wait = ((angle - arrival_angle) % 1.0) * rotation
+        seek_times.append(seek)
+        rotation_waits.append(wait)
+        current_time += seek + wait + transfer
+        head = cylinder
+
+    return seek_times, rotation_waits
@@ -1,26 +1,39 @@
 # disk_scheduling/sstf.py
+from .kernels import sstf_walk
 
 def sstf(requests, initial_head):
     """
     SSTF (Shortest Seek Time First) Disk Scheduling
     Services the request closest to current head position
-    
+
+    Requests are sorted once; the serviced cylinders always form a contiguous
+    run of the sorted array, so the closest pending request is the left or
+    right neighbour of that run. Each step is O(1) and the whole schedule is
+    O(n log n). Ties go to the request that appears first in the queue.
+
     Args:
         requests: List of cylinder positions
         initial_head: Initial position of disk head
-    
+
     Returns:
         sequence: Order of serviced requests
     """
-    remaining = requests.copy()
+    if not requests:
+        return []
+
+    # Distinct cylinders with their count and first position in the queue
+    first_seen = {}
+    counts = {}
+    for i, r in enumerate(requests):
+        if r not in first_seen:
+            first_seen[r] = i
+            counts[r] = 0
+        counts[r] += 1
+    cylinders = sorted(first_seen)
+
     sequence = []
-    current = initial_head
-    
-    while remaining:
-        # Find closest request
-        closest = min(remaining, key=lambda x: abs(x - current))
-        sequence.append(closest)
-        remaining.remove(closest)
-        current = closest
-    
-    return sequence
\ No newline at end of file
+    for idx in sstf_walk(cylinders, [first_seen[c] for c in cylinders], initial_head):
+        # Duplicates are at distance zero and are serviced back to back
+        sequence.extend([cylinders[idx]] * counts[cylinders[idx]])
+
+    return sequence
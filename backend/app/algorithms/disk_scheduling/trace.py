@@ -0,0 +1,260 @@
+# disk_scheduling/trace.py
+import numpy as np
+from .fcfs import fcfs_disk
+from .sstf import sstf
+from .scan import scan
+from .cscan import cscan
+from .look import look
+from .clook import clook
+from .kernels import seek_profile
+
+# Fixed-size binary record: little-endian, packed (21 bytes)
+TRACE_RECORD = np.dtype([
+    ('timestamp', '<f8'),  # seconds
+    ('lba', '<u8'),        # start sector
+    ('size', '<u4'),       # sectors
+    ('write', 'u1'),       # 0 = read, 1 = write
+])
+
+TRACE_FORMATS = ('csv', 'blkparse', 'binary')
+
+# Seek histogram: exact below 2**HISTOGRAM_BITS cylinders, then
+# 2**(HISTOGRAM_BITS - 1) buckets per power of two (under 0.2% wide)
+HISTOGRAM_BITS = 10
+
+def _seek_buckets(seeks):
+    """Log-linear histogram bucket of every seek distance"""
+    seeks = np.asarray(seeks, dtype=np.int64)
+    exact = 1 << HISTOGRAM_BITS
+    _, exponent = np.frexp(np.maximum(seeks, exact).astype(float))
+    shift = exponent - HISTOGRAM_BITS
+    # Leading HISTOGRAM_BITS bits of the distance, after the buckets of lower octaves
+    bucket = (seeks >> shift) + shift * (exact >> 1)
+    return np.where(seeks < exact, seeks, bucket)
+
+def _bucket_floor(buckets):
+    """Smallest seek distance that falls into each bucket"""
+    buckets = np.asarray(buckets, dtype=np.int64)
+    exact = 1 << HISTOGRAM_BITS
+    half = exact >> 1
+    shift = np.maximum(buckets - exact, 0) // half + 1
+    return np.where(buckets < exact, buckets, (buckets - shift * half) << shift)
+
+def _empty_batch():
+    return (np.empty(0, dtype=float), np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64), np.empty(0, dtype=bool))
+
+class TraceReader:
+    """
+    Incremental parser for block I/O traces
+
+    Bytes can be fed in arbitrary chunks; a record split between chunks is
+    kept until the rest arrives, so memory only grows with the chunk size.
+
+    Formats:
+        csv: timestamp,lba,size,rw per line (rw is R/W or 0/1, header optional)
+        blkparse: blkparse text output, queue ('Q') events only
+        binary: packed TRACE_RECORD structs
+    """
+
+    def __init__(self, fmt='csv'):
+        if fmt not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {fmt}")
+        self.fmt = fmt
+        self.remainder = b''
+        self.lines = 0
+
+    def feed(self, chunk):
+        """Parse every complete record in the chunk"""
+        data = self.remainder + chunk
+        if self.fmt == 'binary':
+            whole = len(data) - len(data) % TRACE_RECORD.itemsize
+            self.remainder = data[whole:]
+            records = np.frombuffer(data[:whole], dtype=TRACE_RECORD)
+            return (records['timestamp'].astype(float), records['lba'].astype(np.int64),
+                    records['size'].astype(np.int64), records['write'] != 0)
+
+        cut = data.rfind(b'\n') + 1
+        self.remainder = data[cut:]
+        return self._parse_lines(data[:cut].splitlines())
+
+    def close(self):
+        """Parse what is left after the last chunk"""
+        data, self.remainder = self.remainder, b''
+        if self.fmt == 'binary':
+            if data:
+                raise ValueError("Trace ends with a truncated binary record")
+            return _empty_batch()
+        return self._parse_lines(data.splitlines())
+
+    def _parse_lines(self, lines):
+        timestamps, lbas, sizes, writes = [], [], [], []
+        parse = self._parse_csv if self.fmt == 'csv' else self._parse_blkparse
+        for line in lines:
+            self.lines += 1
+            record = parse(line)
+            if record is not None:
+                timestamps.append(record[0])
+                lbas.append(record[1])
+                sizes.append(record[2])
+                writes.append(record[3])
+        if not timestamps:
+            return _empty_batch()
+        return (np.array(timestamps, dtype=float), np.array(lbas, dtype=np.int64),
+                np.array(sizes, dtype=np.int64), np.array(writes, dtype=bool))
+
+    def _parse_csv(self, line):
+        line = line.strip()
+        if not line or line.startswith(b'#'):
+            return None
+        fields = line.split(b',')
+        try:
+            timestamp = float(fields[0])
+        except ValueError:
+            if self.lines == 1:
+                return None  # header
+            raise ValueError(f"Malformed trace line {self.lines}")
+        if len(fields) < 4:
+            raise ValueError(f"Malformed trace line {self.lines}")
+        op = fields[3].strip().upper()
+        return timestamp, int(fields[1]), int(fields[2]), op.startswith(b'W') or op == b'1'
+
+    def _parse_blkparse(self, line):
+        # dev cpu seq time pid action rwbs sector + size [process]
+        fields = line.split()
+        if len(fields) < 10 or fields[5] != b'Q' or fields[8] != b'+':
+            return None
+        return float(fields[3]), int(fields[7]), int(fields[9]), b'W' in fields[6]
+
+WINDOW_SCHEDULERS = {
+    "FCFS": lambda queue, head, direction, disk_size: fcfs_disk(queue, head),
+    "SSTF": lambda queue, head, direction, disk_size: sstf(queue.tolist(), head),
+    "SCAN": lambda queue, head, direction, disk_size: scan(queue, head, direction, disk_size),
+    "C-SCAN": lambda queue, head, direction, disk_size: cscan(queue, head, direction, disk_size),
+    "LOOK": lambda queue, head, direction, disk_size: look(queue, head, direction),
+    "C-LOOK": lambda queue, head, direction, disk_size: clook(queue, head, direction),
+}
+
+class TraceReplay:
+    """
+    Replay a block trace through a disk scheduler in fixed-size windows
+
+    Requests are mapped from LBA to cylinder and collected until a window of
+    `window` requests is full; the window is then scheduled from the current
+    head position, which (like the sweep direction) carries over to the next
+    window. Only running totals and a fixed-size seek histogram are kept.
+
+    Args:
+        algorithm: Key of WINDOW_SCHEDULERS
+        initial_head: Initial position of disk head
+        cylinders: Total number of cylinders (LBAs beyond the disk are clipped)
+        sectors_per_cylinder: Sectors mapped to one cylinder
+        window: Requests scheduled together (queue depth)
+        direction: Initial direction for the sweep algorithms
+    """
+
+    def __init__(self, algorithm='FCFS', initial_head=0, cylinders=65536,
+                 sectors_per_cylinder=2048, window=256, direction='right'):
+        if algorithm not in WINDOW_SCHEDULERS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.cylinders = cylinders
+        self.sectors_per_cylinder = sectors_per_cylinder
+        self.window = window
+        self.direction = direction
+        self.head = initial_head
+        self.fcfs_head = initial_head
+        self.pending = np.empty(0, dtype=np.int64)
+
+        self.requests = 0
+        self.reads = 0
+        self.writes = 0
+        self.sectors = 0
+        self.out_of_range = 0
+        self.first_timestamp = None
+        self.last_timestamp = None
+        self.windows = 0
+        self.total_seek = 0
+        self.fcfs_seek = 0
+        self.max_seek = 0
+        self.histogram = np.zeros(
+            int(_seek_buckets([max(cylinders - 1, 0)])[0]) + 1, dtype=np.int64
+        )
+
+    def add(self, timestamps, lbas, sizes, writes):
+        """Account for a batch of parsed records and schedule full windows"""
+        if not len(lbas):
+            return
+        self.requests += len(lbas)
+        self.writes += int(writes.sum())
+        self.reads += len(lbas) - int(writes.sum())
+        self.sectors += int(sizes.sum())
+        if self.first_timestamp is None:
+            self.first_timestamp = float(timestamps[0])
+        self.last_timestamp = float(timestamps[-1])
+
+        cylinders = lbas // self.sectors_per_cylinder
+        self.out_of_range += int(((cylinders < 0) | (cylinders >= self.cylinders)).sum())
+        cylinders = cylinders.clip(0, self.cylinders - 1)
+
+        # Unscheduled (arrival order) baseline
+        fcfs_seeks, _ = seek_profile(cylinders, self.fcfs_head)
+        self.fcfs_seek += int(fcfs_seeks.sum())
+        self.fcfs_head = int(cylinders[-1])
+
+        self.pending = np.concatenate((self.pending, cylinders))
+        full = len(self.pending) - len(self.pending) % self.window
+        for start in range(0, full, self.window):
+            self._schedule(self.pending[start:start + self.window])
+        self.pending = self.pending[full:]
+
+    def close(self):
+        """Schedule the last partial window"""
+        if len(self.pending):
+            self._schedule(self.pending)
+            self.pending = self.pending[:0]
+
+    def _schedule(self, queue):
+        sequence = WINDOW_SCHEDULERS[self.algorithm](
+            queue, self.head, self.direction, self.cylinders
+        )
+        seeks, _ = seek_profile(sequence, self.head)
+        self.histogram += np.bincount(_seek_buckets(seeks), minlength=len(self.histogram))
+        self.max_seek = max(self.max_seek, int(seeks.max()))
+        self.total_seek += int(seeks.sum())
+        self.windows += 1
+
+        if self.algorithm in ("SCAN", "LOOK"):
+            previous = sequence[-2] if len(sequence) > 1 else self.head
+            if sequence[-1] != previous:
+                self.direction = 'right' if sequence[-1] > previous else 'left'
+        self.head = int(sequence[-1])
+
+    def seek_percentiles(self, percentiles):
+        """
+        Seek distance percentiles from the histogram
+
+        Exact below 2**HISTOGRAM_BITS cylinders, otherwise the lower edge of
+        the percentile's bucket; the maximum is always exact.
+        """
+        cumulative = np.cumsum(self.histogram)
+        if not cumulative[-1]:
+            return [0] * len(percentiles)
+        ranks = np.ceil(np.asarray(percentiles) / 100 * cumulative[-1]).clip(1)
+        floors = _bucket_floor(np.searchsorted(cumulative, ranks))
+        return np.where(ranks >= cumulative[-1], self.max_seek, floors).tolist()
+
+def replay_trace(chunks, fmt='csv', **options):
+    """
+    Parse and replay a trace given as an iterable of byte chunks
+
+    Returns:
+        replay: Closed TraceReplay holding the aggregates
+    """
+    reader = TraceReader(fmt)
+    replay = TraceReplay(**options)
+    for chunk in chunks:
+        replay.add(*reader.feed(chunk))
+    replay.add(*reader.close())
+    replay.close()
+    return replay
@@ -0,0 +1,5 @@
+from .index import ValidCountIndex
+from .ftl import FlashTranslationLayer, replay
+from .workload import generate_writes
+
+__all__ = ['ValidCountIndex', 'FlashTranslationLayer', 'replay', 'generate_writes']
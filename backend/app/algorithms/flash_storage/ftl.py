@@ -0,0 +1,256 @@
+# flash_storage/ftl.py
+import heapq
+import numpy as np
+from .index import ValidCountIndex
+
+class FlashTranslationLayer:
+    """
+    Page-mapped flash translation layer with garbage collection
+
+    The logical-to-physical map, its reverse (int32, so page numbers must
+    stay below 2**31) and the valid-page bitmap are numpy arrays. Host writes
+    and GC relocations fill separate open blocks, free blocks are handed out
+    lowest erase count first (dynamic wear leveling), and GC victims come
+    from a ValidCountIndex. Closed blocks are also kept in an erase count
+    heap, so static wear leveling finds the coldest one without a scan.
+
+    Args:
+        blocks: Number of erase blocks
+        pages_per_block: Pages per erase block
+        overprovisioning: Share of physical pages hidden from the host
+        gc_policy: 'greedy' or 'cost-benefit'
+        gc_threshold: Collect garbage when fewer free blocks remain
+        wear_leveling: Migrate cold blocks when erase counts drift apart
+        wl_threshold: Allowed erase count gap before a cold block is migrated
+        read_time: Page read time (ms)
+        program_time: Page program time (ms)
+        erase_time: Block erase time (ms)
+    """
+
+    def __init__(self, blocks=256, pages_per_block=64, overprovisioning=0.1,
+                 gc_policy='greedy', gc_threshold=2, wear_leveling=True,
+                 wl_threshold=16, read_time=0.05, program_time=0.2, erase_time=2.0):
+        if gc_policy not in ('greedy', 'cost-benefit'):
+            raise ValueError(f"Unknown GC policy: {gc_policy}")
+        if gc_threshold < 2:
+            raise ValueError("gc_threshold must be at least 2")
+
+        total = blocks * pages_per_block
+        self.logical_pages = int(total * (1 - overprovisioning))
+        if self.logical_pages > total - (gc_threshold + 2) * pages_per_block:
+            raise ValueError("Overprovisioning leaves no room for garbage collection")
+
+        self.blocks = blocks
+        self.pages_per_block = pages_per_block
+        self.gc_policy = gc_policy
+        self.gc_threshold = gc_threshold
+        self.wear_leveling = wear_leveling
+        self.wl_threshold = wl_threshold
+        self.read_time = read_time
+        self.program_time = program_time
+        self.erase_time = erase_time
+
+        if total > np.iinfo(np.int32).max:
+            raise ValueError("Too many pages for 32-bit page numbers")
+        self.l2p = np.full(self.logical_pages, -1, dtype=np.int32)
+        self.p2l = np.full(total, -1, dtype=np.int32)
+        self.valid = np.zeros(total, dtype=bool)
+        self.valid_count = np.zeros(blocks, dtype=np.int64)
+        self.erase_count = np.zeros(blocks, dtype=np.int64)
+        self.closed = np.zeros(blocks, dtype=bool)
+        self.cold = []         # (erase count, block) heap of closed blocks, stale entries skipped
+        self.max_erase_count = 0
+
+        self.index = ValidCountIndex(pages_per_block, blocks)
+        self.free = [(0, b) for b in range(blocks)]  # (erase count, block) heap
+        self.host_frontier = self._open_block()
+        self.gc_frontier = self._open_block()
+
+        self.now = 0
+        self.gc_latencies = []
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Start measuring from the current state (e.g. after preconditioning)"""
+        self.host_writes = 0
+        self.flash_writes = 0
+        self.relocated_pages = 0
+        self.erases = 0
+        self.wl_migrations = 0
+        self.gc_latencies = []
+        self._erases_checked = 0
+
+    @property
+    def write_amplification(self):
+        """Flash page programs per host page write"""
+        return self.flash_writes / self.host_writes if self.host_writes else 0.0
+
+    def write(self, lpn):
+        """
+        Write one logical page
+
+        Returns:
+            latency: Program time plus any GC or wear-leveling stall (ms)
+        """
+        if not 0 <= lpn < self.logical_pages:
+            raise ValueError(f"Logical page {lpn} outside 0-{self.logical_pages - 1}")
+
+        self.now += 1
+        self._invalidate(lpn)
+
+        stall = 0.0
+        while len(self.free) < self.gc_threshold:
+            stall += self._collect(self._select_victim())
+        if self.wear_leveling and self.erases > self._erases_checked:
+            stall += self._level_wear()
+
+        self.host_frontier = self._program(lpn, self.host_frontier)
+        self.host_writes += 1
+        return self.program_time + stall
+
+    def _open_block(self):
+        """Take the least worn free block"""
+        _, block = heapq.heappop(self.free)
+        return [block, 0]
+
+    def _program(self, lpn, frontier):
+        """Program a page at an open block, returning the (possibly new) frontier"""
+        block, page = frontier
+        ppn = block * self.pages_per_block + page
+        self.l2p[lpn] = ppn
+        self.p2l[ppn] = lpn
+        self.valid[ppn] = True
+        self.valid_count[block] += 1
+        self.flash_writes += 1
+
+        if page + 1 < self.pages_per_block:
+            return [block, page + 1]
+        self._close(block, int(self.valid_count[block]), self.now)
+        return self._open_block()
+
+    def _close(self, block, valid, closed_at):
+        """Index a block that just became full"""
+        self.closed[block] = True
+        self.index.add(block, valid, closed_at)
+        if self.wear_leveling:
+            heapq.heappush(self.cold, (int(self.erase_count[block]), block))
+
+    def _invalidate(self, lpn):
+        """Mark the current copy of a logical page stale"""
+        ppn = int(self.l2p[lpn])
+        if ppn < 0:
+            return
+        block = ppn // self.pages_per_block
+        self.valid[ppn] = False
+        self.p2l[ppn] = -1
+        self.valid_count[block] -= 1
+        if self.closed[block]:
+            self.index.invalidate(block)
+
+    def _select_victim(self):
+        if self.gc_policy == 'greedy':
+            block = self.index.greedy()
+        else:
+            block = self.index.cost_benefit(self.now)
+        if block is None:
+            raise ValueError("No block with invalid pages to collect")
+        return block
+
+    def _collect(self, block):
+        """Relocate the valid pages of a closed block and erase it"""
+        self.index.remove(block)
+        self.closed[block] = False
+
+        start = block * self.pages_per_block
+        end = start + self.pages_per_block
+        pages = np.flatnonzero(self.valid[start:end]) + start
+        lpns = self.p2l[pages].tolist()
+        self.valid[start:end] = False
+        self.p2l[start:end] = -1
+        self.valid_count[block] = 0
+        for lpn in lpns:
+            self.gc_frontier = self._program(lpn, self.gc_frontier)
+
+        self.erase_count[block] += 1
+        erases = int(self.erase_count[block])
+        self.max_erase_count = max(self.max_erase_count, erases)
+        heapq.heappush(self.free, (erases, block))
+
+        latency = len(lpns) * (self.read_time + self.program_time) + self.erase_time
+        self.relocated_pages += len(lpns)
+        self.erases += 1
+        self.gc_latencies.append(latency)
+        return latency
+
+    def _level_wear(self):
+        """Static wear leveling: move data off the least worn closed block"""
+        self._erases_checked = self.erases
+        # A closed block keeps its erase count, so an entry is stale once
+        # its block has been collected (and erased) since it was pushed
+        while self.cold:
+            erases, cold = self.cold[0]
+            if self.closed[cold] and self.erase_count[cold] == erases:
+                break
+            heapq.heappop(self.cold)
+        else:
+            return 0.0
+        if self.max_erase_count - erases <= self.wl_threshold:
+            return 0.0
+        self.wl_migrations += 1
+        return self._collect(cold)
+
+    def precondition(self):
+        """
+        Fill every logical page once, then reset the counters
+
+        On a fresh drive the fill is sequential and never triggers GC
+        (overprovisioning keeps gc_threshold blocks free) or wear leveling
+        (nothing has been erased), so the mapping arrays are set directly
+        instead of writing page by page. The end state is the one write()
+        would reach: pages fill the host block, then free blocks in heap
+        order, and each block is indexed when it fills.
+        """
+        if self.now:
+            for lpn in range(self.logical_pages):
+                self.write(lpn)
+            self.reset_counters()
+            return
+
+        ppb = self.pages_per_block
+        full, rest = divmod(self.logical_pages, ppb)
+        order = [self.host_frontier[0]] + [self._open_block()[0] for _ in range(full)]
+        blocks = np.array(order, dtype=np.int32)
+
+        # Logical page i sits at page i % ppb of the (i // ppb)-th block filled
+        ppns = (blocks[:, None] * ppb + np.arange(ppb, dtype=np.int32)).ravel()[:self.logical_pages]
+        lpns = np.arange(self.logical_pages, dtype=np.int32)
+        self.l2p[:] = ppns
+        self.p2l[ppns] = lpns
+        self.valid[ppns] = True
+        self.valid_count[blocks[:full]] = ppb
+        self.valid_count[blocks[full]] = rest
+        for i, block in enumerate(order[:full]):
+            self._close(block, ppb, (i + 1) * ppb)
+
+        self.host_frontier = [order[full], rest]
+        self.now = self.logical_pages
+        self.reset_counters()
+
+    def erase_stats(self):
+        """Min, max, mean and standard deviation of block erase counts"""
+        counts = self.erase_count
+        return (int(counts.min()), int(counts.max()),
+                float(counts.mean()), float(counts.std()))
+
+def replay(ftl, writes):
+    """
+    Feed a write trace through an FTL
+
+    Args:
+        ftl: FlashTranslationLayer
+        writes: Iterable of logical page numbers
+
+    Returns:
+        latencies: numpy array of per-write latency (ms)
+    """
+    return np.fromiter((ftl.write(lpn) for lpn in writes), dtype=float)
@@ -0,0 +1,96 @@
+# flash_storage/index.py
+import heapq
+
+class ValidCountIndex:
+    """
+    Closed flash blocks bucketed by their number of valid pages
+
+    Bucket v holds the blocks with exactly v valid pages as a heap ordered by
+    the time the block was closed (oldest first). Invalidating a page moves
+    its block one bucket down in O(log n); stale heap entries are skipped
+    lazily. Victim selection only looks at the head of each bucket, so it
+    costs O(pages_per_block) instead of a scan over all blocks.
+
+    Args:
+        pages_per_block: Pages in one erase block (number of buckets - 1)
+        blocks: Total number of blocks
+    """
+
+    def __init__(self, pages_per_block, blocks):
+        self.pages_per_block = pages_per_block
+        self.heaps = [[] for _ in range(pages_per_block + 1)]
+        self.sizes = [0] * (pages_per_block + 1)
+        self.bucket = [-1] * blocks      # block -> bucket, -1 if not indexed
+        self.closed_at = [0.0] * blocks  # block -> close time (heap key)
+
+    def __len__(self):
+        return sum(self.sizes)
+
+    def add(self, block, valid, closed_at):
+        """Index a block that just became full"""
+        self.bucket[block] = valid
+        self.closed_at[block] = closed_at
+        self.sizes[valid] += 1
+        heapq.heappush(self.heaps[valid], (closed_at, block))
+
+    def invalidate(self, block):
+        """A page of an indexed block was invalidated"""
+        valid = self.bucket[block]
+        self.sizes[valid] -= 1
+        self.sizes[valid - 1] += 1
+        self.bucket[block] = valid - 1
+        heapq.heappush(self.heaps[valid - 1], (self.closed_at[block], block))
+        self._compact(valid)
+
+    def remove(self, block):
+        """Stop indexing a block (it is being collected)"""
+        valid = self.bucket[block]
+        self.sizes[valid] -= 1
+        self.bucket[block] = -1
+        self._compact(valid)
+
+    def oldest(self, valid):
+        """Oldest block with exactly `valid` valid pages, or None"""
+        heap = self.heaps[valid]
+        while heap:
+            closed_at, block = heap[0]
+            if self.bucket[block] == valid and self.closed_at[block] == closed_at:
+                return block
+            heapq.heappop(heap)
+        return None
+
+    def greedy(self):
+        """Block with the fewest valid pages (oldest on ties)"""
+        for valid in range(self.pages_per_block):
+            if self.sizes[valid]:
+                return self.oldest(valid)
+        return None
+
+    def cost_benefit(self, now):
+        """
+        Block maximising age * (1 - u) / 2u, u = valid share (Rosenblum & Ousterhout)
+
+        Within a bucket u is fixed, so only the oldest block can win.
+        """
+        best, best_score = None, -1.0
+        for valid in range(self.pages_per_block):
+            if not self.sizes[valid]:
+                continue
+            block = self.oldest(valid)
+            if valid == 0:
+                return block  # nothing to copy
+            u = valid / self.pages_per_block
+            score = (now - self.closed_at[block] + 1) * (1 - u) / (2 * u)
+            if score > best_score:
+                best, best_score = block, score
+        return best
+
+    def _compact(self, valid):
+        """Drop stale entries once they dominate a bucket's heap"""
+        heap = self.heaps[valid]
+        if len(heap) > 2 * self.sizes[valid] + 64:
+            heap[:] = [
+                (closed_at, block) for closed_at, block in heap
+                if self.bucket[block] == valid and self.closed_at[block] == closed_at
+            ]
+            heapq.heapify(heap)
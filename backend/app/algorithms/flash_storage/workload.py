@@ -0,0 +1,34 @@
+# flash_storage/workload.py
+import numpy as np
+
+def generate_writes(count, logical_pages, pattern='uniform', hot_fraction=0.2,
+                    hot_share=0.8, seed=0):
+    """
+    Synthetic host write trace
+
+    Args:
+        count: Number of page writes
+        logical_pages: Size of the logical address space
+        pattern: 'uniform', 'hot-cold' or 'sequential'
+        hot_fraction: Share of the address space that is hot (hot-cold only)
+        hot_share: Share of writes that go to the hot region (hot-cold only)
+        seed: Random seed
+
+    Returns:
+        writes: int64 array of logical page numbers
+    """
+    if pattern == 'sequential':
+        return np.arange(count, dtype=np.int64) % logical_pages
+
+    rng = np.random.default_rng(seed)
+    if pattern == 'uniform':
+        return rng.integers(0, logical_pages, count)
+    if pattern != 'hot-cold':
+        raise ValueError(f"Unknown write pattern: {pattern}")
+
+    hot_pages = max(1, int(logical_pages * hot_fraction))
+    hot = rng.random(count) < hot_share
+    writes = rng.integers(hot_pages, logical_pages, count) if hot_pages < logical_pages \
+        else rng.integers(0, logical_pages, count)
+    writes[hot] = rng.integers(0, hot_pages, int(hot.sum()))
+    return writes
@@ -2,5 +2,10 @@ from .fifo import fifo
 from .lru import lru
 from .optimal import optimal
 from .lfu import lfu
+from .fault_rate import FaultRateWindow
+from .multiprocess import multiprocess_replacement, allocate_frames
+from .compare import compare_policies, next_use_index
 
-__all__ = ['fifo', 'lru', 'optimal', 'lfu']
\ No newline at end of file
+__all__ = ['fifo', 'lru', 'optimal', 'lfu', 'FaultRateWindow',
+           'multiprocess_replacement', 'allocate_frames',
+           'compare_policies', 'next_use_index']
\ No newline at end of file
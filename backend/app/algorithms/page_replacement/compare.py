@@ -0,0 +1,229 @@
+# page_replacement/compare.py
+import heapq
+from collections import OrderedDict, deque
+import numpy as np
+
+POLICIES = ("FIFO", "LRU", "Optimal", "LFU")
+
+def next_use_index(references):
+    """
+    Position of the next reference to the same page, for every reference
+
+    Built once with a stable sort by page instead of rescanning the future
+    on every fault. References with no later use get len(references).
+
+    Args:
+        references: Sequence of page numbers
+
+    Returns:
+        next_use: List of int, next_use[i] > i
+    """
+    refs = np.asarray(references)
+    n = len(refs)
+    order = np.argsort(refs, kind='stable')
+    same = refs[order[1:]] == refs[order[:-1]]
+    next_use = np.full(n, n, dtype=np.int64)
+    next_use[order[:-1][same]] = order[1:][same]
+    return next_use.tolist()
+
+# References each policy consumes before the next one catches up
+CHUNK = 1 << 16
+
+class _FIFOCounter:
+    """FIFO residency, evicts the page loaded first"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.resident = set()
+        self.queue = deque()
+        self.faults = 0
+
+    def feed(self, start, pages):
+        resident, queue, frames = self.resident, self.queue, self.frames
+        faults = 0
+        for page in pages:
+            if page in resident:
+                continue
+            faults += 1
+            if len(resident) == frames:
+                resident.discard(queue.popleft())
+            resident.add(page)
+            queue.append(page)
+        self.faults += faults
+
+class _LRUCounter:
+    """LRU residency, evicts the page used longest ago"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.resident = OrderedDict()
+        self.faults = 0
+
+    def feed(self, start, pages):
+        resident, frames = self.resident, self.frames
+        move_to_end, popitem = resident.move_to_end, resident.popitem
+        faults = 0
+        for page in pages:
+            if page in resident:
+                move_to_end(page)
+                continue
+            faults += 1
+            if len(resident) == frames:
+                popitem(last=False)
+            resident[page] = None
+        self.faults += faults
+
+class _HeapCounter:
+    """
+    Frame slots plus a lazily invalidated victim heap
+
+    Heap entries are plain ints that encode a policy key and the frame
+    slot (key * frames + slot order), so comparisons are integer ones.
+    `key[slot]` is the current entry of each occupied slot; other entries
+    are stale and dropped when they surface. The heap is rebuilt from the
+    current entries when stale ones start to dominate.
+    """
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.slots = {}            # page -> frame slot
+        self.pages = [None] * frames
+        self.key = [None] * frames
+        self.heap = []
+        self.faults = 0
+
+    def _rebuild(self):
+        self.heap = [k for k in self.key if k is not None]
+        heapq.heapify(self.heap)
+
+class _LFUCounter(_HeapCounter):
+    """
+    LFU residency, evicts the least used page since it was loaded
+
+    Ties go to the page in the highest frame slot, as in lfu(). A hit
+    only bumps the slot's count: counts never drop while a page stays
+    resident, so a surfacing entry below its slot's current key is
+    pushed back with the current one (a lazy increase-key), and the
+    first entry that matches is the true minimum.
+    """
+
+    def __init__(self, frames):
+        super().__init__(frames)
+        self.counts = [0] * frames
+
+    def feed(self, start, pages):
+        frames, slots, owner, key, counts = (
+            self.frames, self.slots, self.pages, self.key, self.counts
+        )
+        heap = self.heap
+        top = frames - 1
+        faults = 0
+        for page in pages:
+            slot = slots.get(page)
+            if slot is not None:
+                counts[slot] += 1
+                continue
+            faults += 1
+            if len(slots) < frames:
+                slot = len(slots)
+            else:
+                while True:
+                    entry = heapq.heappop(heap)
+                    slot = top - entry % frames
+                    current = counts[slot] * frames + top - slot
+                    if entry == current:
+                        break
+                    if entry < current:
+                        heapq.heappush(heap, current)
+                del slots[owner[slot]]
+            slots[page] = slot
+            owner[slot] = page
+            counts[slot] = 1
+            key[slot] = frames + top - slot
+            heapq.heappush(heap, key[slot])
+            if len(heap) > 4 * frames + 64:
+                for s in range(len(slots)):
+                    key[s] = counts[s] * frames + top - s
+                self._rebuild()
+                heap = self.heap
+        self.heap = heap
+        self.faults += faults
+
+class _OptimalCounter(_HeapCounter):
+    """
+    Belady residency, evicts the page needed furthest in the future
+
+    Next uses come from a shared next_use_index. Pages never used again
+    tie at infinity and the lowest frame slot goes first, as in optimal().
+    """
+
+    def __init__(self, frames, next_use):
+        super().__init__(frames)
+        self.next_use = next_use
+
+    def feed(self, start, pages):
+        frames, slots, owner, key = self.frames, self.slots, self.pages, self.key
+        heap = self.heap
+        next_use = self.next_use
+        faults = 0
+        for i, page in enumerate(pages, start):
+            slot = slots.get(page)
+            if slot is None:
+                faults += 1
+                if len(slots) < frames:
+                    slot = len(slots)
+                else:
+                    while True:
+                        entry = heapq.heappop(heap)
+                        slot = entry % frames
+                        if key[slot] == entry:
+                            break
+                    del slots[owner[slot]]
+                slots[page] = slot
+                owner[slot] = page
+            key[slot] = -next_use[i] * frames + slot
+            heapq.heappush(heap, key[slot])
+            if len(heap) > 4 * frames + 64:
+                self._rebuild()
+                heap = self.heap
+        self.heap = heap
+        self.faults += faults
+
+def compare_policies(references, frames, policies=POLICIES):
+    """
+    Count page faults for several policies in one pass over the references
+
+    All policies advance in lockstep, a chunk of CHUNK references at a
+    time, and keep only their resident set and a fault counter, so memory
+    stays O(frames) per policy instead of one full trace each. Optimal's
+    next-use index is built once up front. Fault counts match fifo(),
+    lru(), lfu() and optimal().
+
+    Args:
+        references: Sequence of page numbers
+        frames: Number of frames available to every policy
+        policies: Policy names from POLICIES
+
+    Returns:
+        faults: Dict of policy -> page faults
+    """
+    counters = {}
+    for policy in policies:
+        if policy == "FIFO":
+            counters[policy] = _FIFOCounter(frames)
+        elif policy == "LRU":
+            counters[policy] = _LRUCounter(frames)
+        elif policy == "LFU":
+            counters[policy] = _LFUCounter(frames)
+        elif policy == "Optimal":
+            counters[policy] = _OptimalCounter(frames, next_use_index(references))
+        else:
+            raise ValueError(f"Unknown policy: {policy}")
+
+    references = list(references)
+    for start in range(0, len(references), CHUNK):
+        chunk = references[start:start + CHUNK]
+        for counter in counters.values():
+            counter.feed(start, chunk)
+
+    return {policy: counter.faults for policy, counter in counters.items()}
@@ -0,0 +1,38 @@
+# page_replacement/fault_rate.py
+
+class FaultRateWindow:
+    """
+    Sliding-window page fault rate, updated as the simulation runs.
+
+    The last `window` outcomes are kept in a fixed-size ring buffer together
+    with a running fault counter, so each reference costs O(1) regardless of
+    the window size or the length of the reference string.
+
+    Args:
+        window: Number of most recent references the rate is computed over
+    """
+
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("Fault rate window must be at least 1")
+        self.window = window
+        self.series = []
+        self._ring = [0] * window
+        self._pos = 0
+        self._filled = 0
+        self._faults = 0
+
+    def record(self, fault):
+        """Record one reference outcome and append the current rate (%)"""
+        value = 1 if fault else 0
+        self._faults += value - self._ring[self._pos]
+        self._ring[self._pos] = value
+        self._pos = (self._pos + 1) % self.window
+        if self._filled < self.window:
+            self._filled += 1
+        self.series.append(self._faults / self._filled * 100)
+
+    @property
+    def current_rate(self):
+        """Fault rate (%) over the references currently in the window"""
+        return self._faults / self._filled * 100 if self._filled else 0.0
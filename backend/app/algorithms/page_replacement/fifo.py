@@ -1,13 +1,14 @@
 # page_replacement/fifo.py
 from collections import deque
 
-def fifo(references, frames):
+def fifo(references, frames, fault_window=None):
     """
     FIFO (First In First Out) Page Replacement Algorithm
     
     Args:
         references: List of page numbers
         frames: Number of frames available
+        fault_window: Optional FaultRateWindow updated after every reference
     
     Returns:
         trace_data: List of (page, frames_state, status) tuples
@@ -22,11 +23,15 @@ def fifo(references, frames):
         # Check if page is already in memory (HIT)
         if page in memory:
             status = "HIT"
+            if fault_window is not None:
+                fault_window.record(False)
             trace_data.append((page, memory.copy() + [-1] * (frames - len(memory)), status))
         else:
             # Page fault
             page_faults += 1
             status = "FAULT"
+            if fault_window is not None:
+                fault_window.record(True)
             
             if len(memory) < frames:
                 # Frame available
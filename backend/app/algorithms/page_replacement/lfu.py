@@ -1,12 +1,13 @@
 # page_replacement/lfu.py
 
-def lfu(references, frames):
+def lfu(references, frames, fault_window=None):
     """
     LFU (Least Frequently Used) Page Replacement Algorithm
     
     Args:
         references: List of page numbers
         frames: Number of frames available
+        fault_window: Optional FaultRateWindow updated after every reference
     
     Returns:
         trace_data: List of (page, frames_state, status) tuples
@@ -21,12 +22,16 @@ def lfu(references, frames):
         # Check if page is already in memory (HIT)
         if page in memory:
             status = "HIT"
+            if fault_window is not None:
+                fault_window.record(False)
             frequency[page] = frequency.get(page, 0) + 1
             trace_data.append((page, memory.copy() + [-1] * (frames - len(memory)), status))
         else:
             # Page fault
             page_faults += 1
             status = "FAULT"
+            if fault_window is not None:
+                fault_window.record(True)
             
             if len(memory) < frames:
                 # Frame available
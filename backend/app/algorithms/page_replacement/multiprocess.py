@@ -0,0 +1,132 @@
+# page_replacement/multiprocess.py
+from collections import OrderedDict
+
+def allocate_frames(processes, frames, allocation='proportional'):
+    """
+    Split a frame pool between processes
+
+    Args:
+        processes: Dict of pid -> (size, priority)
+        frames: Total number of frames in the shared pool
+        allocation: 'proportional' (by process size) or 'priority'
+                    (by priority weight, lower number = higher priority)
+
+    Returns:
+        quotas: Dict of pid -> number of frames (at least 1 each)
+    """
+    pids = list(processes)
+    if frames < len(pids):
+        raise ValueError(
+            f"{frames} frames cannot be split between {len(pids)} processes"
+        )
+
+    if allocation == 'priority':
+        lowest = max(priority for _, priority in processes.values())
+        weights = {pid: lowest - processes[pid][1] + 1 for pid in pids}
+    else:
+        weights = {pid: processes[pid][0] for pid in pids}
+
+    # Every process gets one frame, the rest is shared by largest remainder
+    spare = frames - len(pids)
+    total_weight = sum(weights.values())
+    quotas = {}
+    remainders = []
+    for pid in pids:
+        share = spare * weights[pid] / total_weight
+        quotas[pid] = 1 + int(share)
+        remainders.append((share - int(share), pid))
+
+    leftover = frames - sum(quotas.values())
+    remainders.sort(key=lambda r: -r[0])
+    for _, pid in remainders[:leftover]:
+        quotas[pid] += 1
+
+    return quotas
+
+def multiprocess_replacement(references, frames, policy='LRU', scope='global',
+                             allocation='proportional', processes=None):
+    """
+    Multi-process page replacement over a shared frame pool
+
+    Residency is tracked in hash-indexed ordered maps, so every reference
+    (hit, fault or eviction) costs O(1) regardless of how many processes
+    or frames take part.
+
+    Args:
+        references: List of (pid, page) tuples in interleaved order
+        frames: Number of frames in the shared pool
+        policy: 'FIFO' or 'LRU'
+        scope: 'global' (victim from any process) or 'local'
+               (victim from the faulting process's own allocation)
+        allocation: 'proportional' or 'priority', used to size local allocations
+        processes: Optional dict of pid -> (size, priority). A size of None,
+                   or a missing process, defaults to the number of distinct
+                   pages referenced; missing processes get priority 0
+
+    Returns:
+        process_stats: Dict of pid -> {'references', 'faults', 'frames'}
+        page_faults: Total number of page faults
+    """
+    processes = dict(processes or {})
+    distinct = {}
+    for pid, page in references:
+        distinct.setdefault(pid, set()).add(page)
+    for pid, pages in distinct.items():
+        processes.setdefault(pid, (len(pages), 0))
+    for pid, (size, priority) in processes.items():
+        if size is None:
+            processes[pid] = (max(len(distinct.get(pid, ())), 1), priority)
+
+    process_stats = {
+        pid: {'references': 0, 'faults': 0, 'frames': 0}
+        for pid in processes
+    }
+    page_faults = 0
+    touch = policy == 'LRU'
+
+    if scope == 'local':
+        quotas = allocate_frames(processes, frames, allocation)
+        resident = {pid: OrderedDict() for pid in processes}
+
+        for pid, page in references:
+            stats = process_stats[pid]
+            stats['references'] += 1
+            memory = resident[pid]
+            if page in memory:
+                if touch:
+                    memory.move_to_end(page)
+                continue
+
+            page_faults += 1
+            stats['faults'] += 1
+            if len(memory) >= quotas[pid]:
+                memory.popitem(last=False)
+            memory[page] = None
+
+        for pid, quota in quotas.items():
+            process_stats[pid]['frames'] = quota
+    else:
+        memory = OrderedDict()  # (pid, page) -> None, oldest/LRU first
+        held = dict.fromkeys(processes, 0)
+
+        for pid, page in references:
+            stats = process_stats[pid]
+            stats['references'] += 1
+            key = (pid, page)
+            if key in memory:
+                if touch:
+                    memory.move_to_end(key)
+                continue
+
+            page_faults += 1
+            stats['faults'] += 1
+            if len(memory) >= frames:
+                (victim_pid, _), _ = memory.popitem(last=False)
+                held[victim_pid] -= 1
+            memory[key] = None
+            held[pid] += 1
+
+        for pid, count in held.items():
+            process_stats[pid]['frames'] = count
+
+    return process_stats, page_faults
@@ -1,6 +1,6 @@
 # page_replacement/optimal.py
 
-def optimal(references, frames):
+def optimal(references, frames, fault_window=None):
     """
     Optimal Page Replacement Algorithm (Belady's Algorithm)
     Replaces the page that will not be used for the longest time
@@ -8,6 +8,7 @@ def optimal(references, frames):
     Args:
         references: List of page numbers
         frames: Number of frames available
+        fault_window: Optional FaultRateWindow updated after every reference
     
     Returns:
         trace_data: List of (page, frames_state, status) tuples
@@ -21,11 +22,15 @@ def optimal(references, frames):
         # Check if page is already in memory (HIT)
         if page in memory:
             status = "HIT"
+            if fault_window is not None:
+                fault_window.record(False)
             trace_data.append((page, memory.copy() + [-1] * (frames - len(memory)), status))
         else:
             # Page fault
             page_faults += 1
             status = "FAULT"
+            if fault_window is not None:
+                fault_window.record(True)
             
             if len(memory) < frames:
                 # Frame available
@@ -1,4 +1,5 @@
-from typing import List
+import os
+from typing import List, Optional
 
 class Settings:
     """Simple settings without pydantic-settings"""
@@ -18,6 +19,22 @@ class Settings:
     # API Configuration
     api_prefix: str = "/api"
     debug: bool = False
+    
+    # Simulation executor (simulations and charts run off the event loop)
+    executor_kind: str = os.getenv("SIMULATOR_EXECUTOR", "thread")  # thread | process
+    executor_workers: int = int(os.getenv("SIMULATOR_WORKERS", os.cpu_count() or 4))
+    executor_queue_limit: int = int(os.getenv("SIMULATOR_QUEUE_LIMIT", 32))
+    batch_workers: int = int(os.getenv("SIMULATOR_BATCH_WORKERS", os.cpu_count() or 4))
+    
+    # Result cache (identical requests are served without re-simulating)
+    cache_enabled: bool = os.getenv("SIMULATOR_CACHE", "1") not in ("0", "false", "no")
+    cache_max_bytes: int = int(os.getenv("SIMULATOR_CACHE_BYTES", 64 * 1024 * 1024))
+    cache_ttl: int = int(os.getenv("SIMULATOR_CACHE_TTL", 3600))  # seconds, 0 = never expire
+    cache_path: Optional[str] = os.getenv("SIMULATOR_CACHE_PATH")  # SQLite file for a persistent tier
+    cache_disk_max_bytes: int = int(os.getenv("SIMULATOR_CACHE_DISK_BYTES", 256 * 1024 * 1024))
+    chart_max_elements: int = int(os.getenv("SIMULATOR_CHART_MAX_ELEMENTS", 2000))  # decimate charts above this
+    chart_dpi: int = int(os.getenv("SIMULATOR_CHART_DPI", 100))  # resolution of charts embedded in JSON
+    http_max_age: int = int(os.getenv("SIMULATOR_HTTP_MAX_AGE", 3600))  # Cache-Control max-age of chart images, seconds
 
 def get_settings() -> Settings:
     """Get settings instance"""
@@ -4,9 +4,11 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from contextlib import asynccontextmanager  # ✅ Add this
-from app.routers import cpu, page, disk
+from app.routers import cpu, page, disk, flash, batch, charts
 from app.config import get_settings
-from app.models.responses import ErrorResponse, HealthResponse
+from app.models.responses import ErrorResponse, HealthResponse, CacheStatsResponse
+from app.utils.executor import get_executor, shutdown_executor
+from app.utils.cache import get_cache, shutdown_cache, coalesced_requests
 import time
 
 settings = get_settings()
@@ -18,9 +20,13 @@ async def lifespan(app: FastAPI):
     print(f"🚀 {settings.app_name} v{settings.app_version} starting...")
     print(f"📚 Documentation available at: /docs")
     print(f"🏥 Health check at: /health")
+    executor = get_executor()
+    print(f"⚙️  Simulation executor: {executor.workers} {executor.kind} workers")
     yield
     # Shutdown
     print(f"👋 {settings.app_name} shutting down...")
+    shutdown_executor()
+    shutdown_cache()
 
 # Initialize FastAPI app with lifespan
 app = FastAPI(
@@ -119,6 +125,21 @@ app.include_router(
     prefix=f"{settings.api_prefix}/simulate/disk",
     tags=["Disk Scheduling"]
 )
+app.include_router(
+    flash.router,
+    prefix=f"{settings.api_prefix}/simulate/flash",
+    tags=["Flash Storage"]
+)
+app.include_router(
+    batch.router,
+    prefix=f"{settings.api_prefix}/simulate/batch",
+    tags=["Batch"]
+)
+app.include_router(
+    charts.router,
+    prefix=f"{settings.api_prefix}/charts",
+    tags=["Charts"]
+)
 
 # Root endpoint
 @app.get("/", include_in_schema=False)
@@ -146,6 +167,21 @@ async def health_check():
         algorithms={
             "cpu": ["FCFS", "SJF", "SRTF", "Priority", "RoundRobin"],
             "page": ["FIFO", "LRU", "Optimal", "LFU"],
-            "disk": ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"]
+            "disk": ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK", "SPTF"],
+            "flash": ["greedy", "cost-benefit"]
         }
     )
+
+# Result cache statistics
+@app.get(
+    "/cache/stats",
+    response_model=CacheStatsResponse,
+    tags=["System"],
+    summary="Result Cache Statistics"
+)
+async def cache_stats():
+    """Hit/miss counters and memory use of the result cache, plus coalesced requests"""
+    cache = get_cache()
+    if cache is None:
+        return CacheStatsResponse(enabled=False, coalesced=coalesced_requests())
+    return CacheStatsResponse(enabled=True, coalesced=coalesced_requests(), **cache.stats())
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
-from typing import List, Optional, Literal
+from typing import List, Optional, Literal, Tuple, Union, Annotated
 
 # ============= CPU Scheduling Models =============
 
@@ -29,6 +29,10 @@ class CPUSchedulingRequest(BaseModel):
     algorithm: Literal["FCFS", "SJF", "SRTF", "Priority", "RoundRobin"]
     processes: List[ProcessInput] = Field(..., min_length=1, max_length=20)
     time_quantum: Optional[int] = Field(None, ge=1, le=10)
+    include_chart: bool = Field(
+        False,
+        description="Embed a Gantt chart PNG (otherwise fetch it from /charts/{result_id}; always embedded with the cache off)"
+    )
     
     @model_validator(mode='after')
     def validate_round_robin(self):  # ✅ self, not cls
@@ -38,6 +42,31 @@ class CPUSchedulingRequest(BaseModel):
         return self
 
 
+class CPUCompareRequest(BaseModel):
+    """Request for comparing CPU scheduling algorithms on one process set"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "processes": [
+                    {"pid": 1, "arrival": 0, "burst": 5, "priority": 1},
+                    {"pid": 2, "arrival": 1, "burst": 3, "priority": 0},
+                    {"pid": 3, "arrival": 2, "burst": 8, "priority": 2}
+                ],
+                "algorithms": ["FCFS", "SJF", "SRTF", "Priority", "RoundRobin"],
+                "time_quantum": 2
+            }
+        }
+    )
+
+    processes: List[ProcessInput] = Field(..., min_length=1, max_length=20)
+    algorithms: List[Literal["FCFS", "SJF", "SRTF", "Priority", "RoundRobin"]] = Field(
+        default=["FCFS", "SJF", "SRTF", "Priority", "RoundRobin"],
+        min_length=1,
+        description="Algorithms to compare (default: all)"
+    )
+    time_quantum: int = Field(2, ge=1, le=10, description="Quantum used for RoundRobin")
+
+
 # ============= Page Replacement Models =============
 
 class PageReplacementRequest(BaseModel):
@@ -60,6 +89,16 @@ class PageReplacementRequest(BaseModel):
         description="Page reference string"
     )
     frame_count: int = Field(..., ge=1, le=10, description="Number of frames")
+    fault_rate_window: Optional[int] = Field(
+        None,
+        ge=1,
+        le=100,
+        description="Window size (references) for the fault-rate timeline"
+    )
+    include_chart: bool = Field(
+        False,
+        description="Embed a chart PNG (otherwise fetch it from /charts/{result_id}; always embedded with the cache off)"
+    )
     
     @field_validator('page_sequence')
     @classmethod
@@ -69,8 +108,131 @@ class PageReplacementRequest(BaseModel):
         return v
 
 
+class PageCompareRequest(BaseModel):
+    """Request for comparing page replacement policies on one reference string"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "algorithms": ["FIFO", "LRU", "Optimal", "LFU"],
+                "page_sequence": [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2],
+                "frame_count": 3
+            }
+        }
+    )
+    
+    algorithms: List[Literal["FIFO", "LRU", "Optimal", "LFU"]] = Field(
+        default=["FIFO", "LRU", "Optimal", "LFU"],
+        min_length=1,
+        description="Policies to compare (default: all)"
+    )
+    page_sequence: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=1_000_000,
+        description="Page reference string"
+    )
+    frame_count: int = Field(..., ge=1, le=65536, description="Number of frames")
+    
+    @field_validator('page_sequence')
+    @classmethod
+    def validate_pages(cls, v):
+        if any(p < 0 for p in v):
+            raise ValueError("Page numbers must be non-negative")
+        return v
+
+class MemoryProcessInput(BaseModel):
+    """Process sharing the frame pool"""
+    pid: int = Field(..., ge=1, description="Process ID")
+    size: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Process size in pages (defaults to distinct pages referenced)"
+    )
+    priority: int = Field(0, ge=0, description="Priority (0=highest)")
+
+
+class MultiProcessMemoryRequest(BaseModel):
+    """Request for multi-process page replacement over a shared frame pool"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "policy": "LRU",
+                "scope": "local",
+                "allocation": "proportional",
+                "frame_count": 6,
+                "references": [[1, 0], [2, 7], [1, 1], [2, 7], [1, 2], [2, 3], [1, 0]],
+                "processes": [
+                    {"pid": 1, "size": 10, "priority": 0},
+                    {"pid": 2, "size": 5, "priority": 1}
+                ]
+            }
+        }
+    )
+    
+    policy: Literal["FIFO", "LRU"] = "LRU"
+    scope: Literal["global", "local"] = Field(
+        "global",
+        description="Replace from any process (global) or only the faulting one (local)"
+    )
+    allocation: Literal["proportional", "priority"] = Field(
+        "proportional",
+        description="How local frame allocations are sized"
+    )
+    references: List[Tuple[int, int]] = Field(
+        ...,
+        min_length=1,
+        description="Interleaved (pid, page) references"
+    )
+    frame_count: int = Field(..., ge=1, description="Frames in the shared pool")
+    processes: Optional[List[MemoryProcessInput]] = Field(None, max_length=1000)
+    
+    @model_validator(mode='after')
+    def validate_references(self):
+        """Validate pids and page numbers"""
+        if any(pid < 1 or page < 0 for pid, page in self.references):
+            raise ValueError("References need pid >= 1 and non-negative pages")
+        
+        if self.processes is not None:
+            pids = {p.pid for p in self.processes}
+            if len(pids) != len(self.processes):
+                raise ValueError("Process IDs must be unique")
+            unknown = {pid for pid, _ in self.references} - pids
+            if unknown:
+                raise ValueError(f"References to undeclared processes: {sorted(unknown)}")
+        
+        return self
+
+
 # ============= Disk Scheduling Models =============
 
+class DriveModelInput(BaseModel):
+    """Physical drive timing parameters"""
+    settle_time: float = Field(1.0, ge=0, description="Head settle time (ms)")
+    sqrt_coeff: float = Field(0.4, ge=0, description="Short-seek cost (ms per sqrt cylinder)")
+    linear_coeff: float = Field(0.02, ge=0, description="Long-seek cost (ms per cylinder)")
+    regime_boundary: int = Field(100, ge=1, description="Seek distance where the linear regime starts")
+    rpm: int = Field(7200, ge=1000, le=20000, description="Spindle speed")
+    transfer_rate: float = Field(150.0, gt=0, description="Media transfer rate (MB/s)")
+    request_size: int = Field(4096, ge=512, description="Bytes transferred per request")
+    sectors_per_track: int = Field(64, ge=1, description="Angular positions per track")
+
+
+class BlockRequestInput(BaseModel):
+    """Block I/O request with a size"""
+    sector: int = Field(..., ge=0, description="Start sector")
+    length: int = Field(1, ge=1, description="Length in sectors")
+
+
+# Size limits per response mode: full responses carry a per-step trace (and
+# often a chart), compact ones only the order and packed seeks
+DISK_LIMITS = {
+    "full": {"requests": 50, "cylinders": 500},
+    "compact": {"requests": 1_000_000, "cylinders": 65536}
+}
+# SPTF also times an SSTF order for comparison, so it gets a smaller queue
+COMPACT_SPTF_REQUESTS = 100_000
+
+
 class DiskSchedulingRequest(BaseModel):
     """Request for disk scheduling simulation"""
     model_config = ConfigDict(
@@ -85,29 +247,422 @@ class DiskSchedulingRequest(BaseModel):
         }
     )
     
-    algorithm: Literal["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"]
-    request_queue: List[int] = Field(
-        ..., 
+    algorithm: Literal["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK", "SPTF"]
+    request_queue: Optional[List[int]] = Field(
+        None, 
         min_length=1, 
-        max_length=50,
-        description="Disk request queue (cylinder numbers)"
+        max_length=DISK_LIMITS["compact"]["requests"],
+        description="Disk request queue (cylinder numbers; up to 50, or 1,000,000 in compact mode)"
+    )
+    block_requests: Optional[List[BlockRequestInput]] = Field(
+        None,
+        min_length=1,
+        max_length=DISK_LIMITS["compact"]["requests"],
+        description="Sized requests (start sector, length); used instead of request_queue"
+    )
+    sectors_per_cylinder: int = Field(1, ge=1, description="Maps block sectors to cylinders")
+    merge: bool = Field(
+        False,
+        description="Merge contiguous/overlapping block requests before scheduling"
+    )
+    response_mode: Literal["full", "compact"] = Field(
+        "full",
+        description="compact: service order, packed seeks and summary only (no trace or chart)"
+    )
+    include_chart: bool = Field(
+        False,
+        description="Embed a chart PNG in full mode (otherwise fetch it from /charts/{result_id}; always embedded with the cache off)"
     )
     initial_head: int = Field(..., ge=0, description="Initial head position")
-    disk_size: int = Field(200, ge=50, le=500, description="Total disk cylinders")
+    disk_size: int = Field(
+        200,
+        ge=50,
+        le=DISK_LIMITS["compact"]["cylinders"],
+        description="Total disk cylinders (up to 500, or 65536 in compact mode)"
+    )
     direction: Optional[Literal["left", "right"]] = Field(
         "right", 
         description="Initial direction (for SCAN/C-SCAN/LOOK/C-LOOK)"
     )
+    drive: Optional[DriveModelInput] = Field(
+        None,
+        description="Drive timing model; enables millisecond service time estimates"
+    )
+    request_sectors: Optional[List[int]] = Field(
+        None,
+        description="Sector (angular position) of each request, used by SPTF"
+    )
+    
+    @property
+    def cylinders(self) -> List[int]:
+        """Cylinder queue, as given or derived from the block requests"""
+        if self.block_requests is not None:
+            return [b.sector // self.sectors_per_cylinder for b in self.block_requests]
+        return self.request_queue
     
     @model_validator(mode='after')
     def validate_disk_constraints(self):  # ✅ self, not cls
         """Validate disk scheduling constraints"""
+        limits = DISK_LIMITS[self.response_mode]
+        queue = self.block_requests if self.block_requests is not None else self.request_queue
+        requests = len(queue or ())
+        if requests > limits["requests"]:
+            raise ValueError(
+                f"{self.response_mode} mode allows at most {limits['requests']} requests "
+                f"(compact mode allows {DISK_LIMITS['compact']['requests']})"
+            )
+        if self.disk_size > limits["cylinders"]:
+            raise ValueError(f"{self.response_mode} mode allows at most {limits['cylinders']} cylinders")
+        if self.algorithm == "SPTF" and requests > COMPACT_SPTF_REQUESTS:
+            raise ValueError(f"SPTF allows at most {COMPACT_SPTF_REQUESTS} requests")
+        
+        if self.block_requests is not None:
+            if self.request_queue is not None:
+                raise ValueError("Give either request_queue or block_requests, not both")
+            spc = self.sectors_per_cylinder
+            if any((b.sector + b.length - 1) // spc >= self.disk_size for b in self.block_requests):
+                raise ValueError(f"Block requests must end before sector {self.disk_size * spc}")
+        elif self.request_queue is None:
+            raise ValueError("request_queue or block_requests is required")
+        
+        if self.merge:
+            if self.block_requests is None:
+                raise ValueError("merge requires block_requests")
+            if self.request_sectors is not None:
+                raise ValueError("request_sectors cannot be combined with merge")
+        
         # Validate request queue
-        if any(r < 0 or r >= self.disk_size for r in self.request_queue):
+        if any(r < 0 or r >= self.disk_size for r in self.cylinders):
             raise ValueError(f"Requests must be within 0-{self.disk_size-1}")
         
         # Validate initial head
         if self.initial_head >= self.disk_size:
             raise ValueError(f"Initial head must be < {self.disk_size}")
         
-        return self
\ No newline at end of file
+        # Validate sectors
+        if self.request_sectors is not None:
+            if len(self.request_sectors) != len(self.cylinders):
+                raise ValueError("request_sectors must match request_queue length")
+            sectors_per_track = (self.drive or DriveModelInput()).sectors_per_track
+            if any(s < 0 or s >= sectors_per_track for s in self.request_sectors):
+                raise ValueError(f"Sectors must be within 0-{sectors_per_track-1}")
+        
+        return self
+
+
+class DiskCompareRequest(BaseModel):
+    """Request for comparing disk scheduling algorithms on one queue"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "request_queue": [98, 183, 37, 122, 14, 124, 65, 67],
+                "initial_head": 53,
+                "disk_size": 200,
+                "direction": "right"
+            }
+        }
+    )
+    
+    algorithms: List[Literal["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"]] = Field(
+        default=["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"],
+        min_length=1,
+        description="Algorithms to compare (default: all seek-based algorithms)"
+    )
+    request_queue: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=1_000_000,
+        description="Disk request queue (cylinder numbers)"
+    )
+    initial_head: int = Field(..., ge=0, description="Initial head position")
+    disk_size: int = Field(200, ge=50, le=500, description="Total disk cylinders")
+    direction: Literal["left", "right"] = Field(
+        "right",
+        description="Initial direction (for SCAN/C-SCAN/LOOK/C-LOOK)"
+    )
+    include_charts: bool = Field(False, description="Render a chart per algorithm")
+    
+    @model_validator(mode='after')
+    def validate_disk_constraints(self):
+        """Validate requests and head against the disk size"""
+        if min(self.request_queue) < 0 or max(self.request_queue) >= self.disk_size:
+            raise ValueError(f"Requests must be within 0-{self.disk_size-1}")
+        if self.initial_head >= self.disk_size:
+            raise ValueError(f"Initial head must be < {self.disk_size}")
+        return self
+
+class TimedDiskRequestInput(BaseModel):
+    """Disk request with an arrival time"""
+    arrival: float = Field(..., ge=0, description="Arrival time")
+    cylinder: int = Field(..., ge=0, description="Requested cylinder")
+
+
+class DynamicDiskSchedulingRequest(BaseModel):
+    """Request for disk scheduling with arrival times"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "algorithm": "LOOK",
+                "requests": [
+                    {"arrival": 0, "cylinder": 98},
+                    {"arrival": 0, "cylinder": 183},
+                    {"arrival": 10, "cylinder": 37},
+                    {"arrival": 25, "cylinder": 122},
+                    {"arrival": 40, "cylinder": 14}
+                ],
+                "initial_head": 53,
+                "disk_size": 200,
+                "direction": "right",
+                "seek_time": 1.0,
+                "service_time": 2.0
+            }
+        }
+    )
+    
+    algorithm: Literal[
+        "FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK",
+        "Deadline", "N-Step-SCAN", "FSCAN"
+    ]
+    requests: List[TimedDiskRequestInput] = Field(..., min_length=1, max_length=1_000_000)
+    initial_head: int = Field(..., ge=0, description="Initial head position")
+    disk_size: int = Field(200, ge=50, description="Total disk cylinders")
+    direction: Literal["left", "right"] = Field(
+        "right",
+        description="Initial direction (for SCAN/C-SCAN/LOOK/C-LOOK/N-Step-SCAN/FSCAN)"
+    )
+    seek_time: float = Field(1.0, gt=0, description="Time to move one cylinder")
+    service_time: float = Field(0.0, ge=0, description="Transfer time per request")
+    starvation_threshold: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Response time counted as starvation (default: 4x mean response time)"
+    )
+    deadline: float = Field(100.0, gt=0, description="Expiry time for the Deadline scheduler")
+    fifo_batch: int = Field(16, ge=1, description="Deadline dispatches between expiry checks")
+    batch_size: int = Field(8, ge=1, description="Requests per N-Step-SCAN batch")
+    
+    @model_validator(mode='after')
+    def validate_disk_constraints(self):
+        """Validate cylinders against disk size"""
+        if any(r.cylinder >= self.disk_size for r in self.requests):
+            raise ValueError(f"Requests must be within 0-{self.disk_size-1}")
+        
+        if self.initial_head >= self.disk_size:
+            raise ValueError(f"Initial head must be < {self.disk_size}")
+        
+        return self
+
+
+class TraceReplayRequest(BaseModel):
+    """Options for replaying a block I/O trace (sent as query parameters)"""
+    format: Literal["csv", "blkparse", "binary"] = Field(
+        "csv",
+        description="csv (timestamp,lba,size,rw), blkparse text, or packed binary records"
+    )
+    algorithm: Literal["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"] = Field("LOOK")
+    initial_head: int = Field(0, ge=0, description="Initial head position")
+    cylinders: int = Field(65536, ge=1, le=10_000_000, description="Total disk cylinders")
+    sectors_per_cylinder: int = Field(2048, ge=1, description="Sectors mapped to one cylinder")
+    window: int = Field(256, ge=1, le=65536, description="Requests scheduled together (queue depth)")
+    direction: Literal["left", "right"] = Field("right", description="Initial sweep direction")
+    
+    @model_validator(mode='after')
+    def validate_head(self):
+        """Validate head against disk size"""
+        if self.initial_head >= self.cylinders:
+            raise ValueError(f"Initial head must be < {self.cylinders}")
+        return self
+
+
+class ArrayRequestInput(BaseModel):
+    """Logical request sent to a disk array"""
+    arrival: float = Field(..., ge=0, description="Arrival time (ms)")
+    block: int = Field(..., ge=0, description="Logical block")
+    write: bool = Field(False, description="Write request")
+
+
+class ArrayWorkloadInput(BaseModel):
+    """Synthetic workload for large array simulations"""
+    count: int = Field(..., ge=1, le=1_000_000, description="Number of logical requests")
+    arrival_rate: float = Field(1.0, gt=0, description="Mean requests per ms")
+    write_fraction: float = Field(0.3, ge=0, le=1, description="Share of writes")
+    seed: int = Field(0, ge=0, description="Random seed")
+
+
+class DiskArrayRequest(BaseModel):
+    """Request for RAID disk array simulation"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "level": "RAID5",
+                "disks": 4,
+                "algorithm": "LOOK",
+                "workload": {"count": 10000, "arrival_rate": 0.5, "write_fraction": 0.3},
+                "stripe_unit": 8,
+                "blocks_per_cylinder": 64,
+                "disk_size": 200
+            }
+        }
+    )
+    
+    level: Literal["RAID0", "RAID1", "RAID5", "RAID10"]
+    disks: int = Field(4, ge=1, le=64, description="Number of disks")
+    algorithm: Literal["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"] = Field(
+        "FCFS",
+        description="Scheduler run independently on every disk"
+    )
+    requests: Optional[List[ArrayRequestInput]] = Field(
+        None,
+        min_length=1,
+        max_length=10000,
+        description="Explicit logical requests"
+    )
+    workload: Optional[ArrayWorkloadInput] = Field(
+        None,
+        description="Generated workload (used instead of requests)"
+    )
+    stripe_unit: int = Field(8, ge=1, description="Blocks per stripe unit")
+    blocks_per_cylinder: int = Field(64, ge=1, description="Blocks per cylinder on each disk")
+    disk_size: int = Field(200, ge=50, le=500, description="Cylinders per disk")
+    initial_head: int = Field(0, ge=0, description="Initial head position of every disk")
+    direction: Literal["left", "right"] = Field("right", description="Initial sweep direction")
+    drive: Optional[DriveModelInput] = Field(None, description="Drive timing (defaults apply)")
+    
+    @model_validator(mode='after')
+    def validate_array(self):
+        """Validate layout and workload"""
+        if (self.requests is None) == (self.workload is None):
+            raise ValueError("Give exactly one of requests or workload")
+        
+        if self.initial_head >= self.disk_size:
+            raise ValueError(f"Initial head must be < {self.disk_size}")
+        
+        return self
+
+
+# ============= Flash Storage Models =============
+
+FLASH_MAX_PAGES = 2 ** 24
+
+
+class FlashWorkloadInput(BaseModel):
+    """Synthetic host write trace"""
+    count: int = Field(..., ge=1, le=2_000_000, description="Number of page writes")
+    pattern: Literal["uniform", "hot-cold", "sequential"] = Field("uniform")
+    hot_fraction: float = Field(0.2, gt=0, le=1, description="Hot share of the address space")
+    hot_share: float = Field(0.8, ge=0, le=1, description="Share of writes to the hot region")
+    seed: int = Field(0, ge=0, description="Random seed")
+
+
+class FlashSimulationRequest(BaseModel):
+    """Request for SSD flash translation layer simulation"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "gc_policy": "cost-benefit",
+                "blocks": 256,
+                "pages_per_block": 64,
+                "overprovisioning": 0.1,
+                "workload": {"count": 100000, "pattern": "hot-cold"}
+            }
+        }
+    )
+    
+    gc_policy: Literal["greedy", "cost-benefit"] = Field("greedy")
+    blocks: int = Field(256, ge=8, le=65536, description="Number of erase blocks")
+    pages_per_block: int = Field(64, ge=4, le=1024, description="Pages per erase block")
+    overprovisioning: float = Field(0.1, gt=0, lt=1, description="Share of pages hidden from the host")
+    gc_threshold: int = Field(2, ge=2, description="Free blocks that trigger garbage collection")
+    wear_leveling: bool = Field(True, description="Enable static wear leveling")
+    wl_threshold: int = Field(16, ge=1, description="Erase count gap that triggers cold data migration")
+    read_time: float = Field(0.05, ge=0, description="Page read time (ms)")
+    program_time: float = Field(0.2, gt=0, description="Page program time (ms)")
+    erase_time: float = Field(2.0, ge=0, description="Block erase time (ms)")
+    precondition: bool = Field(True, description="Fill the drive once before measuring")
+    writes: Optional[List[int]] = Field(
+        None,
+        min_length=1,
+        max_length=100000,
+        description="Explicit logical page write trace"
+    )
+    workload: Optional[FlashWorkloadInput] = Field(
+        None,
+        description="Generated write trace (used instead of writes)"
+    )
+    
+    @model_validator(mode='after')
+    def validate_trace(self):
+        """Require exactly one write trace and a bounded geometry"""
+        if (self.writes is None) == (self.workload is None):
+            raise ValueError("Give exactly one of writes or workload")
+        
+        # The mapping arrays hold about 9 bytes per physical page
+        if self.blocks * self.pages_per_block > FLASH_MAX_PAGES:
+            raise ValueError(f"blocks * pages_per_block must be at most {FLASH_MAX_PAGES}")
+        
+        if self.writes is not None and any(w < 0 for w in self.writes):
+            raise ValueError("Logical pages must be non-negative")
+        
+        return self
+
+
+# ============= Batch Models =============
+
+class CPUScenario(BaseModel):
+    """CPU scheduling scenario in a batch"""
+    kind: Literal["cpu"]
+    request: CPUSchedulingRequest
+
+
+class PageScenario(BaseModel):
+    """Page replacement scenario in a batch"""
+    kind: Literal["page"]
+    request: PageReplacementRequest
+
+
+class DiskScenario(BaseModel):
+    """Disk scheduling scenario in a batch"""
+    kind: Literal["disk"]
+    request: DiskSchedulingRequest
+
+
+BatchScenario = Annotated[
+    Union[CPUScenario, PageScenario, DiskScenario],
+    Field(discriminator="kind")
+]
+
+
+class BatchSimulationRequest(BaseModel):
+    """Request for running many simulations at once"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "scenarios": [
+                    {
+                        "kind": "cpu",
+                        "request": {
+                            "algorithm": "FCFS",
+                            "processes": [{"pid": 1, "arrival": 0, "burst": 5}]
+                        }
+                    },
+                    {
+                        "kind": "disk",
+                        "request": {
+                            "algorithm": "SSTF",
+                            "request_queue": [98, 183, 37],
+                            "initial_head": 53
+                        }
+                    }
+                ],
+                "include_charts": False,
+                "stream": False
+            }
+        }
+    )
+    
+    scenarios: List[BatchScenario] = Field(..., min_length=1, max_length=10000)
+    include_charts: bool = Field(False, description="Render a chart for every scenario")
+    stream: bool = Field(
+        False,
+        description="Stream NDJSON results as they complete instead of one ordered response"
+    )
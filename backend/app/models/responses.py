@@ -42,7 +42,17 @@ class CPUSchedulingResponse(BaseModel):
     metrics: CPUMetrics
     processes: List[ProcessResult]
     timeline: List[TimelineEvent]
-    gantt_chart: str = Field(..., description="Base64 encoded PNG")
+    gantt_chart: Optional[str] = Field(None, description="Base64 encoded PNG")
+    result_id: Optional[str] = Field(
+        None,
+        description="Cached result ID; GET /charts/{result_id} renders its chart"
+    )
+
+class CPUComparisonResponse(BaseModel):
+    """Response for comparing CPU scheduling algorithms"""
+    success: bool = True
+    time_quantum: int
+    comparison: Dict[str, CPUMetrics] = Field(..., description="Metrics per algorithm")
 
 # ============= Page Response Models =============
 class PageMetrics(MetricsBase):
@@ -67,7 +77,40 @@ class PageReplacementResponse(BaseModel):
     algorithm: str
     metrics: PageMetrics
     trace: List[PageTraceStep]
-    visualization: str = Field(..., description="Base64 encoded PNG")
+    fault_rate_timeline: Optional[List[float]] = Field(
+        None,
+        description="Windowed fault rate (%) after each reference"
+    )
+    visualization: Optional[str] = Field(None, description="Base64 encoded PNG")
+    result_id: Optional[str] = Field(
+        None,
+        description="Cached result ID; GET /charts/{result_id} renders its chart"
+    )
+
+class PageComparisonResponse(BaseModel):
+    """Response for comparing page replacement policies"""
+    success: bool = True
+    frame_count: int
+    total_references: int
+    comparison: Dict[str, PageMetrics] = Field(..., description="Metrics per policy")
+    best: str = Field(..., description="Policy with the fewest faults")
+
+class ProcessFaultStats(BaseModel):
+    """Per-process result of a multi-process simulation"""
+    pid: int
+    references: int
+    page_faults: int
+    fault_ratio: float = Field(..., description="Fault ratio percentage")
+    frames: int = Field(..., description="Allocated frames (local) or frames held at end (global)")
+
+class MultiProcessMemoryResponse(BaseModel):
+    """Response for multi-process page replacement"""
+    success: bool = True
+    policy: str
+    scope: str
+    allocation: str
+    metrics: PageMetrics
+    processes: List[ProcessFaultStats]
 
 # ============= Disk Response Models =============
 class DiskMetrics(MetricsBase):
@@ -77,6 +120,36 @@ class DiskMetrics(MetricsBase):
     max_seek: int
     min_seek: int
     total_requests: int
+    p50_seek: Optional[float] = Field(None, description="Median seek distance")
+    p90_seek: Optional[float] = None
+    p99_seek: Optional[float] = None
+
+class DiskTimingMetrics(MetricsBase):
+    """Service time estimates from the drive model"""
+    total_service_time: float = Field(..., description="Total service time (ms)")
+    avg_service_time: float = Field(..., description="Average service time (ms)")
+    max_service_time: float = Field(..., description="Slowest request (ms)")
+    total_seek_time: float = Field(..., description="Time spent seeking (ms)")
+    rotational_latency: float = Field(..., description="Average rotational latency per request (ms)")
+    transfer_time: float = Field(..., description="Transfer time per request (ms)")
+    throughput: float = Field(..., description="Requests per second")
+
+class PositioningComparison(BaseModel):
+    """SPTF against SSTF on the same queue and drive"""
+    sptf_total_time: float = Field(..., description="SPTF total service time (ms)")
+    sstf_total_time: float = Field(..., description="SSTF total service time (ms)")
+    sptf_throughput: float = Field(..., description="SPTF requests per second")
+    sstf_throughput: float = Field(..., description="SSTF requests per second")
+    throughput_gain: float = Field(..., description="SPTF throughput gain over SSTF (%)")
+
+class MergeStats(BaseModel):
+    """Effect of merging adjacent block requests"""
+    original_requests: int
+    merged_requests: int
+    request_reduction: float = Field(..., description="Fewer requests after merging (%)")
+    seek_without_merge: int = Field(..., description="Total seek of the unmerged queue")
+    seek_with_merge: int = Field(..., description="Total seek of the merged queue")
+    seek_savings: int = Field(..., description="Cylinders saved by merging")
 
 class DiskSeekStep(BaseModel):
     """Single step in disk scheduling"""
@@ -92,8 +165,202 @@ class DiskSchedulingResponse(BaseModel):
     algorithm: str
     metrics: DiskMetrics
     sequence: List[int] = Field(..., description="Order of serviced requests")
-    trace: List[DiskSeekStep]
-    visualization: str = Field(..., description="Base64 encoded PNG")
+    trace: Optional[List[DiskSeekStep]] = Field(
+        None,
+        description="Per-step seek trace (full mode only)"
+    )
+    packed_seeks: Optional[str] = Field(
+        None,
+        description="Base64 of little-endian uint32 seek distances (compact mode only)"
+    )
+    timing: Optional[DiskTimingMetrics] = Field(
+        None,
+        description="Drive model timing (only when a drive model is given)"
+    )
+    positioning: Optional[PositioningComparison] = Field(
+        None,
+        description="Throughput comparison against SSTF (SPTF only)"
+    )
+    merge: Optional[MergeStats] = Field(
+        None,
+        description="Request merging results (only when merge is enabled)"
+    )
+    visualization: Optional[str] = Field(
+        None,
+        description="Base64 encoded PNG (full mode with charts only)"
+    )
+    result_id: Optional[str] = Field(
+        None,
+        description="Cached result ID; GET /charts/{result_id} renders its chart"
+    )
+
+class DiskComparisonResponse(BaseModel):
+    """Response for comparing disk scheduling algorithms"""
+    success: bool = True
+    initial_head: int
+    direction: str
+    total_requests: int
+    comparison: Dict[str, DiskMetrics] = Field(..., description="Seek metrics per algorithm")
+    best: str = Field(..., description="Algorithm with the lowest total seek")
+    charts: Optional[Dict[str, str]] = Field(
+        None,
+        description="Base64 encoded PNG per algorithm (only when include_charts is set)"
+    )
+
+class DynamicDiskMetrics(MetricsBase):
+    """Response-time metrics for disk scheduling with arrivals"""
+    total_seek: int = Field(..., description="Total head movement (cylinders)")
+    total_requests: int
+    makespan: float = Field(..., description="Completion time of the last request")
+    avg_response_time: float
+    p50_response_time: float
+    p90_response_time: float
+    p95_response_time: float
+    p99_response_time: float
+    max_response_time: float
+    max_wait_time: float = Field(..., description="Longest time a request waited before dispatch")
+    starvation_threshold: float
+    starved_requests: int = Field(..., description="Requests whose response time exceeded the threshold")
+    deadline_misses: Optional[int] = Field(
+        None,
+        description="Requests that had waited at least the deadline when dispatched (Deadline only)"
+    )
+
+class TimedRequestResult(BaseModel):
+    """Outcome of one timestamped disk request"""
+    arrival: float
+    cylinder: int
+    start: float
+    finish: float
+    response_time: float
+
+class DynamicDiskSchedulingResponse(BaseModel):
+    """Response for disk scheduling with arrivals"""
+    success: bool = True
+    algorithm: str
+    metrics: DynamicDiskMetrics
+    sequence: List[int] = Field(..., description="Order of serviced requests")
+    requests: List[TimedRequestResult] = Field(..., description="Per-request timing in service order")
+
+class TraceMetrics(MetricsBase):
+    """Aggregates of a replayed block trace"""
+    requests: int
+    reads: int
+    writes: int
+    sectors: int = Field(..., description="Total sectors transferred")
+    out_of_range: int = Field(..., description="Requests beyond the disk, clipped to the edge")
+    duration: float = Field(..., description="Last minus first trace timestamp")
+    windows: int = Field(..., description="Scheduling windows replayed")
+    total_seek: int
+    avg_seek: float
+    p50_seek: int
+    p90_seek: int
+    p99_seek: int
+    max_seek: int
+    fcfs_total_seek: int = Field(..., description="Seek in trace order, for comparison")
+    seek_reduction: float = Field(..., description="Saving against trace order (%)")
+
+class TraceReplayResponse(BaseModel):
+    """Response for block trace replay"""
+    success: bool = True
+    format: str
+    algorithm: str
+    window: int
+    metrics: TraceMetrics
+
+class ArrayDiskStats(BaseModel):
+    """Load of one disk in an array"""
+    disk: int
+    requests: int = Field(..., description="Physical operations served")
+    busy_time: float = Field(..., description="Time spent seeking and transferring (ms)")
+    utilization: float = Field(..., description="Busy share of the makespan (%)")
+    total_seek: int = Field(..., description="Total head movement (cylinders)")
+    avg_response_time: float = Field(..., description="Mean operation response time (ms)")
+
+class DiskArrayMetrics(MetricsBase):
+    """Aggregate disk array metrics"""
+    logical_requests: int
+    physical_requests: int
+    makespan: float = Field(..., description="First arrival to last completion (ms)")
+    throughput: float = Field(..., description="Logical requests completed per second")
+    avg_response_time: float
+    p50_response_time: float
+    p95_response_time: float
+    p99_response_time: float
+    max_response_time: float
+    avg_utilization: float = Field(..., description="Mean disk utilization (%)")
+
+class DiskArrayResponse(BaseModel):
+    """Response for RAID disk array simulation"""
+    success: bool = True
+    level: str
+    disks: int
+    algorithm: str
+    metrics: DiskArrayMetrics
+    per_disk: List[ArrayDiskStats]
+
+# ============= Flash Storage Response Models =============
+class FlashMetrics(MetricsBase):
+    """Write amplification and garbage collection metrics"""
+    host_writes: int
+    flash_writes: int = Field(..., description="Page programs including GC relocations")
+    write_amplification: float
+    gc_events: int = Field(..., description="Blocks collected (including wear leveling)")
+    relocated_pages: int
+    wear_leveling_migrations: int
+    avg_write_latency: float = Field(..., description="Mean host write latency (ms)")
+    p99_write_latency: float
+    p999_write_latency: float
+    max_write_latency: float
+    latency_spikes: int = Field(..., description="Host writes stalled by GC")
+    avg_gc_latency: float
+    max_gc_latency: float
+
+class EraseStats(BaseModel):
+    """Block erase count distribution"""
+    min_erases: int
+    max_erases: int
+    mean_erases: float
+    std_erases: float
+
+class LatencySpike(BaseModel):
+    """A host write stalled by garbage collection"""
+    write_index: int
+    latency: float
+
+class FlashSimulationResponse(BaseModel):
+    """Response for SSD flash translation layer simulation"""
+    success: bool = True
+    gc_policy: str
+    logical_pages: int
+    metrics: FlashMetrics
+    wear: EraseStats
+    largest_spikes: List[LatencySpike] = Field(..., description="Slowest host writes")
+
+# ============= Batch Response Models =============
+class BatchResult(BaseModel):
+    """Outcome of one batch scenario"""
+    index: int = Field(..., description="Position of the scenario in the request")
+    kind: str
+    success: bool
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+class BatchSimulationResponse(BaseModel):
+    """Response for a batch of simulations"""
+    success: bool = True
+    total: int
+    failed: int
+    results: List[BatchResult] = Field(..., description="Results in request order")
+
+# ============= Chart Response Models =============
+class ChartResponse(BaseModel):
+    """Chart rendered for a cached simulation result"""
+    success: bool = True
+    result_id: str
+    kind: str = Field(..., description="cpu, page or disk")
+    algorithm: str
+    chart: str = Field(..., description="Base64 encoded PNG (data URI)")
 
 # ============= Error Response =============
 class ErrorResponse(BaseModel):
@@ -107,4 +374,17 @@ class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     version: str
-    algorithms: Dict[str, List[str]]
\ No newline at end of file
+    algorithms: Dict[str, List[str]]
+
+class CacheStatsResponse(BaseModel):
+    """Result cache counters"""
+    enabled: bool
+    entries: int = 0
+    bytes: int = Field(0, description="Payload bytes held in memory")
+    max_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    hit_ratio: float = Field(0.0, description="Hits per lookup (%)")
+    evictions: int = 0
+    persistent: bool = Field(False, description="SQLite tier enabled")
+    coalesced: int = Field(0, description="Requests that awaited an identical in-flight simulation")
\ No newline at end of file
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+from app.models.requests import BatchSimulationRequest
+from app.models.responses import BatchSimulationResponse
+from app.services.batch_service import BatchSimulationService
+
+router = APIRouter()
+service = BatchSimulationService()
+
+@router.post(
+    "/",
+    response_model=BatchSimulationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Run a Batch of Simulations",
+    description="""
+    Run many CPU, page and disk scenarios in one request.
+    
+    Each scenario is `{"kind": "cpu" | "page" | "disk", "request": {...}}` with the
+    same body as the single-simulation endpoint. Scenarios are split into chunks
+    and executed across a process pool with one worker per core. Charts are off
+    unless `include_charts` is set.
+    
+    **Returns:**
+    - `stream: false`: all results in request order
+    - `stream: true`: NDJSON, one result per line as soon as its chunk finishes
+      (each line carries the scenario `index`)
+    
+    A failing scenario is reported in its result and does not fail the batch.
+    """
+)
+async def simulate_batch(request: BatchSimulationRequest):
+    """Execute a batch of simulations"""
+    if request.stream:
+        return StreamingResponse(
+            service.stream(request),
+            media_type="application/x-ndjson"
+        )
+    try:
+        result = await service.run(request)
+        return result
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch failed: {str(e)}"
+        )
@@ -0,0 +1,104 @@
+import hashlib
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, Header, Query, Response, status
+from app.config import get_settings
+from app.models.responses import ChartResponse
+from app.services.chart_service import ChartService, ChartNotFoundError
+from app.utils.cache import cache_headers, etag_matches
+from app.utils.executor import SimulationBusyError
+from app.utils.visualization import CHART_FORMATS
+
+router = APIRouter()
+service = ChartService()
+
+@router.get(
+    "/{result_id}",
+    response_model=ChartResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Chart for a Result",
+    description="""
+    Render the chart of a CPU, page or disk simulation after the fact.
+    
+    Simulate responses no longer embed charts by default (`include_chart` is
+    off); they return a `result_id` instead. The chart is rendered from the
+    cached result on first request and cached itself, so repeated fetches are
+    cheap. Returns 404 once the result has expired from the cache.
+    """
+)
+async def get_chart(result_id: str):
+    """Render or fetch the chart of a cached result"""
+    try:
+        result = await service.get_chart(result_id)
+        return result
+    except ChartNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Chart rendering failed: {str(e)}"
+        )
+
+@router.get(
+    "/{result_id}/image",
+    response_class=Response,
+    responses={
+        200: {"content": {media_type: {} for media_type in CHART_FORMATS.values()}},
+        304: {"description": "Client copy is current"}
+    },
+    summary="Get Chart Image for a Result",
+    description="""
+    Stream the chart of a cached result as raw image bytes.
+    
+    Unlike the JSON endpoint there is no base64 step and no data URI: the
+    bytes come straight from the render buffer, about a quarter smaller and
+    ready for an `<img src>`. Choose `format` (png, webp or svg) and `dpi`
+    (raster resolution). Images are cached per format and resolution, carry
+    a strong ETag with `Cache-Control: public, max-age`, so browsers and
+    proxies can reuse them, and honor `If-None-Match` (weak comparison).
+    """
+)
+async def get_chart_image(
+    result_id: str,
+    format: Literal["png", "webp", "svg"] = Query("png", description="Image format"),
+    dpi: int = Query(100, ge=30, le=300, description="Resolution for png/webp"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """Render or fetch the chart image of a cached result"""
+    if format == "svg":
+        dpi = 72  # vector output, one cache entry regardless of dpi
+    version = get_settings().app_version
+    digest = hashlib.sha256(f"{version}:{result_id}:{format}:{dpi}".encode()).hexdigest()
+    etag = f'"{digest[:32]}"'
+    headers = cache_headers(etag)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    try:
+        image = await service.get_image(result_id, format, dpi)
+    except ChartNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Chart rendering failed: {str(e)}"
+        )
+    
+    return Response(content=image, media_type=CHART_FORMATS[format], headers=headers)
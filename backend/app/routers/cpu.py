@@ -1,8 +1,11 @@
-from fastapi import APIRouter, HTTPException, status
-from app.models.requests import CPUSchedulingRequest
-from app.models.responses import CPUSchedulingResponse, ErrorResponse
+import asyncio
+from fastapi import APIRouter, HTTPException, Header, Response, status
+from app.models.requests import CPUSchedulingRequest, CPUCompareRequest
+from app.models.responses import CPUSchedulingResponse, CPUComparisonResponse, ErrorResponse
 from app.services.cpu_service import CPUSchedulingService
-from typing import Dict, Any, List  # ✅ Add Any here
+from app.utils.executor import get_executor, SimulationBusyError
+from app.utils.cache import run_cached, conditional_response
+from typing import Dict, Any, List, Optional  # ✅ Add Any here
 
 router = APIRouter()
 service = CPUSchedulingService()
@@ -25,14 +28,34 @@ service = CPUSchedulingService()
     **Returns:**
     - Process execution timeline
     - Performance metrics (waiting time, turnaround time, CPU utilization)
-    - Gantt chart visualization (Base64 PNG)
+    - Gantt chart (Base64 PNG) only with `include_chart`; otherwise `result_id` for `GET /api/charts/{result_id}`
+    
+    **Caching:** the response carries an `ETag` and `Cache-Control: no-cache`. Browsers
+    and proxies do not revalidate POSTs by themselves; send the ETag back as
+    `If-None-Match` to get `304 Not Modified` without simulating.
     """
 )
-async def simulate_cpu_scheduling(request: CPUSchedulingRequest):
+async def simulate_cpu_scheduling(
+    request: CPUSchedulingRequest,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """Execute CPU scheduling simulation"""
+    not_modified = conditional_response("cpu", request, if_none_match, response)
+    if not_modified is not None:
+        return not_modified
     try:
-        result = service.simulate(request)
+        result = await run_cached(
+            "cpu", request, CPUSchedulingResponse,
+            lambda: get_executor().run(service.simulate, request)
+        )
         return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -100,37 +123,44 @@ async def get_algorithms():
 
 @router.post(
     "/compare",
+    response_model=CPUComparisonResponse,
     summary="Compare Multiple Algorithms",
-    description="Run same process set on multiple algorithms for comparison",
-    response_model=Dict[str, Any]  # ✅ Add response model
+    description="""
+    Run the same process set on several algorithms (default: all five).
+    
+    The processes are validated and sorted by arrival once, no Gantt charts
+    are rendered, and the algorithms run in parallel on the simulation
+    executor, so comparing all of them costs about as much as the slowest one.
+    """
 )
-async def compare_algorithms(
-    processes: List[Dict[str, int]],  # ✅ Changed type
-    algorithms: List[str],
-    time_quantum: int = 2
-):
+async def compare_algorithms(request: CPUCompareRequest):
     """Compare multiple algorithms with same process set"""
-    results = {}
-    
-    for algo in algorithms:
-        try:
-            # Convert dict to ProcessInput
-            from app.models.requests import ProcessInput
-            process_inputs = [ProcessInput(**p) for p in processes]
-            
-            request = CPUSchedulingRequest(
-                algorithm=algo,
-                processes=process_inputs,
-                time_quantum=time_quantum if algo == "RoundRobin" else None
-            )
-            result = service.simulate(request)
-            results[algo] = {
-                "avg_waiting_time": result.metrics.avg_waiting_time,
-                "avg_turnaround_time": result.metrics.avg_turnaround_time,
-                "cpu_utilization": result.metrics.cpu_utilization,
-                "throughput": result.metrics.throughput
-            }
-        except Exception as e:
-            results[algo] = {"error": str(e)}
+    rows = service.sort_arrivals(request.processes)
+    algorithms = list(dict.fromkeys(request.algorithms))
+    executor = get_executor()
+    try:
+        metrics = await asyncio.gather(*(
+            executor.run(service.compare_one, algo, rows, request.time_quantum)
+            for algo in algorithms
+        ))
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Comparison failed: {str(e)}"
+        )
     
-    return {"comparison": results}
\ No newline at end of file
+    return CPUComparisonResponse(
+        time_quantum=request.time_quantum,
+        comparison=dict(zip(algorithms, metrics))
+    )
@@ -1,11 +1,21 @@
-from fastapi import APIRouter, HTTPException, status
-from app.models.requests import DiskSchedulingRequest
-from app.models.responses import DiskSchedulingResponse
+from fastapi import APIRouter, HTTPException, Header, Response, Request, Depends, status
+from app.models.requests import (
+    DiskSchedulingRequest, DynamicDiskSchedulingRequest, DiskArrayRequest,
+    TraceReplayRequest, DiskCompareRequest
+)
+from app.models.responses import (
+    DiskSchedulingResponse, DynamicDiskSchedulingResponse, DiskArrayResponse,
+    TraceReplayResponse, DiskComparisonResponse
+)
 from app.services.disk_service import DiskSchedulingService
-from typing import Dict, Any  # ✅ Add Any
+from app.services.array_service import DiskArrayService
+from app.utils.executor import get_executor, SimulationBusyError
+from app.utils.cache import run_cached, conditional_response
+from typing import Dict, Any, Optional  # ✅ Add Any
 
 router = APIRouter()
 service = DiskSchedulingService()
+array_service = DiskArrayService()
 
 @router.post(
     "/",
@@ -22,18 +32,216 @@ service = DiskSchedulingService()
     - **C-SCAN**: Circular SCAN (jumps back to start)
     - **LOOK**: Like SCAN but only goes to last request
     - **C-LOOK**: Circular LOOK
+    - **SPTF**: Shortest Positioning Time First (seek + rotation, uses the drive model)
     
     **Returns:**
     - Request service sequence
     - Total seek time and metrics
-    - Head movement visualization (Base64 PNG)
+    - Head movement visualization (Base64 PNG) only with `include_chart`; otherwise `result_id` for `GET /api/charts/{result_id}`
+    
+    **Caching:** the response carries an `ETag` and `Cache-Control: no-cache`. Browsers
+    and proxies do not revalidate POSTs by themselves; send the ETag back as
+    `If-None-Match` to get `304 Not Modified` without simulating.
     """
 )
-async def simulate_disk_scheduling(request: DiskSchedulingRequest):
+async def simulate_disk_scheduling(
+    request: DiskSchedulingRequest,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """Execute disk scheduling simulation"""
+    not_modified = conditional_response("disk", request, if_none_match, response)
+    if not_modified is not None:
+        return not_modified
     try:
-        result = service.simulate(request)
+        result = await run_cached(
+            "disk", request, DiskSchedulingResponse,
+            lambda: get_executor().run(service.simulate, request)
+        )
         return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Simulation failed: {str(e)}"
+        )
+
+@router.post(
+    "/compare",
+    response_model=DiskComparisonResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Compare Disk Scheduling Algorithms",
+    description="""
+    Run FCFS, SSTF, SCAN, C-SCAN, LOOK and C-LOOK (or a subset) on one queue.
+    
+    The queue is sorted once and split around the head; every directional
+    order is a slice of that shared index and SSTF walks its distinct
+    cylinders, so the whole comparison costs one sort plus O(n) per algorithm.
+    Seek totals are vectorized. Queues of up to 1,000,000 requests are accepted.
+    
+    **Returns:**
+    - Seek metrics per algorithm and the algorithm with the lowest total seek
+    - One chart per algorithm when `include_charts` is set
+    """
+)
+async def compare_algorithms(request: DiskCompareRequest):
+    """Compare disk scheduling algorithms on one queue"""
+    try:
+        result = await get_executor().run(service.compare, request)
+        return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Comparison failed: {str(e)}"
+        )
+
+@router.post(
+    "/dynamic",
+    response_model=DynamicDiskSchedulingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Simulate Disk Scheduling with Arrivals",
+    description="""
+    Event-driven disk scheduling where requests arrive over time.
+    
+    **Supported Algorithms:** FCFS, SSTF, SCAN, C-SCAN, LOOK, C-LOOK, plus the
+    starvation-bounded batch schedulers:
+    - **Deadline**: Ascending elevator with a FIFO expiry queue (`deadline`, `fifo_batch`)
+    - **N-Step-SCAN**: Sweeps frozen batches of `batch_size` requests
+    - **FSCAN**: Freezes the whole queue for each sweep
+    
+    **Returns:**
+    - Service order and per-request dispatch/completion times
+    - Response-time percentiles (p50/p90/p95/p99) and maximum wait
+    - Number of starved requests
+    """
+)
+async def simulate_dynamic_disk_scheduling(request: DynamicDiskSchedulingRequest):
+    """Execute disk scheduling simulation with arrival times"""
+    try:
+        result = await get_executor().run(service.simulate_dynamic, request)
+        return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Simulation failed: {str(e)}"
+        )
+
+@router.post(
+    "/array",
+    response_model=DiskArrayResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Simulate RAID Disk Array",
+    description="""
+    Stripe logical requests across a disk array and schedule every disk independently.
+    
+    **Layouts:**
+    - **RAID0**: Striping, no redundancy
+    - **RAID1**: Mirroring (reads alternate between copies, writes go to all)
+    - **RAID5**: Striping with rotating parity (writes also update parity)
+    - **RAID10**: Striped mirror pairs
+    
+    Send explicit `requests` or a generated `workload` (up to 10^6 requests).
+    
+    **Returns:**
+    - Per-disk operations, utilization and seek distance
+    - Aggregate throughput and response-time percentiles
+    """
+)
+async def simulate_disk_array(request: DiskArrayRequest):
+    """Execute disk array simulation"""
+    try:
+        result = await get_executor().run(array_service.simulate, request)
+        return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Simulation failed: {str(e)}"
+        )
+
+@router.post(
+    "/trace",
+    response_model=TraceReplayResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Replay Block I/O Trace",
+    description="""
+    Replay a block I/O trace sent as the raw request body through a disk scheduler.
+    
+    The body is parsed as it streams in, so traces of any length are accepted
+    while memory stays flat. Options are passed as query parameters.
+    
+    **Formats:**
+    - **csv**: `timestamp,lba,size,rw` per line (rw is R/W or 0/1, header optional)
+    - **blkparse**: blkparse text output (queue events only)
+    - **binary**: packed little-endian records (f8 timestamp, u8 lba, u4 size, u1 write)
+    
+    LBAs are mapped to cylinders with `sectors_per_cylinder`, and requests are
+    scheduled in windows of `window` requests with the head carried between windows.
+    
+    **Returns:**
+    - Read/write counts and trace duration
+    - Total seek, seek percentiles and the saving against trace order
+    """
+)
+async def replay_disk_trace(
+    raw: Request,
+    request: TraceReplayRequest = Depends()
+):
+    """Execute block trace replay"""
+    try:
+        executor = get_executor()
+        reader, replay = service.open_trace(request)
+        async for chunk in raw.stream():
+            await executor.run_threaded(service.feed_trace, reader, replay, chunk)
+        return await executor.run_threaded(service.finish_trace, request, reader, replay)
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,7 +261,7 @@ async def simulate_disk_scheduling(request: DiskSchedulingRequest):
 async def get_algorithms():
     """Get list of available disk scheduling algorithms"""
     return {
-        "algorithms": ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"],
+        "algorithms": ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK", "SPTF"],
         "descriptions": {
             "FCFS": {
                 "name": "First Come First Serve",
@@ -96,6 +304,13 @@ async def get_algorithms():
                 "requires_direction": True,
                 "advantages": ["Best uniform wait time"],
                 "disadvantages": ["Implementation complexity"]
+            },
+            "SPTF": {
+                "name": "Shortest Positioning Time First",
+                "description": "Services the request with the smallest seek plus rotational delay",
+                "requires_direction": False,
+                "advantages": ["Highest throughput", "Accounts for rotation"],
+                "disadvantages": ["Starvation possible", "Needs a drive model"]
             }
         }
     }
\ No newline at end of file
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, HTTPException, status
+from app.models.requests import FlashSimulationRequest
+from app.models.responses import FlashSimulationResponse
+from app.services.flash_service import FlashStorageService
+from app.utils.executor import get_executor, SimulationBusyError
+from typing import Dict, Any
+
+router = APIRouter()
+service = FlashStorageService()
+
+@router.post(
+    "/",
+    response_model=FlashSimulationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Simulate SSD Flash Translation Layer",
+    description="""
+    Replay a page write trace through a page-mapped flash translation layer.
+    
+    **Garbage Collection Policies:**
+    - **greedy**: Collects the block with the fewest valid pages
+    - **cost-benefit**: Weighs reclaimed space against the age of the data
+    
+    Free blocks are allocated least-worn first, and static wear leveling
+    migrates cold data when erase counts drift more than `wl_threshold` apart.
+    
+    **Returns:**
+    - Write amplification and GC counts
+    - Host write latency percentiles and the largest GC stalls
+    - Erase count distribution
+    """
+)
+async def simulate_flash(request: FlashSimulationRequest):
+    """Execute flash storage simulation"""
+    try:
+        result = await get_executor().run(service.simulate, request)
+        return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Simulation failed: {str(e)}"
+        )
+
+@router.get(
+    "/policies",
+    response_model=Dict[str, Any],
+    summary="Get Available GC Policies"
+)
+async def get_policies():
+    """Get list of available garbage collection policies"""
+    return {
+        "policies": ["greedy", "cost-benefit"],
+        "descriptions": {
+            "greedy": {
+                "name": "Greedy",
+                "description": "Collects the block with the fewest valid pages",
+                "advantages": ["Lowest copy cost per collection", "Best for uniform writes"],
+                "disadvantages": ["Keeps recollecting blocks with hot data"]
+            },
+            "cost-benefit": {
+                "name": "Cost-Benefit",
+                "description": "Maximises age * (1 - u) / 2u over candidate blocks",
+                "advantages": ["Separates hot and cold data", "Lower write amplification on skewed writes"],
+                "disadvantages": ["May copy more pages per collection"]
+            }
+        }
+    }
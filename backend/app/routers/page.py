@@ -1,8 +1,14 @@
-from fastapi import APIRouter, HTTPException, status
-from app.models.requests import PageReplacementRequest
-from app.models.responses import PageReplacementResponse
+from fastapi import APIRouter, HTTPException, Header, Response, status
+from app.models.requests import (
+    PageReplacementRequest, MultiProcessMemoryRequest, PageCompareRequest
+)
+from app.models.responses import (
+    PageReplacementResponse, MultiProcessMemoryResponse, PageComparisonResponse
+)
 from app.services.page_service import PageReplacementService
-from typing import Dict, Any  # ✅ Add Any
+from app.utils.executor import get_executor, SimulationBusyError
+from app.utils.cache import run_cached, conditional_response
+from typing import Dict, Any, Optional  # ✅ Add Any
 
 router = APIRouter()
 service = PageReplacementService()
@@ -24,14 +30,114 @@ service = PageReplacementService()
     **Returns:**
     - Frame state trace at each step
     - Page fault count and hit ratio
-    - Visualization (Base64 PNG)
+    - Visualization (Base64 PNG) only with `include_chart`; otherwise `result_id` for `GET /api/charts/{result_id}`
+    
+    **Caching:** the response carries an `ETag` and `Cache-Control: no-cache`. Browsers
+    and proxies do not revalidate POSTs by themselves; send the ETag back as
+    `If-None-Match` to get `304 Not Modified` without simulating.
     """
 )
-async def simulate_page_replacement(request: PageReplacementRequest):
+async def simulate_page_replacement(
+    request: PageReplacementRequest,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """Execute page replacement simulation"""
+    not_modified = conditional_response("page", request, if_none_match, response)
+    if not_modified is not None:
+        return not_modified
     try:
-        result = service.simulate(request)
+        result = await run_cached(
+            "page", request, PageReplacementResponse,
+            lambda: get_executor().run(service.simulate, request)
+        )
         return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Simulation failed: {str(e)}"
+        )
+
+@router.post(
+    "/compare",
+    response_model=PageComparisonResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Compare Page Replacement Algorithms",
+    description="""
+    Run several policies (default: all four) over one reference string.
+    
+    The policies advance in lockstep over a single pass of the references and
+    only count faults, so no per-step trace is kept and reference strings of
+    up to 1,000,000 pages fit comfortably. Optimal's next-use index is built
+    once for the whole string.
+    
+    **Returns:**
+    - Hit/fault metrics per policy
+    - The policy with the fewest faults
+    """
+)
+async def compare_algorithms(request: PageCompareRequest):
+    """Compare page replacement algorithms on one reference string"""
+    try:
+        result = await get_executor().run(service.compare, request)
+        return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Comparison failed: {str(e)}"
+        )
+
+@router.post(
+    "/multiprocess",
+    response_model=MultiProcessMemoryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Simulate Multi-Process Page Replacement",
+    description="""
+    Interleave several processes' reference streams over a shared frame pool.
+    
+    **Options:**
+    - **scope**: `global` replaces any process's frame, `local` only the faulting process's own
+    - **allocation**: `proportional` (by process size) or `priority` frame allocation for local scope
+    - **policy**: FIFO or LRU
+    
+    **Returns:**
+    - Overall fault metrics
+    - Per-process reference and fault counts
+    """
+)
+async def simulate_multiprocess(request: MultiProcessMemoryRequest):
+    """Execute multi-process page replacement simulation"""
+    try:
+        result = await get_executor().run(service.simulate_multiprocess, request)
+        return result
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,106 @@
+from app.algorithms.disk_array import simulate_array, generate_workload, data_capacity
+from app.algorithms.disk_scheduling import DriveModel
+from app.models.requests import DiskArrayRequest, DriveModelInput
+from app.models.responses import DiskArrayResponse, DiskArrayMetrics, ArrayDiskStats
+import numpy as np
+
+class DiskArrayService:
+    """Service for RAID disk array simulation"""
+
+    def simulate(self, request: DiskArrayRequest) -> DiskArrayResponse:
+        """Run a disk array simulation"""
+        drive_input = request.drive or DriveModelInput()
+        drive = DriveModel(cylinders=request.disk_size, **drive_input.model_dump())
+        capacity = data_capacity(
+            request.level,
+            request.disks,
+            request.disk_size * request.blocks_per_cylinder,
+            request.stripe_unit
+        )
+
+        if request.workload is not None:
+            workload = request.workload
+            arrivals, blocks, writes = generate_workload(
+                workload.count,
+                capacity,
+                arrival_rate=workload.arrival_rate,
+                write_fraction=workload.write_fraction,
+                seed=workload.seed
+            )
+        else:
+            arrivals = np.array([r.arrival for r in request.requests], dtype=float)
+            blocks = np.array([r.block for r in request.requests], dtype=np.int64)
+            writes = np.array([r.write for r in request.requests], dtype=bool)
+            if blocks.max() >= capacity:
+                raise ValueError(f"Blocks must be within 0-{capacity - 1}")
+
+        completion, disk_stats = simulate_array(
+            arrivals,
+            blocks,
+            writes,
+            level=request.level,
+            disks=request.disks,
+            stripe_unit=request.stripe_unit,
+            blocks_per_cylinder=request.blocks_per_cylinder,
+            algorithm=request.algorithm,
+            direction=request.direction,
+            initial_head=request.initial_head,
+            drive=drive
+        )
+
+        return DiskArrayResponse(
+            level=request.level,
+            disks=request.disks,
+            algorithm=request.algorithm,
+            metrics=self._calculate_metrics(arrivals, completion, disk_stats),
+            per_disk=self._disk_stats(arrivals, completion, disk_stats)
+        )
+
+    def _makespan(self, arrivals: np.ndarray, completion: np.ndarray) -> float:
+        """First arrival to last completion"""
+        return float(completion.max() - arrivals.min())
+
+    def _calculate_metrics(
+        self,
+        arrivals: np.ndarray,
+        completion: np.ndarray,
+        disk_stats: list
+    ) -> DiskArrayMetrics:
+        """Aggregate throughput and response-time percentiles"""
+        response = completion - arrivals
+        makespan = self._makespan(arrivals, completion)
+        p50, p95, p99 = np.percentile(response, [50, 95, 99])
+        busy = np.array([s['busy_time'] for s in disk_stats])
+
+        return DiskArrayMetrics(
+            logical_requests=len(arrivals),
+            physical_requests=sum(s['requests'] for s in disk_stats),
+            makespan=round(makespan, 4),
+            throughput=round(len(arrivals) / makespan * 1000, 2) if makespan > 0 else 0.0,
+            avg_response_time=round(float(response.mean()), 4),
+            p50_response_time=round(float(p50), 4),
+            p95_response_time=round(float(p95), 4),
+            p99_response_time=round(float(p99), 4),
+            max_response_time=round(float(response.max()), 4),
+            avg_utilization=round(float(busy.mean()) / makespan * 100, 2) if makespan > 0 else 0.0
+        )
+
+    def _disk_stats(
+        self,
+        arrivals: np.ndarray,
+        completion: np.ndarray,
+        disk_stats: list
+    ) -> list:
+        """Per-disk utilization and load"""
+        makespan = self._makespan(arrivals, completion)
+        return [
+            ArrayDiskStats(
+                disk=d,
+                requests=s['requests'],
+                busy_time=round(s['busy_time'], 4),
+                utilization=round(s['busy_time'] / makespan * 100, 2) if makespan > 0 else 0.0,
+                total_seek=s['total_seek'],
+                avg_response_time=round(s['response_time'] / s['requests'], 4) if s['requests'] else 0.0
+            )
+            for d, s in enumerate(disk_stats)
+        ]
@@ -0,0 +1,89 @@
+import asyncio
+import json
+from math import ceil
+from typing import AsyncIterator, List, Tuple
+from app.models.requests import BatchSimulationRequest
+from app.models.responses import BatchResult, BatchSimulationResponse
+from app.services.cpu_service import CPUSchedulingService
+from app.services.page_service import PageReplacementService
+from app.services.disk_service import DiskSchedulingService
+from app.utils.executor import get_batch_pool
+from app.config import get_settings
+
+# Services are created once per worker process
+_services = None
+
+def _get_services():
+    global _services
+    if _services is None:
+        _services = {
+            "cpu": CPUSchedulingService(),
+            "page": PageReplacementService(),
+            "disk": DiskSchedulingService()
+        }
+    return _services
+
+def run_scenarios(chunk: List[Tuple], include_charts: bool) -> List[dict]:
+    """
+    Run a chunk of scenarios inside a worker process
+
+    Args:
+        chunk: List of (index, kind, request) tuples
+        include_charts: Render charts for every scenario
+
+    Returns:
+        results: BatchResult dicts, one per scenario
+    """
+    services = _get_services()
+    results = []
+    for index, kind, request in chunk:
+        try:
+            response = services[kind].simulate(request, include_chart=include_charts)
+            result = BatchResult(
+                index=index, kind=kind, success=True,
+                result=response.model_dump(mode='json')
+            )
+        except Exception as e:
+            result = BatchResult(index=index, kind=kind, success=False, error=str(e))
+        results.append(result.model_dump(mode='json'))
+    return results
+
+class BatchSimulationService:
+    """Service fanning batches of scenarios out over a process pool"""
+
+    def __init__(self, chunks_per_worker: int = 4):
+        self.chunks_per_worker = chunks_per_worker
+
+    def _submit(self, request: BatchSimulationRequest) -> List[asyncio.Future]:
+        """Split the batch into chunks and submit them to the pool"""
+        pool = get_batch_pool()
+        scenarios = [
+            (index, scenario.kind, scenario.request)
+            for index, scenario in enumerate(request.scenarios)
+        ]
+        # A few chunks per worker keeps every core busy without paying IPC per scenario
+        workers = get_settings().batch_workers
+        size = max(1, ceil(len(scenarios) / (workers * self.chunks_per_worker)))
+        loop = asyncio.get_running_loop()
+        return [
+            loop.run_in_executor(
+                pool, run_scenarios, scenarios[start:start + size], request.include_charts
+            )
+            for start in range(0, len(scenarios), size)
+        ]
+
+    async def run(self, request: BatchSimulationRequest) -> BatchSimulationResponse:
+        """Run every scenario and return the results in request order"""
+        chunks = await asyncio.gather(*self._submit(request))
+        results = [BatchResult(**result) for chunk in chunks for result in chunk]
+        return BatchSimulationResponse(
+            total=len(results),
+            failed=sum(1 for r in results if not r.success),
+            results=results
+        )
+
+    async def stream(self, request: BatchSimulationRequest) -> AsyncIterator[str]:
+        """Yield one NDJSON line per scenario as its chunk completes"""
+        for future in asyncio.as_completed(self._submit(request)):
+            for result in await future:
+                yield json.dumps(result) + "\n"
@@ -0,0 +1,100 @@
+import json
+from typing import Tuple
+from app.models.requests import (
+    CPUSchedulingRequest, PageReplacementRequest, DiskSchedulingRequest
+)
+from app.models.responses import (
+    CPUSchedulingResponse, PageReplacementResponse, DiskSchedulingResponse,
+    ChartResponse
+)
+from app.services.cpu_service import CPUSchedulingService
+from app.services.page_service import PageReplacementService
+from app.services.disk_service import DiskSchedulingService
+from app.utils.cache import get_cache, request_record_key
+from app.utils.executor import get_executor
+from app.utils.visualization import render_figure, figure_to_data_uri
+
+class ChartNotFoundError(LookupError):
+    """Raised when a result ID is unknown or its cache entry has expired"""
+    pass
+
+def _render_data_uri(service, request, response) -> str:
+    return figure_to_data_uri(service.chart_figure(request, response))
+
+def _render_image(service, request, response, format, dpi) -> bytes:
+    return render_figure(service.chart_figure(request, response), format, dpi)
+
+class ChartService:
+    """Service rendering charts for cached simulation results on demand"""
+    
+    def __init__(self):
+        self.kinds = {
+            "cpu": (CPUSchedulingService(), CPUSchedulingRequest, CPUSchedulingResponse),
+            "page": (PageReplacementService(), PageReplacementRequest, PageReplacementResponse),
+            "disk": (DiskSchedulingService(), DiskSchedulingRequest, DiskSchedulingResponse)
+        }
+    
+    async def get_chart(self, result_id: str) -> ChartResponse:
+        """
+        Chart of a cached result as a data URI, rendered on first use and
+        cached after that
+        """
+        cache, kind, request = await self._load_request(result_id)
+        chart_key = f"chart:{result_id}"
+        chart = await cache.fetch(chart_key)
+        if chart is not None:
+            chart = chart.decode()
+        else:
+            service = self.kinds[kind][0]
+            response = await self._load_result(cache, result_id, kind, request)
+            chart = await get_executor().run(_render_data_uri, service, request, response)
+            cache.put(chart_key, chart.encode())
+        
+        return ChartResponse(
+            result_id=result_id,
+            kind=kind,
+            algorithm=request.algorithm,
+            chart=chart
+        )
+    
+    async def get_image(self, result_id: str, format: str, dpi: int) -> bytes:
+        """
+        Chart of a cached result as raw image bytes (png, webp or svg)
+        
+        Rendered straight from the figure's buffer, without base64, and
+        cached per format and resolution.
+        """
+        cache, kind, request = await self._load_request(result_id)
+        image_key = f"image:{result_id}:{format}:{dpi}"
+        image = await cache.fetch(image_key)
+        if image is None:
+            service = self.kinds[kind][0]
+            response = await self._load_result(cache, result_id, kind, request)
+            image = await get_executor().run(
+                _render_image, service, request, response, format, dpi
+            )
+            cache.put(image_key, image)
+        return image
+    
+    async def _load_request(self, result_id: str) -> Tuple:
+        """Cache, simulation kind and validated request behind a result ID"""
+        cache = get_cache()
+        record = await cache.fetch(request_record_key(result_id)) if cache is not None else None
+        if record is None:
+            raise ChartNotFoundError(f"Unknown or expired result: {result_id}")
+        
+        record = json.loads(record)
+        kind = record["namespace"]
+        request = self.kinds[kind][1].model_validate(record["request"])
+        return cache, kind, request
+    
+    async def _load_result(self, cache, result_id: str, kind: str, request):
+        """
+        Cached result, or the same simulation run again (without a chart)
+        if the result was evicted while its request is still known
+        """
+        service, _, response_model = self.kinds[kind]
+        payload = await cache.fetch(result_id)
+        if payload is not None:
+            return response_model.model_validate_json(payload)
+        return await get_executor().run(service.simulate, request, False)
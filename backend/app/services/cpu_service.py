@@ -4,14 +4,10 @@ from app.models.requests import CPUSchedulingRequest, ProcessInput
 from app.models.responses import (
     CPUSchedulingResponse, CPUMetrics, ProcessResult, TimelineEvent
 )
-from app.utils.visualization import generate_gantt_chart_base64
-from typing import List, Tuple
-from app.models.requests import CPUSchedulingRequest, ProcessInput
-from app.models.responses import (
-    CPUSchedulingResponse, CPUMetrics, ProcessResult, TimelineEvent
-)
-from app.utils.visualization import generate_gantt_chart_base64
-from typing import List, Tuple
+from app.utils.visualization import generate_gantt_chart_base64, gantt_figure
+from app.utils.cache import charts_by_id
+from matplotlib.figure import Figure
+from typing import List, Optional, Tuple
 
 class CPUSchedulingService:
     """Service for CPU scheduling algorithms"""
@@ -25,36 +21,33 @@ class CPUSchedulingService:
             "RoundRobin": round_robin
         }
     
-    def simulate(self, request: CPUSchedulingRequest) -> CPUSchedulingResponse:
-        """Run CPU scheduling simulation"""
+    def simulate(
+        self, 
+        request: CPUSchedulingRequest, 
+        include_chart: Optional[bool] = None
+    ) -> CPUSchedulingResponse:
+        """Run CPU scheduling simulation (include_chart defaults to the request's flag, or on without the cache)"""
+        if include_chart is None:
+            include_chart = request.include_chart or not charts_by_id()
         
         # Convert input to Process objects
         processes = self._convert_to_processes(request.processes)
         
-        # Get algorithm function
-        algo_func = self.algorithms.get(request.algorithm)
-        if not algo_func:
-            raise ValueError(f"Unknown algorithm: {request.algorithm}")
-        
-        # Execute algorithm
-        if request.algorithm == "RoundRobin":
-            result_processes, gantt = algo_func(processes, request.time_quantum)
-        else:
-            result_processes, gantt = algo_func(processes)
-        
-        # Compute metrics
-        for p in result_processes:
-            p.compute_times()
+        result_processes, gantt = self._execute(
+            request.algorithm, processes, request.time_quantum
+        )
         
         metrics = self._calculate_metrics(result_processes, gantt)
         timeline = self._build_timeline(gantt)
         process_results = self._build_process_results(result_processes)
         
         # Generate chart
-        gantt_base64 = generate_gantt_chart_base64(
-            timeline, 
-            request.algorithm
-        )
+        gantt_base64 = None
+        if include_chart:
+            gantt_base64 = generate_gantt_chart_base64(
+                timeline, 
+                request.algorithm
+            )
         
         return CPUSchedulingResponse(
             algorithm=request.algorithm,
@@ -64,6 +57,54 @@ class CPUSchedulingService:
             gantt_chart=gantt_base64
         )
     
+    def chart_figure(
+        self,
+        request: CPUSchedulingRequest,
+        response: CPUSchedulingResponse
+    ) -> Figure:
+        """Gantt chart figure of an existing result"""
+        return gantt_figure(response.timeline, request.algorithm)
+    
+    def sort_arrivals(self, inputs: List[ProcessInput]) -> List[Tuple[int, int, int, int]]:
+        """
+        Flatten validated processes to (pid, arrival, burst, priority) rows
+        in arrival order, once for every algorithm being compared
+        
+        The algorithms sort by arrival with a stable sort, so pre-sorted rows
+        give the same schedules and their own sort becomes a linear pass.
+        """
+        return sorted(
+            ((p.pid, p.arrival, p.burst, p.priority) for p in inputs),
+            key=lambda row: row[1]
+        )
+    
+    def compare_one(
+        self,
+        algorithm: str,
+        rows: List[Tuple[int, int, int, int]],
+        time_quantum: int
+    ) -> CPUMetrics:
+        """Metrics only for one algorithm, no timeline or chart"""
+        # Algorithms mutate their processes, so each run gets fresh ones
+        processes = [Process(*row) for row in rows]
+        result_processes, gantt = self._execute(algorithm, processes, time_quantum)
+        return self._calculate_metrics(result_processes, gantt)
+    
+    def _execute(self, algorithm: str, processes: List[Process], time_quantum) -> Tuple[List[Process], List[Tuple]]:
+        """Run one algorithm and fill in per-process times"""
+        algo_func = self.algorithms.get(algorithm)
+        if not algo_func:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        
+        if algorithm == "RoundRobin":
+            result_processes, gantt = algo_func(processes, time_quantum)
+        else:
+            result_processes, gantt = algo_func(processes)
+        
+        for p in result_processes:
+            p.compute_times()
+        return result_processes, gantt
+    
     def _convert_to_processes(self, inputs: List[ProcessInput]) -> List[Process]:
         """Convert Pydantic models to Process objects"""
         return [
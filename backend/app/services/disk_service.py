@@ -1,15 +1,25 @@
-from app.algorithms.disk_scheduling import fcfs_disk, sstf, scan, cscan, look, clook
-from app.models.requests import DiskSchedulingRequest
-from app.models.responses import (
-    DiskSchedulingResponse, DiskMetrics, DiskSeekStep
+from app.algorithms.disk_scheduling import (
+    fcfs_disk, sstf, scan, cscan, look, clook, sptf, simulate_arrivals, DriveModel,
+    sptf_order, request_angles, positioning_profile, merge_requests,
+    TraceReader, TraceReplay, compare_schedules, deadline_expired
+)
+from app.algorithms.disk_scheduling.kernels import seek_profile
+from app.models.requests import (
+    DiskSchedulingRequest, DynamicDiskSchedulingRequest, DriveModelInput,
+    TraceReplayRequest, DiskCompareRequest
 )
-from app.utils.visualization import generate_disk_chart_base64
-from typing import List
 from app.models.responses import (
-    DiskSchedulingResponse, DiskMetrics, DiskSeekStep
+    DiskSchedulingResponse, DiskMetrics, DiskSeekStep, DiskTimingMetrics,
+    PositioningComparison, MergeStats,
+    DynamicDiskSchedulingResponse, DynamicDiskMetrics, TimedRequestResult,
+    TraceReplayResponse, TraceMetrics, DiskComparisonResponse
 )
-from app.utils.visualization import generate_disk_chart_base64
-from typing import List
+import base64
+import numpy as np
+from app.utils.visualization import generate_disk_chart_base64, disk_figure
+from app.utils.cache import charts_by_id
+from matplotlib.figure import Figure
+from typing import List, Optional, Tuple
 
 class DiskSchedulingService:
     """Service for disk scheduling algorithms"""
@@ -21,53 +31,427 @@ class DiskSchedulingService:
             "SCAN": scan,
             "C-SCAN": cscan,
             "LOOK": look,
-            "C-LOOK": clook
+            "C-LOOK": clook,
+            "SPTF": sptf
         }
         self.directional_algos = {"SCAN", "C-SCAN", "LOOK", "C-LOOK"}
     
-    def simulate(self, request: DiskSchedulingRequest) -> DiskSchedulingResponse:
-        """Run disk scheduling simulation"""
+    def simulate(
+        self, 
+        request: DiskSchedulingRequest, 
+        include_chart: Optional[bool] = None
+    ) -> DiskSchedulingResponse:
+        """Run disk scheduling simulation (include_chart defaults to the request's flag, or on without the cache)"""
+        if include_chart is None:
+            include_chart = request.include_chart or not charts_by_id()
         
         # Get algorithm function
         algo_func = self.algorithms.get(request.algorithm)
         if not algo_func:
             raise ValueError(f"Unknown algorithm: {request.algorithm}")
         
-        # Execute algorithm
+        # Merge stage in front of the scheduler
+        queue = request.cylinders
+        if request.merge:
+            merged = merge_requests(
+                [(b.sector, b.length) for b in request.block_requests]
+            )
+            queue = [sector // request.sectors_per_cylinder for sector, _, _ in merged]
+        
+        # SPTF needs rotational positions, so it is timed on its own path
+        if request.algorithm == "SPTF":
+            response = self._simulate_sptf(request, queue, include_chart)
+        else:
+            response = self._simulate_seek(request, queue, include_chart)
+        
+        if request.merge:
+            unmerged = self._schedule(request, request.cylinders)
+            seek_without = int(seek_profile(unmerged, request.initial_head)[0].sum())
+            seek_with = response.metrics.total_seek
+            response.merge = MergeStats(
+                original_requests=len(request.block_requests),
+                merged_requests=len(queue),
+                request_reduction=round(
+                    (1 - len(queue) / len(request.block_requests)) * 100, 2
+                ),
+                seek_without_merge=seek_without,
+                seek_with_merge=seek_with,
+                seek_savings=seek_without - seek_with
+            )
+        
+        return response
+    
+    def chart_figure(
+        self,
+        request: DiskSchedulingRequest,
+        response: DiskSchedulingResponse
+    ) -> Figure:
+        """Head movement and seek figure of an existing result"""
+        return disk_figure(
+            response.sequence,
+            request.initial_head,
+            request.disk_size,
+            request.algorithm
+        )
+    
+    def compare(self, request: DiskCompareRequest) -> DiskComparisonResponse:
+        """Seek metrics for several algorithms from one shared sort of the queue"""
+        algorithms = list(dict.fromkeys(request.algorithms))
+        sequences = compare_schedules(
+            request.request_queue,
+            request.initial_head,
+            request.direction,
+            algorithms
+        )
+        
+        comparison = {
+            algo: self._summarize_seeks(seek_profile(sequence, request.initial_head)[0])
+            for algo, sequence in sequences.items()
+        }
+        
+        charts = None
+        if request.include_charts:
+            charts = {
+                algo: generate_disk_chart_base64(
+                    sequence.tolist(),
+                    request.initial_head,
+                    request.disk_size,
+                    algo
+                )
+                for algo, sequence in sequences.items()
+            }
+        
+        return DiskComparisonResponse(
+            initial_head=request.initial_head,
+            direction=request.direction,
+            total_requests=len(request.request_queue),
+            comparison=comparison,
+            best=min(algorithms, key=lambda algo: comparison[algo].total_seek),
+            charts=charts
+        )
+    
+    def _schedule(self, request: DiskSchedulingRequest, queue: List[int]) -> List[int]:
+        """Service order of a queue under the requested algorithm"""
+        algo_func = self.algorithms[request.algorithm]
+        
+        if request.algorithm == "SPTF":
+            drive_input = request.drive or DriveModelInput()
+            drive = DriveModel(cylinders=request.disk_size, **drive_input.model_dump())
+            return algo_func(queue, request.initial_head, drive)
+        
         if request.algorithm in self.directional_algos:
             if request.algorithm in ["SCAN", "C-SCAN"]:
-                sequence = algo_func(
-                    request.request_queue,
+                return algo_func(
+                    queue,
                     request.initial_head,
                     request.direction,
                     request.disk_size
                 )
-            else:  # LOOK, C-LOOK
-                sequence = algo_func(
-                    request.request_queue,
-                    request.initial_head,
-                    request.direction
-                )
-        else:
-            sequence = algo_func(request.request_queue, request.initial_head)
+            # LOOK, C-LOOK
+            return algo_func(queue, request.initial_head, request.direction)
+        
+        return algo_func(queue, request.initial_head)
+    
+    def _simulate_seek(
+        self, 
+        request: DiskSchedulingRequest, 
+        queue: List[int], 
+        include_chart: bool = True
+    ) -> DiskSchedulingResponse:
+        """Schedule a queue and report seek metrics"""
+        sequence = self._schedule(request, queue)
+        
+        # Estimate physical service times from the drive model
+        timing = None
+        if request.drive is not None:
+            drive = DriveModel(cylinders=request.disk_size, **request.drive.model_dump())
+            timing = self._calculate_timing(sequence, request.initial_head, drive)
+        
+        return self._build_response(request, sequence, include_chart, timing=timing)
+    
+    def _build_response(
+        self, 
+        request: DiskSchedulingRequest, 
+        sequence: List[int], 
+        include_chart: bool = True, 
+        **extra
+    ) -> DiskSchedulingResponse:
+        """Assemble a full (trace + chart) or compact (packed seeks) response"""
+        if request.response_mode == "compact":
+            seeks, _ = seek_profile(sequence, request.initial_head)
+            return DiskSchedulingResponse(
+                algorithm=request.algorithm,
+                metrics=self._summarize_seeks(seeks),
+                sequence=sequence,
+                packed_seeks=base64.b64encode(seeks.astype('<u4').tobytes()).decode('ascii'),
+                **extra
+            )
         
         # Calculate metrics
         metrics, trace = self._calculate_metrics(sequence, request.initial_head)
         
         # Generate visualization
-        visualization = generate_disk_chart_base64(
-            sequence,
-            request.initial_head,
-            request.disk_size,
-            request.algorithm
-        )
+        visualization = None
+        if include_chart:
+            visualization = generate_disk_chart_base64(
+                sequence,
+                request.initial_head,
+                request.disk_size,
+                request.algorithm
+            )
         
         return DiskSchedulingResponse(
             algorithm=request.algorithm,
             metrics=metrics,
             sequence=sequence,
             trace=trace,
-            visualization=visualization
+            visualization=visualization,
+            **extra
+        )
+    
+    def _simulate_sptf(
+        self, 
+        request: DiskSchedulingRequest, 
+        queue: List[int], 
+        include_chart: bool = True
+    ) -> DiskSchedulingResponse:
+        """Run SPTF and compare its throughput with SSTF on the same queue"""
+        drive_input = request.drive or DriveModelInput()
+        drive = DriveModel(cylinders=request.disk_size, **drive_input.model_dump())
+        angles = request_angles(len(queue), request.request_sectors, drive.sectors_per_track)
+        
+        order = sptf_order(queue, angles, request.initial_head, drive)
+        sequence = [queue[i] for i in order]
+        sptf_seeks, sptf_waits = positioning_profile(
+            sequence, [angles[i] for i in order], request.initial_head, drive
+        )
+        
+        # SSTF services duplicates in queue order, so map values back to indices
+        positions = {}
+        for i, cylinder in enumerate(queue):
+            positions.setdefault(cylinder, []).append(i)
+        for indices in positions.values():
+            indices.reverse()
+        sstf_sequence = sstf(queue, request.initial_head)
+        sstf_angles = [angles[positions[c].pop()] for c in sstf_sequence]
+        sstf_seeks, sstf_waits = positioning_profile(
+            sstf_sequence, sstf_angles, request.initial_head, drive
+        )
+        
+        timing = self._positioning_timing(sptf_seeks, sptf_waits, drive)
+        sstf_timing = self._positioning_timing(sstf_seeks, sstf_waits, drive)
+        
+        return self._build_response(
+            request,
+            sequence,
+            include_chart,
+            timing=timing,
+            positioning=PositioningComparison(
+                sptf_total_time=timing.total_service_time,
+                sstf_total_time=sstf_timing.total_service_time,
+                sptf_throughput=timing.throughput,
+                sstf_throughput=sstf_timing.throughput,
+                throughput_gain=round(
+                    (timing.throughput / sstf_timing.throughput - 1) * 100, 2
+                ) if sstf_timing.throughput > 0 else 0
+            )
+        )
+    
+    def _positioning_timing(
+        self, 
+        seek_times: List[float], 
+        rotation_waits: List[float], 
+        drive: DriveModel
+    ) -> DiskTimingMetrics:
+        """Calculate timing metrics from actual seek and rotational delays"""
+        seeks = np.asarray(seek_times)
+        waits = np.asarray(rotation_waits)
+        service_times = seeks + waits + drive.transfer_time
+        total = float(service_times.sum())
+        count = len(service_times)
+        
+        return DiskTimingMetrics(
+            total_service_time=round(total, 4),
+            avg_service_time=round(total / count, 4) if count else 0,
+            max_service_time=round(float(service_times.max()), 4) if count else 0,
+            total_seek_time=round(float(seeks.sum()), 4),
+            rotational_latency=round(float(waits.mean()), 4) if count else 0,
+            transfer_time=round(drive.transfer_time, 4),
+            throughput=round(count / total * 1000, 4) if total > 0 else 0
+        )
+    
+    def open_trace(self, request: TraceReplayRequest) -> Tuple[TraceReader, TraceReplay]:
+        """Create the streaming parser and replay state for a trace"""
+        reader = TraceReader(request.format)
+        replay = TraceReplay(
+            algorithm=request.algorithm,
+            initial_head=request.initial_head,
+            cylinders=request.cylinders,
+            sectors_per_cylinder=request.sectors_per_cylinder,
+            window=request.window,
+            direction=request.direction
+        )
+        return reader, replay
+    
+    def feed_trace(self, reader: TraceReader, replay: TraceReplay, chunk: bytes):
+        """Parse and replay one chunk of a streamed trace"""
+        replay.add(*reader.feed(chunk))
+    
+    def finish_trace(
+        self, 
+        request: TraceReplayRequest, 
+        reader: TraceReader, 
+        replay: TraceReplay
+    ) -> TraceReplayResponse:
+        """Flush a streamed trace and summarize it"""
+        replay.add(*reader.close())
+        replay.close()
+        if not replay.requests:
+            raise ValueError("Trace contains no requests")
+        
+        p50, p90, p99, p100 = replay.seek_percentiles([50, 90, 99, 100])
+        reduction = (
+            (1 - replay.total_seek / replay.fcfs_seek) * 100 if replay.fcfs_seek else 0.0
+        )
+        
+        return TraceReplayResponse(
+            format=request.format,
+            algorithm=request.algorithm,
+            window=request.window,
+            metrics=TraceMetrics(
+                requests=replay.requests,
+                reads=replay.reads,
+                writes=replay.writes,
+                sectors=replay.sectors,
+                out_of_range=replay.out_of_range,
+                duration=round(replay.last_timestamp - replay.first_timestamp, 6),
+                windows=replay.windows,
+                total_seek=replay.total_seek,
+                avg_seek=round(replay.total_seek / replay.requests, 2),
+                p50_seek=p50,
+                p90_seek=p90,
+                p99_seek=p99,
+                max_seek=p100,
+                fcfs_total_seek=replay.fcfs_seek,
+                seek_reduction=round(reduction, 2)
+            )
+        )
+    
+    def simulate_dynamic(
+        self, 
+        request: DynamicDiskSchedulingRequest
+    ) -> DynamicDiskSchedulingResponse:
+        """Run event-driven disk scheduling with arrival times"""
+        served, total_seek = simulate_arrivals(
+            [(r.arrival, r.cylinder) for r in request.requests],
+            request.initial_head,
+            algorithm=request.algorithm,
+            direction=request.direction,
+            disk_size=request.disk_size,
+            seek_time=request.seek_time,
+            service_time=request.service_time,
+            options={
+                "deadline": request.deadline,
+                "fifo_batch": request.fifo_batch,
+                "batch_size": request.batch_size
+            }
+        )
+        
+        metrics = self._calculate_response_metrics(
+            served, total_seek, request.starvation_threshold
+        )
+        if request.algorithm == "Deadline":
+            # Same test the scheduler uses to let a request jump the queue
+            metrics.deadline_misses = sum(
+                1 for r in served if deadline_expired(r.arrival, r.start, request.deadline)
+            )
+        
+        return DynamicDiskSchedulingResponse(
+            algorithm=request.algorithm,
+            metrics=metrics,
+            sequence=[r.cylinder for r in served],
+            requests=[
+                TimedRequestResult(
+                    arrival=r.arrival,
+                    cylinder=r.cylinder,
+                    start=round(r.start, 4),
+                    finish=round(r.finish, 4),
+                    response_time=round(r.finish - r.arrival, 4)
+                )
+                for r in served
+            ]
+        )
+    
+    def _calculate_response_metrics(
+        self, 
+        served: List, 
+        total_seek: int, 
+        starvation_threshold: float = None
+    ) -> DynamicDiskMetrics:
+        """Calculate response-time percentiles and starvation"""
+        arrival = np.fromiter((r.arrival for r in served), dtype=float, count=len(served))
+        start = np.fromiter((r.start for r in served), dtype=float, count=len(served))
+        finish = np.fromiter((r.finish for r in served), dtype=float, count=len(served))
+        response = finish - arrival
+        
+        p50, p90, p95, p99 = np.percentile(response, [50, 90, 95, 99])
+        if starvation_threshold is None:
+            starvation_threshold = 4 * float(response.mean())
+        
+        return DynamicDiskMetrics(
+            total_seek=int(total_seek),
+            total_requests=len(served),
+            makespan=round(float(finish.max()), 4),
+            avg_response_time=round(float(response.mean()), 4),
+            p50_response_time=round(float(p50), 4),
+            p90_response_time=round(float(p90), 4),
+            p95_response_time=round(float(p95), 4),
+            p99_response_time=round(float(p99), 4),
+            max_response_time=round(float(response.max()), 4),
+            max_wait_time=round(float((start - arrival).max()), 4),
+            starvation_threshold=round(starvation_threshold, 4),
+            starved_requests=int((response > starvation_threshold).sum())
+        )
+    
+    def _calculate_timing(
+        self, 
+        sequence: List[int], 
+        initial_head: int, 
+        drive: DriveModel
+    ) -> DiskTimingMetrics:
+        """Calculate service time estimates with the drive model"""
+        seek_times = drive.seek_times(sequence, initial_head)
+        service_times = seek_times + (drive.rotational_latency + drive.transfer_time)
+        total = float(service_times.sum())
+        
+        return DiskTimingMetrics(
+            total_service_time=round(total, 4),
+            avg_service_time=round(total / len(sequence), 4) if sequence else 0,
+            max_service_time=round(float(service_times.max()), 4) if sequence else 0,
+            total_seek_time=round(float(seek_times.sum()), 4),
+            rotational_latency=round(drive.rotational_latency, 4),
+            transfer_time=round(drive.transfer_time, 4),
+            throughput=round(len(sequence) / total * 1000, 4) if total > 0 else 0
+        )
+    
+    def _summarize_seeks(self, seeks: np.ndarray) -> DiskMetrics:
+        """Summary statistics of per-request seek distances"""
+        if not len(seeks):
+            return DiskMetrics(
+                total_seek=0, avg_seek=0, max_seek=0, min_seek=0, total_requests=0
+            )
+        
+        total_seek = int(seeks.sum())
+        p50, p90, p99 = np.percentile(seeks, [50, 90, 99])
+        return DiskMetrics(
+            total_seek=total_seek,
+            avg_seek=round(total_seek / len(seeks), 2),
+            max_seek=int(seeks.max()),
+            min_seek=int(seeks.min()),
+            total_requests=len(seeks),
+            p50_seek=round(float(p50), 2),
+            p90_seek=round(float(p90), 2),
+            p99_seek=round(float(p99), 2)
         )
     
     def _calculate_metrics(
@@ -76,32 +460,31 @@ class DiskSchedulingService:
         initial_head: int
     ) -> tuple[DiskMetrics, List[DiskSeekStep]]:
         """Calculate disk scheduling metrics"""
-        total_seek = 0
-        seeks = []
-        trace = []
-        
-        current = initial_head
-        for i, pos in enumerate(sequence):
-            seek = abs(pos - current)
-            seeks.append(seek)
-            total_seek += seek
-            
-            trace.append(DiskSeekStep(
-                step=i + 1,
-                from_cylinder=current,
-                to_cylinder=pos,
-                seek_distance=seek,
-                cumulative_seek=total_seek
-            ))
-            
-            current = pos
+        if not sequence:
+            return DiskMetrics(
+                total_seek=0, avg_seek=0, max_seek=0, min_seek=0, total_requests=0
+            ), []
         
-        metrics = DiskMetrics(
-            total_seek=total_seek,
-            avg_seek=round(total_seek / len(sequence), 2) if sequence else 0,
-            max_seek=max(seeks) if seeks else 0,
-            min_seek=min(seeks) if seeks else 0,
-            total_requests=len(sequence)
-        )
+        # Vectorized seek distances and running totals
+        seeks, cumulative = seek_profile(sequence, initial_head)
+        metrics = self._summarize_seeks(seeks)
+        
+        sources = [initial_head] + list(sequence[:-1])
+        trace = [
+            DiskSeekStep(
+                step=i,
+                from_cylinder=src,
+                to_cylinder=dst,
+                seek_distance=seek,
+                cumulative_seek=cum
+            )
+            for i, src, dst, seek, cum in zip(
+                range(1, len(sequence) + 1),
+                sources,
+                sequence,
+                seeks.tolist(),
+                cumulative.tolist()
+            )
+        ]
         
         return metrics, trace
\ No newline at end of file
@@ -0,0 +1,98 @@
+from app.algorithms.flash_storage import FlashTranslationLayer, replay, generate_writes
+from app.models.requests import FlashSimulationRequest
+from app.models.responses import (
+    FlashSimulationResponse, FlashMetrics, EraseStats, LatencySpike
+)
+import numpy as np
+
+class FlashStorageService:
+    """Service for SSD flash translation layer simulation"""
+
+    def simulate(self, request: FlashSimulationRequest) -> FlashSimulationResponse:
+        """Replay a write trace through the FTL"""
+        ftl = FlashTranslationLayer(
+            blocks=request.blocks,
+            pages_per_block=request.pages_per_block,
+            overprovisioning=request.overprovisioning,
+            gc_policy=request.gc_policy,
+            gc_threshold=request.gc_threshold,
+            wear_leveling=request.wear_leveling,
+            wl_threshold=request.wl_threshold,
+            read_time=request.read_time,
+            program_time=request.program_time,
+            erase_time=request.erase_time
+        )
+
+        if request.workload is not None:
+            workload = request.workload
+            writes = generate_writes(
+                workload.count,
+                ftl.logical_pages,
+                pattern=workload.pattern,
+                hot_fraction=workload.hot_fraction,
+                hot_share=workload.hot_share,
+                seed=workload.seed
+            )
+        else:
+            writes = request.writes
+            if max(writes) >= ftl.logical_pages:
+                raise ValueError(f"Logical pages must be within 0-{ftl.logical_pages - 1}")
+
+        if request.precondition:
+            ftl.precondition()
+        latencies = replay(ftl, writes)
+
+        min_erases, max_erases, mean_erases, std_erases = ftl.erase_stats()
+        return FlashSimulationResponse(
+            gc_policy=request.gc_policy,
+            logical_pages=ftl.logical_pages,
+            metrics=self._calculate_metrics(ftl, latencies),
+            wear=EraseStats(
+                min_erases=min_erases,
+                max_erases=max_erases,
+                mean_erases=round(mean_erases, 4),
+                std_erases=round(std_erases, 4)
+            ),
+            largest_spikes=self._largest_spikes(latencies, ftl.program_time)
+        )
+
+    def _calculate_metrics(
+        self,
+        ftl: FlashTranslationLayer,
+        latencies: np.ndarray
+    ) -> FlashMetrics:
+        """Write amplification and latency percentiles"""
+        p99, p999 = np.percentile(latencies, [99, 99.9])
+        gc = np.asarray(ftl.gc_latencies, dtype=float)
+
+        return FlashMetrics(
+            host_writes=ftl.host_writes,
+            flash_writes=ftl.flash_writes,
+            write_amplification=round(ftl.write_amplification, 4),
+            gc_events=ftl.erases,
+            relocated_pages=ftl.relocated_pages,
+            wear_leveling_migrations=ftl.wl_migrations,
+            avg_write_latency=round(float(latencies.mean()), 4),
+            p99_write_latency=round(float(p99), 4),
+            p999_write_latency=round(float(p999), 4),
+            max_write_latency=round(float(latencies.max()), 4),
+            latency_spikes=int((latencies > ftl.program_time).sum()),
+            avg_gc_latency=round(float(gc.mean()), 4) if len(gc) else 0.0,
+            max_gc_latency=round(float(gc.max()), 4) if len(gc) else 0.0
+        )
+
+    def _largest_spikes(
+        self,
+        latencies: np.ndarray,
+        program_time: float,
+        count: int = 10
+    ) -> list:
+        """Slowest GC-stalled writes, in trace order"""
+        stalled = np.flatnonzero(latencies > program_time)
+        if len(stalled) > count:
+            top = np.argpartition(latencies[stalled], -count)[-count:]
+            stalled = np.sort(stalled[top])
+        return [
+            LatencySpike(write_index=int(i), latency=round(float(latencies[i]), 4))
+            for i in stalled
+        ]
@@ -1,15 +1,18 @@
-from app.algorithms.page_replacement import fifo, lru, optimal, lfu
-from app.models.requests import PageReplacementRequest
-from app.models.responses import (
-    PageReplacementResponse, PageMetrics, PageTraceStep
+from app.algorithms.page_replacement import (
+    fifo, lru, optimal, lfu, FaultRateWindow, multiprocess_replacement,
+    compare_policies
+)
+from app.models.requests import (
+    PageReplacementRequest, MultiProcessMemoryRequest, PageCompareRequest
 )
-from app.utils.visualization import generate_page_chart_base64
-from typing import List, Tuple
 from app.models.responses import (
-    PageReplacementResponse, PageMetrics, PageTraceStep
+    PageReplacementResponse, PageMetrics, PageTraceStep,
+    MultiProcessMemoryResponse, ProcessFaultStats, PageComparisonResponse
 )
-from app.utils.visualization import generate_page_chart_base64
-from typing import List, Tuple
+from app.utils.visualization import generate_page_chart_base64, page_figure
+from app.utils.cache import charts_by_id
+from matplotlib.figure import Figure
+from typing import List, Optional, Tuple
 
 class PageReplacementService:
     """Service for page replacement algorithms"""
@@ -22,18 +25,30 @@ class PageReplacementService:
             "LFU": lfu
         }
     
-    def simulate(self, request: PageReplacementRequest) -> PageReplacementResponse:
-        """Run page replacement simulation"""
+    def simulate(
+        self, 
+        request: PageReplacementRequest, 
+        include_chart: Optional[bool] = None
+    ) -> PageReplacementResponse:
+        """Run page replacement simulation (include_chart defaults to the request's flag, or on without the cache)"""
+        if include_chart is None:
+            include_chart = request.include_chart or not charts_by_id()
         
         # Get algorithm function
         algo_func = self.algorithms.get(request.algorithm)
         if not algo_func:
             raise ValueError(f"Unknown algorithm: {request.algorithm}")
         
+        # Track windowed fault rate while the algorithm runs
+        fault_window = None
+        if request.fault_rate_window is not None:
+            fault_window = FaultRateWindow(request.fault_rate_window)
+        
         # Execute algorithm
         trace_data, page_faults = algo_func(
             request.page_sequence, 
-            request.frame_count
+            request.frame_count,
+            fault_window=fault_window
         )
         
         # Calculate metrics
@@ -47,20 +62,103 @@ class PageReplacementService:
         trace = self._build_trace(trace_data)
         
         # Generate visualization
-        visualization = generate_page_chart_base64(
-            trace_data,
-            request.page_sequence,
-            request.frame_count,
-            request.algorithm
-        )
+        visualization = None
+        if include_chart:
+            visualization = generate_page_chart_base64(
+                trace_data,
+                request.page_sequence,
+                request.frame_count,
+                request.algorithm
+            )
         
         return PageReplacementResponse(
             algorithm=request.algorithm,
             metrics=metrics,
             trace=trace,
+            fault_rate_timeline=(
+                [round(rate, 2) for rate in fault_window.series]
+                if fault_window is not None else None
+            ),
             visualization=visualization
         )
     
+    def chart_figure(
+        self,
+        request: PageReplacementRequest,
+        response: PageReplacementResponse
+    ) -> Figure:
+        """Frame state and fault figure of an existing result"""
+        return page_figure(
+            [(step.page, step.frames_state, step.status) for step in response.trace],
+            request.page_sequence,
+            request.frame_count,
+            request.algorithm
+        )
+    
+    def compare(self, request: PageCompareRequest) -> PageComparisonResponse:
+        """Fault counts for several policies from one pass over the references"""
+        algorithms = list(dict.fromkeys(request.algorithms))
+        faults = compare_policies(
+            request.page_sequence,
+            request.frame_count,
+            algorithms
+        )
+        
+        return PageComparisonResponse(
+            frame_count=request.frame_count,
+            total_references=len(request.page_sequence),
+            comparison={
+                algo: self._calculate_metrics(
+                    request.page_sequence, faults[algo], request.frame_count
+                )
+                for algo in algorithms
+            },
+            best=min(algorithms, key=faults.get)
+        )
+    
+    def simulate_multiprocess(
+        self, 
+        request: MultiProcessMemoryRequest
+    ) -> MultiProcessMemoryResponse:
+        """Run multi-process page replacement over a shared frame pool"""
+        processes = None
+        if request.processes is not None:
+            processes = {p.pid: (p.size, p.priority) for p in request.processes}
+        
+        process_stats, page_faults = multiprocess_replacement(
+            request.references,
+            request.frame_count,
+            policy=request.policy,
+            scope=request.scope,
+            allocation=request.allocation,
+            processes=processes
+        )
+        
+        metrics = self._calculate_metrics(
+            request.references,
+            page_faults,
+            request.frame_count
+        )
+        
+        return MultiProcessMemoryResponse(
+            policy=request.policy,
+            scope=request.scope,
+            allocation=request.allocation,
+            metrics=metrics,
+            processes=[
+                ProcessFaultStats(
+                    pid=pid,
+                    references=stats['references'],
+                    page_faults=stats['faults'],
+                    fault_ratio=round(
+                        stats['faults'] / stats['references'] * 100, 2
+                    ) if stats['references'] else 0,
+                    frames=stats['frames']
+                )
+                for pid, stats in sorted(process_stats.items())
+            ]
+        )
+    
     def _calculate_metrics(
         self, 
         references: List[int], 
@@ -0,0 +1,416 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from fastapi import Response, status
+from pydantic import BaseModel
+from app.config import get_settings
+
+# SQLite writes between sweeps of expired and over-budget rows
+PRUNE_INTERVAL = 64
+
+class ResultCache:
+    """
+    Content-addressed cache of simulation responses
+
+    Simulations are pure functions of their validated request, so a result
+    is stored under a SHA-256 of the request's canonical JSON (sorted keys,
+    no whitespace) and the simulator version, and reused for any identical
+    request. Entries are the serialized response bytes; the memory tier
+    evicts least recently used entries once their total size exceeds
+    `max_bytes`, and every entry expires `ttl` seconds after it was stored.
+
+    With `path` set, entries are also written to a SQLite file and looked
+    up there on a memory miss, so results survive restarts. Writes are
+    handed to a single background thread (write-behind), so storing a
+    result never waits for a commit on the caller's thread. `fetch` runs
+    its SQLite lookups on that thread too (behind any queued writes of the
+    key), so only the memory tier is consulted on the event loop. Every
+    PRUNE_INTERVAL writes that thread drops expired rows and then the
+    oldest rows until the file's payloads fit in `disk_max_bytes`.
+
+    An entry can be stored with a companion key (e.g. the request behind a
+    result). Using or storing the entry also refreshes its companion, so
+    the companion is never evicted while the entry itself is cached.
+
+    Args:
+        max_bytes: Memory budget for cached payloads
+        ttl: Seconds an entry stays valid (0 = no expiry)
+        path: Optional SQLite file for the persistent tier
+        disk_max_bytes: Payload budget of the persistent tier
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttl=3600, path=None,
+                 disk_max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries = OrderedDict()  # key -> (expires, payload)
+        self._companions = {}          # key -> companion key refreshed with it
+        self._lock = threading.Lock()
+        self._db = None
+        self._writer = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            # WAL lets lookups read while the writer thread commits
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, expires REAL, payload BLOB)"
+            )
+            self._db.commit()
+            self._write_db = sqlite3.connect(path, check_same_thread=False)
+            self._writes = 0
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cache-writer')
+            self._writer.submit(self._prune)
+
+    @staticmethod
+    def key(namespace: str, request: BaseModel) -> str:
+        """Canonical hash of a validated request"""
+        canonical = json.dumps(
+            {
+                "namespace": namespace,
+                "version": get_settings().app_version,
+                "request": request.model_dump(mode='json')
+            },
+            sort_keys=True,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Cached payload, or None on a miss or expired entry
+
+        Blocks on SQLite after a memory miss; use fetch on the event loop.
+        """
+        payload = self._lookup(key)
+        if payload is None and self._db is not None:
+            payload = self._load(self._db, key)
+        return self._count(payload)
+
+    async def fetch(self, key: str) -> Optional[bytes]:
+        """Like get, but a SQLite lookup runs on the writer thread"""
+        payload = self._lookup(key)
+        if payload is None and self._writer is not None:
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(self._writer, self._load, self._write_db, key)
+        return self._count(payload)
+
+    def put(self, key: str, payload: bytes, companion: Optional[str] = None):
+        """Store a payload, evicting least recently used entries if needed"""
+        expires = time.time() + self.ttl if self.ttl else 0
+        with self._lock:
+            if companion is not None:
+                self._companions[key] = companion
+            self._store(key, expires, payload)
+        if self._writer is not None:
+            self._writer.submit(self._write, key, expires, payload)
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._entries.clear()
+            self._companions.clear()
+            self.bytes = 0
+        if self._writer is not None:
+            self._writer.submit(self._execute, "DELETE FROM results").result()
+
+    def flush(self):
+        """Wait until queued writes have reached the persistent tier"""
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and memory usage"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+                "evictions": self.evictions,
+                "persistent": self._db is not None
+            }
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+            self._write_db.close()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _lookup(self, key):
+        """Memory tier payload, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, payload = entry
+            if expires and expires <= time.time():
+                self._remove(key)
+                self._companions.pop(key, None)
+                return None
+            self._touch(key)
+            return payload
+
+    def _load(self, db, key):
+        """SQLite tier payload (promoted to memory), or None"""
+        row = db.execute(
+            "SELECT expires, payload FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        expires, payload = row[0], bytes(row[1])
+        if expires and expires <= time.time():
+            self._writer.submit(self._delete_expired, key)
+            return None
+        with self._lock:
+            self._store(key, expires, payload)
+        return payload
+
+    def _count(self, payload):
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return payload
+
+    # Writer thread only: these use the write connection
+
+    def _execute(self, sql, params=()):
+        self._write_db.execute(sql, params)
+        self._write_db.commit()
+
+    def _write(self, key, expires, payload):
+        self._execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (key, expires, payload))
+        self._writes += 1
+        if self._writes % PRUNE_INTERVAL == 0:
+            self._prune()
+
+    def _delete_expired(self, key):
+        # Checked again here: a newer write of the key may have been queued first
+        self._execute(
+            "DELETE FROM results WHERE key = ? AND expires != 0 AND expires <= ?",
+            (key, time.time())
+        )
+
+    def _prune(self):
+        """Drop expired rows, then the oldest rows beyond disk_max_bytes"""
+        db = self._write_db
+        db.execute("DELETE FROM results WHERE expires != 0 AND expires <= ?", (time.time(),))
+        excess = db.execute(
+            "SELECT COALESCE(SUM(length(payload)), 0) FROM results"
+        ).fetchone()[0] - self.disk_max_bytes
+        if excess > 0:
+            # Replaced rows get a new rowid, so rowid order is write order
+            last = None
+            for rowid, size in db.execute(
+                "SELECT rowid, length(payload) FROM results ORDER BY rowid"
+            ):
+                last = rowid
+                excess -= size
+                if excess <= 0:
+                    break
+            db.execute("DELETE FROM results WHERE rowid <= ?", (last,))
+        db.commit()
+
+    def _store(self, key, expires, payload):
+        if len(payload) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (expires, payload)
+        self.bytes += len(payload)
+        self._touch(key)
+        while self.bytes > self.max_bytes:
+            evicted_key, (_, evicted) = self._entries.popitem(last=False)
+            self._companions.pop(evicted_key, None)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def _touch(self, key):
+        """Mark key (and its companion) most recently used"""
+        self._entries.move_to_end(key)
+        companion = self._companions.get(key)
+        if companion in self._entries:
+            self._entries.move_to_end(companion)
+
+    def _remove(self, key):
+        _, payload = self._entries.pop(key)
+        self.bytes -= len(payload)
+
+_cache = None
+_in_flight = {}  # request key -> task computing it
+_coalesced = 0
+
+def get_cache() -> Optional[ResultCache]:
+    """Shared result cache, or None when caching is disabled"""
+    global _cache
+    settings = get_settings()
+    if not settings.cache_enabled:
+        return None
+    if _cache is None:
+        _cache = ResultCache(
+            max_bytes=settings.cache_max_bytes,
+            ttl=settings.cache_ttl,
+            path=settings.cache_path,
+            disk_max_bytes=settings.cache_disk_max_bytes
+        )
+    return _cache
+
+def shutdown_cache():
+    """Close the persistent tier (application shutdown)"""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+def charts_by_id() -> bool:
+    """
+    True when charts are served later by result ID
+
+    That needs the result cache; with caching disabled there is no result
+    ID to fetch a chart with, so simulations embed their chart instead.
+    """
+    return get_settings().cache_enabled
+
+def coalesced_requests() -> int:
+    """Requests that awaited an identical in-flight simulation"""
+    return _coalesced
+
+def request_etag(namespace: str, request: BaseModel) -> str:
+    """Strong ETag of a simulation: its cache key, which covers the simulator version"""
+    return f'"{ResultCache.key(namespace, request)[:32]}"'
+
+def conditional_response(
+    namespace: str,
+    request: BaseModel,
+    if_none_match: Optional[str],
+    response: Response
+) -> Optional[Response]:
+    """
+    HTTP conditional caching for a deterministic simulation
+
+    Sets ETag and Cache-Control on the outgoing response. When the client
+    already holds the current version, as shown by a matching If-None-Match,
+    returns a 304 to send instead, without simulating. Browsers and proxies
+    do not reuse or revalidate POST responses on their own, so the header is
+    `no-cache` and the client has to send If-None-Match itself.
+
+    Returns:
+        not_modified: 304 response, or None to go ahead and simulate
+    """
+    return etag_response(request_etag(namespace, request), if_none_match, response, shared=False)
+
+def etag_response(
+    etag: str,
+    if_none_match: Optional[str],
+    response: Response,
+    shared: bool = True
+) -> Optional[Response]:
+    """Set ETag/Cache-Control on response; a 304 if If-None-Match already matches"""
+    headers = cache_headers(etag, shared)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def cache_headers(etag: str, shared: bool = True) -> dict:
+    """
+    ETag and Cache-Control headers for a deterministic response
+
+    GET responses (shared) may be reused by browsers and proxies for
+    http_max_age seconds; others must be revalidated with If-None-Match.
+    """
+    if shared:
+        cache_control = f"public, max-age={get_settings().http_max_age}"
+    else:
+        cache_control = "no-cache"
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    True when an If-None-Match header lists etag (or *)
+
+    Uses weak comparison (RFC 7232, section 3.2): a `W/` prefix is ignored,
+    since proxies that transform the body (e.g. gzip) weaken the ETag.
+    """
+    if if_none_match is None:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates or "*" in candidates
+
+async def run_cached(namespace: str, request: BaseModel, response_model, compute):
+    """
+    Serve a simulation from the cache, or compute and store it
+
+    Stored results carry their cache key as `result_id`, which the chart
+    endpoint uses to render charts after the fact.
+
+    Concurrent identical requests are coalesced: the first miss starts the
+    computation as a task keyed by the request hash, and duplicates that
+    arrive while it runs await that same task instead of simulating again.
+    The task is shielded, so a caller disconnecting does not cancel the
+    work the others are waiting for.
+
+    Args:
+        namespace: Simulation kind, part of the key
+        request: Validated request model
+        response_model: Response class used to rebuild cached payloads
+        compute: Coroutine function producing the response on a miss
+
+    Returns:
+        response: Instance of response_model
+    """
+    global _coalesced
+    cache = get_cache()
+    key = ResultCache.key(namespace, request)
+    if cache is not None:
+        payload = await cache.fetch(key)
+        if payload is not None:
+            return response_model.model_validate_json(payload)
+
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _compute_and_store(cache, namespace, request, key, compute)
+        )
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    else:
+        _coalesced += 1
+    return await asyncio.shield(task)
+
+async def _compute_and_store(cache, namespace, request, key, compute):
+    result = await compute()
+    if cache is not None:
+        # The request is kept as the result's companion so its chart can be
+        # rendered later; it is written second so the SQLite tier prunes it last
+        result.result_id = key
+        record = request_record_key(key)
+        cache.put(key, result.model_dump_json().encode(), companion=record)
+        cache.put(record, json.dumps({
+            "namespace": namespace,
+            "request": request.model_dump(mode='json')
+        }).encode())
+    return result
+
+def request_record_key(result_id: str) -> str:
+    """Cache key of the request that produced a result"""
+    return f"request:{result_id}"
@@ -0,0 +1,107 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from app.config import get_settings
+
+class SimulationBusyError(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+    pass
+
+class SimulationExecutor:
+    """
+    Bounded worker pool for CPU-bound simulations and chart rendering
+
+    Work is submitted from the event loop and awaited, so a heavy request no
+    longer blocks other requests on the same worker. At most
+    `workers + queue_limit` calls are admitted at once; beyond that, calls
+    fail fast with SimulationBusyError instead of queueing without bound.
+
+    Args:
+        kind: 'thread' or 'process'
+        workers: Pool size
+        queue_limit: Calls allowed to wait for a free worker
+    """
+
+    def __init__(self, kind='thread', workers=4, queue_limit=32):
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.in_flight = 0
+        self.rejected = 0
+
+        if kind == 'process':
+            self.pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='simulation')
+        self._threads = None
+
+    async def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) on the pool and await its result"""
+        return await self._submit(self.pool, fn, args, kwargs)
+
+    async def run_threaded(self, fn, *args, **kwargs):
+        """
+        Like run, but always on a thread
+
+        For calls that mutate objects owned by the caller (e.g. a streaming
+        trace replay), which a process pool would only see a copy of.
+        """
+        if self.kind == 'thread':
+            return await self._submit(self.pool, fn, args, kwargs)
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix='simulation'
+            )
+        return await self._submit(self._threads, fn, args, kwargs)
+
+    async def _submit(self, pool, fn, args, kwargs):
+        if self.in_flight >= self.workers + self.queue_limit:
+            self.rejected += 1
+            raise SimulationBusyError("Simulation queue is full, retry later")
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, partial(fn, *args, **kwargs))
+        finally:
+            self.in_flight -= 1
+
+    def shutdown(self):
+        """Wait for running work and release the workers"""
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        if self._threads is not None:
+            self._threads.shutdown(wait=True, cancel_futures=True)
+
+_executor = None
+_batch_pool = None
+
+def get_executor() -> SimulationExecutor:
+    """Shared executor, created on first use from the settings"""
+    global _executor
+    if _executor is None:
+        settings = get_settings()
+        _executor = SimulationExecutor(
+            kind=settings.executor_kind,
+            workers=settings.executor_workers,
+            queue_limit=settings.executor_queue_limit
+        )
+    return _executor
+
+def get_batch_pool() -> ProcessPoolExecutor:
+    """Process pool for batch simulations, one worker per core by default"""
+    global _batch_pool
+    if _batch_pool is None:
+        _batch_pool = ProcessPoolExecutor(max_workers=get_settings().batch_workers)
+    return _batch_pool
+
+def shutdown_executor():
+    """Shut the shared executor and batch pool down (application shutdown)"""
+    global _executor, _batch_pool
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+    if _batch_pool is not None:
+        _batch_pool.shutdown(wait=True, cancel_futures=True)
+        _batch_pool = None
@@ -0,0 +1,63 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+client = TestClient(app)
+
+SCENARIOS = [
+    {
+        "kind": "cpu",
+        "request": {
+            "algorithm": "RoundRobin",
+            "time_quantum": 2,
+            "processes": [
+                {"pid": 1, "arrival": 0, "burst": 5},
+                {"pid": 2, "arrival": 1, "burst": 3}
+            ]
+        }
+    },
+    {
+        "kind": "page",
+        "request": {"algorithm": "LRU", "page_sequence": [7, 0, 1, 2, 0, 3, 0, 4], "frame_count": 3}
+    },
+    {
+        "kind": "disk",
+        "request": {"algorithm": "SSTF", "request_queue": [98, 183, 37, 122], "initial_head": 53}
+    },
+    {
+        "kind": "disk",
+        "request": {"algorithm": "FCFS", "request_queue": [10, 20], "initial_head": 5, "direction": "left"}
+    }
+]
+
+def test_batch_results_in_order():
+    """Test mixed scenarios come back in request order without charts"""
+    response = client.post("/api/simulate/batch/", json={"scenarios": SCENARIOS})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 4
+    assert data["failed"] == 0
+    assert [r["index"] for r in data["results"]] == [0, 1, 2, 3]
+    assert [r["kind"] for r in data["results"]] == ["cpu", "page", "disk", "disk"]
+    assert data["results"][0]["result"]["gantt_chart"] is None
+    assert data["results"][2]["result"]["metrics"]["total_seek"] == 16 + 61 + 24 + 61
+
+def test_batch_streaming():
+    """Test NDJSON streaming returns every scenario once"""
+    response = client.post(
+        "/api/simulate/batch/", json={"scenarios": SCENARIOS, "stream": True}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1, 2, 3]
+    assert all(line["success"] for line in lines)
+
+def test_batch_rejects_unknown_kind():
+    """Test scenarios are validated up front"""
+    response = client.post(
+        "/api/simulate/batch/",
+        json={"scenarios": [{"kind": "gpu", "request": {}}]}
+    )
+    assert response.status_code == 422
@@ -0,0 +1,191 @@
+import time
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.requests import PageReplacementRequest
+from app.utils.cache import ResultCache, get_cache
+
+client = TestClient(app)
+
+def _request(**overrides):
+    body = {"algorithm": "LRU", "page_sequence": [1, 2, 3, 1], "frame_count": 2}
+    return PageReplacementRequest(**{**body, **overrides})
+
+def test_key_is_canonical():
+    """Test equal requests hash equally regardless of field order"""
+    a = PageReplacementRequest(algorithm="LRU", page_sequence=[1, 2], frame_count=2)
+    b = PageReplacementRequest(frame_count=2, page_sequence=[1, 2], algorithm="LRU")
+    assert ResultCache.key("page", a) == ResultCache.key("page", b)
+    assert ResultCache.key("page", a) != ResultCache.key("disk", a)
+    assert ResultCache.key("page", a) != ResultCache.key("page", _request(frame_count=3))
+
+def test_lru_eviction_by_bytes():
+    """Test least recently used entries go first once the budget is exceeded"""
+    cache = ResultCache(max_bytes=10, ttl=0)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234"
+    cache.put("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 8
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+def test_companion_outlives_entry():
+    """Test a companion is refreshed with its entry and evicted after it"""
+    cache = ResultCache(max_bytes=12, ttl=0)
+    cache.put("result", b"1234", companion="request")
+    cache.put("request", b"1234")
+    cache.put("other", b"1234")
+    assert cache.get("result") == b"1234"
+    cache.put("newer", b"1234")
+    assert cache.get("other") is None
+    assert cache.get("request") == b"1234"
+    cache.put("a", b"1234")
+    assert cache.get("result") is None
+    assert cache.get("request") == b"1234"
+
+def test_ttl_expiry():
+    """Test entries expire after their TTL"""
+    cache = ResultCache(ttl=1)
+    cache.put("a", b"x")
+    cache._entries["a"] = (time.time() - 1, b"x")
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    """Test the persistent tier serves entries to a fresh cache"""
+    path = str(tmp_path / "results.db")
+    first = ResultCache(path=path)
+    first.put("a", b"payload")
+    first.close()
+
+    second = ResultCache(path=path)
+    assert second.get("a") == b"payload"
+    assert second.stats()["entries"] == 1
+    second.close()
+
+def test_fetch_reads_sqlite_on_writer_thread(tmp_path, monkeypatch):
+    """Test fetch serves the persistent tier without reading it on the caller's thread"""
+    import asyncio
+    import threading
+    path = str(tmp_path / "results.db")
+    first = ResultCache(path=path)
+    first.put("a", b"payload")
+    first.close()
+
+    cache = ResultCache(path=path)
+    threads = []
+    load = cache._load
+    def record_thread(db, key):
+        threads.append(threading.current_thread().name)
+        return load(db, key)
+    monkeypatch.setattr(cache, "_load", record_thread)
+
+    assert asyncio.run(cache.fetch("a")) == b"payload"
+    assert asyncio.run(cache.fetch("a")) == b"payload"  # now from memory
+    assert asyncio.run(cache.fetch("missing")) is None
+    assert len(threads) == 2
+    assert all(name.startswith("cache-writer") for name in threads)
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (2, 1)
+    cache.close()
+
+def test_sqlite_tier_is_pruned(tmp_path):
+    """Test expired rows and rows beyond the disk budget are dropped"""
+    from app.utils.cache import PRUNE_INTERVAL
+    cache = ResultCache(path=str(tmp_path / "results.db"), disk_max_bytes=100)
+    cache.put("stale", b"x")
+    cache.flush()
+    cache._db.execute("UPDATE results SET expires = 1 WHERE key = 'stale'")
+    cache._db.commit()
+    assert cache.get("stale") == b"x"  # still in memory
+
+    # The last of these writes triggers a sweep
+    for i in range(PRUNE_INTERVAL - 1):
+        cache.put(f"k{i}", b"0123456789")
+    cache.flush()
+    keys = [row[0] for row in cache._db.execute("SELECT key FROM results ORDER BY rowid")]
+    assert keys == [f"k{i}" for i in range(PRUNE_INTERVAL - 11, PRUNE_INTERVAL - 1)]
+    cache.close()
+
+def test_key_covers_version(monkeypatch):
+    """Test a version bump invalidates cached results and ETags"""
+    from app.config import Settings
+    from app.utils.cache import request_etag
+    request = _request()
+    key, etag = ResultCache.key("page", request), request_etag("page", request)
+    monkeypatch.setattr(Settings, "app_version", "0.0.0-test")
+    assert ResultCache.key("page", request) != key
+    assert request_etag("page", request) != etag
+
+def test_endpoint_serves_repeats_from_cache():
+    """Test an identical request is a cache hit with the same response"""
+    cache = get_cache()
+    cache.clear()
+    payload = {"algorithm": "FIFO", "page_sequence": [4, 1, 2, 4, 5, 1], "frame_count": 3}
+    before = client.get("/cache/stats").json()
+    first = client.post("/api/simulate/page/", json=payload)
+    second = client.post("/api/simulate/page/", json=payload)
+    after = client.get("/cache/stats").json()
+
+    assert first.json() == second.json()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+def test_concurrent_duplicates_are_coalesced():
+    """Test identical in-flight requests share one computation"""
+    import asyncio
+    from app.models.responses import PageReplacementResponse
+    from app.utils import cache as cache_module
+
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return PageReplacementResponse(
+            algorithm="LRU", metrics={
+                "total_references": 4, "page_faults": 3, "page_hits": 1,
+                "hit_ratio": 25.0, "fault_ratio": 75.0, "frames": 2
+            }, trace=[]
+        )
+
+    async def main():
+        request = _request(page_sequence=[9, 8, 9, 7])
+        return await asyncio.gather(*(
+            cache_module.run_cached("coalesce-test", request, PageReplacementResponse, compute)
+            for _ in range(5)
+        ))
+
+    before = cache_module.coalesced_requests()
+    results = asyncio.run(main())
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert cache_module.coalesced_requests() - before == 4
+    assert not cache_module._in_flight
+
+def test_etag_and_not_modified():
+    """Test simulate endpoints emit strong ETags and honor If-None-Match"""
+    payload = {"algorithm": "SJF", "processes": [{"pid": 1, "arrival": 0, "burst": 3}]}
+    first = client.post("/api/simulate/cpu/", json=payload)
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith('W/')
+    assert first.headers["cache-control"] == "no-cache"
+
+    repeat = client.post("/api/simulate/cpu/", json=payload, headers={"If-None-Match": f'"other", {etag}'})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+    # Weak comparison: a proxy that compressed the body sends the tag back weakened
+    weak = client.post("/api/simulate/cpu/", json=payload, headers={"If-None-Match": f"W/{etag}"})
+    assert weak.status_code == 304
+
+    changed = client.post(
+        "/api/simulate/cpu/", json={**payload, "algorithm": "FCFS"}, headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,164 @@
+import base64
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.responses import TimelineEvent
+from app.utils.cache import get_cache
+from app.utils.visualization import (
+    disk_figure, figure_to_data_uri, gantt_figure, minmax_decimate, render_figure
+)
+
+client = TestClient(app)
+
+PAYLOADS = {
+    "cpu": {
+        "algorithm": "RoundRobin",
+        "time_quantum": 2,
+        "processes": [{"pid": 1, "arrival": 0, "burst": 5}, {"pid": 2, "arrival": 1, "burst": 3}]
+    },
+    "page": {"algorithm": "Optimal", "page_sequence": [1, 2, 3, 1, 4, 2], "frame_count": 2},
+    "disk": {"algorithm": "LOOK", "request_queue": [98, 183, 37, 122], "initial_head": 53}
+}
+
+def _png(data_uri):
+    header, encoded = data_uri.split(",", 1)
+    return header == "data:image/png;base64" and base64.b64decode(encoded).startswith(b"\x89PNG")
+
+CHART_FIELDS = {"cpu": "gantt_chart", "page": "visualization", "disk": "visualization"}
+
+@pytest.mark.parametrize("kind", ["cpu", "page", "disk"])
+def test_chart_by_result_id(kind):
+    """Test charts are off by default and rendered later from the result ID"""
+    data = client.post(f"/api/simulate/{kind}/", json=PAYLOADS[kind]).json()
+    assert data[CHART_FIELDS[kind]] is None
+    assert data["result_id"]
+
+    response = client.get(f"/api/charts/{data['result_id']}")
+    assert response.status_code == 200
+    chart = response.json()
+    assert chart["kind"] == kind
+    assert _png(chart["chart"])
+
+def test_charts_embedded_without_cache(monkeypatch):
+    """Test simulations embed their chart when there is no result ID to fetch it by"""
+    from app.config import Settings
+    monkeypatch.setattr(Settings, "cache_enabled", False)
+    data = client.post("/api/simulate/cpu/", json=PAYLOADS["cpu"]).json()
+    assert data["result_id"] is None
+    assert _png(data["gantt_chart"])
+
+def test_include_chart_embeds_png():
+    """Test include_chart still embeds the chart"""
+    data = client.post(
+        "/api/simulate/disk/", json={**PAYLOADS["disk"], "include_chart": True}
+    ).json()
+    assert _png(data["visualization"])
+
+def test_chart_rerenders_after_result_eviction():
+    """Test the chart is recomputed when only the request is still cached"""
+    data = client.post(
+        "/api/simulate/page/", json={**PAYLOADS["page"], "frame_count": 3}
+    ).json()
+    cache = get_cache()
+    with cache._lock:
+        cache._remove(data["result_id"])
+    assert client.get(f"/api/charts/{data['result_id']}").status_code == 200
+
+def test_chart_for_merged_block_requests():
+    """Test block request results round-trip through the stored request"""
+    data = client.post(
+        "/api/simulate/disk/",
+        json={
+            "algorithm": "SSTF",
+            "block_requests": [
+                {"sector": 800, "length": 8},
+                {"sector": 80, "length": 8},
+                {"sector": 808, "length": 8}
+            ],
+            "sectors_per_cylinder": 8,
+            "merge": True,
+            "initial_head": 50,
+            "disk_size": 200
+        }
+    ).json()
+    result_id = data["result_id"]
+    assert client.get(f"/api/charts/{result_id}").status_code == 200
+    assert client.get(f"/api/charts/{result_id}/image?dpi=50").status_code == 200
+
+    # Without the cached result the stored request is simulated again
+    cache = get_cache()
+    with cache._lock:
+        cache._remove(result_id)
+    response = client.get(f"/api/charts/{result_id}/image?dpi=60")
+    assert response.status_code == 200
+    assert response.content.startswith(b"\x89PNG")
+
+def test_unknown_result_id():
+    """Test unknown result IDs are 404"""
+    assert client.get("/api/charts/" + "0" * 64).status_code == 404
+
+@pytest.mark.parametrize("format,media_type,magic", [
+    ("png", "image/png", b"\x89PNG"),
+    ("webp", "image/webp", b"RIFF"),
+    ("svg", "image/svg+xml", b"<?xml")
+])
+def test_chart_image_formats(format, media_type, magic):
+    """Test raw image bytes are streamed in each format"""
+    data = client.post("/api/simulate/cpu/", json=PAYLOADS["cpu"]).json()
+    response = client.get(f"/api/charts/{data['result_id']}/image?format={format}&dpi=50")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == media_type
+    assert response.content.startswith(magic)
+
+def test_chart_image_dpi_and_etag():
+    """Test dpi changes the image and If-None-Match short-circuits"""
+    data = client.post("/api/simulate/disk/", json=PAYLOADS["disk"]).json()
+    url = f"/api/charts/{data['result_id']}/image"
+    small = client.get(url, params={"dpi": 50})
+    large = client.get(url, params={"dpi": 150})
+    assert len(small.content) < len(large.content)
+    assert small.headers["etag"] != large.headers["etag"]
+    assert "public, max-age=" in small.headers["cache-control"]
+
+    repeat = client.get(url, params={"dpi": 50}, headers={"If-None-Match": small.headers["etag"]})
+    assert repeat.status_code == 304
+    assert client.get(url, params={"format": "gif"}).status_code == 422
+
+def test_embedded_charts_use_chart_dpi(monkeypatch):
+    """Test embedded charts render at chart_dpi unless a dpi is given"""
+    from app.config import Settings
+    monkeypatch.setattr(Settings, "chart_dpi", 40)
+
+    def width(data_uri):
+        png = base64.b64decode(data_uri.split(",", 1)[1])
+        return int.from_bytes(png[16:20], "big")
+
+    fig = disk_figure([98, 183, 37, 122], 53, 200, "FCFS")
+    assert width(figure_to_data_uri(fig, dpi=80)) > 1.8 * width(figure_to_data_uri(fig))
+
+def test_minmax_decimate_keeps_envelope():
+    """Test decimation keeps the extremes and endpoints within 2 points per bucket"""
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 200, 10001)
+    x = np.arange(len(y))
+    dx, dy = minmax_decimate(x, y, 100)
+    assert len(dx) <= 2 * 100 + 2
+    assert dy.min() == y.min() and dy.max() == y.max()
+    assert (dx[0], dx[-1]) == (0, len(y) - 1)
+    assert np.array_equal(y[dx], dy)
+
+def test_large_charts_render_decimated():
+    """Test dense Gantt and disk charts stay within a bounded number of artists"""
+    timeline = [TimelineEvent(pid=i % 5 + 1, start=i, end=i + 1, duration=1) for i in range(20000)]
+    fig = gantt_figure(timeline, "RR", max_elements=500)
+    assert len(fig.axes[0].collections) == 1
+    assert len(fig.axes[0].texts) <= 60
+    assert render_figure(fig, dpi=30).startswith(b"\x89PNG")
+
+    sequence = list(np.random.default_rng(1).integers(0, 200, 20000))
+    fig = disk_figure(sequence, 50, 200, "FCFS", max_elements=500)
+    line = fig.axes[0].lines[0]
+    assert len(line.get_xdata()) <= 2 * 500 + 2
+    assert not fig.axes[0].texts
+    assert render_figure(fig, dpi=30).startswith(b"\x89PNG")
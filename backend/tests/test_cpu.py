@@ -99,4 +99,33 @@ def test_priority_scheduling():
     )
     assert response.status_code == 200
     data = response.json()
-    assert data["metrics"]["avg_waiting_time"] >= 0
\ No newline at end of file
+    assert data["metrics"]["avg_waiting_time"] >= 0
+
+def test_compare_matches_single_runs():
+    """Test compare returns the same metrics as individual simulations"""
+    processes = [
+        {"pid": 1, "arrival": 4, "burst": 5, "priority": 2},
+        {"pid": 2, "arrival": 0, "burst": 3, "priority": 1},
+        {"pid": 3, "arrival": 2, "burst": 8, "priority": 0}
+    ]
+    response = client.post(
+        "/api/simulate/cpu/compare",
+        json={"processes": processes, "time_quantum": 3}
+    )
+    assert response.status_code == 200
+    comparison = response.json()["comparison"]
+    assert list(comparison) == ["FCFS", "SJF", "SRTF", "Priority", "RoundRobin"]
+    for algo, metrics in comparison.items():
+        single = client.post(
+            "/api/simulate/cpu/",
+            json={"algorithm": algo, "processes": processes, "time_quantum": 3}
+        ).json()
+        assert metrics == single["metrics"]
+
+def test_compare_rejects_unknown_algorithm():
+    """Test compare validates algorithms up front"""
+    response = client.post(
+        "/api/simulate/cpu/compare",
+        json={"processes": [{"pid": 1, "arrival": 0, "burst": 2}], "algorithms": ["LIFO"]}
+    )
+    assert response.status_code == 422
@@ -65,4 +65,480 @@ def test_sstf_algorithm():
     assert response.status_code == 200
     data = response.json()
     # SSTF should have lower seek time than FCFS
-    assert data["metrics"]["avg_seek"] >= 0
\ No newline at end of file
+    assert data["metrics"]["avg_seek"] >= 0
+
+def test_sstf_sequence():
+    """Test SSTF service order and total seek"""
+    response = client.post(
+        "/api/simulate/disk/",
+        json={
+            "algorithm": "SSTF",
+            "request_queue": [98, 183, 37, 122, 14, 124, 65, 67],
+            "initial_head": 53,
+            "disk_size": 200
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sequence"] == [65, 67, 37, 14, 98, 122, 124, 183]
+    assert data["metrics"]["total_seek"] == 236
+
+def test_sstf_tie_breaking():
+    """Test SSTF breaks equal-distance ties by queue order"""
+    from app.algorithms.disk_scheduling import sstf
+    assert sstf([60, 40, 40, 70], 50) == [60, 70, 40, 40]
+    assert sstf([40, 60, 70], 50) == [40, 60, 70]
+
+def test_directional_orders():
+    """Test LOOK and C-LOOK service orders in both directions"""
+    queue = [98, 183, 37, 122, 14, 124, 65, 67]
+    expected = {
+        ("LOOK", "right"): ([65, 67, 98, 122, 124, 183, 37, 14], 299),
+        ("LOOK", "left"): ([37, 14, 65, 67, 98, 122, 124, 183], 208),
+        ("C-LOOK", "right"): ([65, 67, 98, 122, 124, 183, 14, 37], 322),
+        ("C-LOOK", "left"): ([37, 14, 183, 124, 122, 98, 67, 65], 326),
+    }
+    for (algorithm, direction), (sequence, total) in expected.items():
+        response = client.post(
+            "/api/simulate/disk/",
+            json={
+                "algorithm": algorithm,
+                "request_queue": queue,
+                "initial_head": 53,
+                "disk_size": 200,
+                "direction": direction
+            }
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["sequence"] == sequence
+        assert data["metrics"]["total_seek"] == total
+        assert data["trace"][-1]["cumulative_seek"] == total
+
+def test_dynamic_arrivals():
+    """Test event-driven scheduling respects arrival times"""
+    response = client.post(
+        "/api/simulate/disk/dynamic",
+        json={
+            "algorithm": "SSTF",
+            "requests": [
+                {"arrival": 0, "cylinder": 60},
+                {"arrival": 0, "cylinder": 150},
+                {"arrival": 5, "cylinder": 55}
+            ],
+            "initial_head": 50,
+            "disk_size": 200,
+            "seek_time": 1.0
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    # 55 is closer than 150 once it arrives, but only after 60 is dispatched
+    assert data["sequence"] == [60, 55, 150]
+    assert data["requests"][0]["finish"] == 10
+    assert data["metrics"]["total_seek"] == 10 + 5 + 95
+    assert data["metrics"]["max_response_time"] == 110
+
+def test_dynamic_scan_travels_to_edge():
+    """Test dynamic SCAN sweeps to the disk edge before reversing"""
+    response = client.post(
+        "/api/simulate/disk/dynamic",
+        json={
+            "algorithm": "SCAN",
+            "requests": [{"arrival": 0, "cylinder": c} for c in [98, 183, 37, 122, 14, 124, 65, 67]],
+            "initial_head": 53,
+            "disk_size": 200
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["metrics"]["total_seek"] == 331
+    assert data["metrics"]["p50_response_time"] <= data["metrics"]["p99_response_time"]
+
+def test_dynamic_sstf_matches_static():
+    """Test dynamic SSTF with every request pending at once matches static SSTF"""
+    queue = [(i * 37) % 200 for i in range(40)] + [53, 53, 0, 199, 74, 74]
+    static = client.post(
+        "/api/simulate/disk/",
+        json={"algorithm": "SSTF", "request_queue": queue, "initial_head": 53, "disk_size": 200}
+    )
+    dynamic = client.post(
+        "/api/simulate/disk/dynamic",
+        json={
+            "algorithm": "SSTF",
+            "requests": [{"arrival": 0, "cylinder": c} for c in queue],
+            "initial_head": 53,
+            "disk_size": 200
+        }
+    )
+    assert dynamic.status_code == 200
+    assert dynamic.json()["metrics"]["total_seek"] == static.json()["metrics"]["total_seek"]
+
+def test_drive_model_timing():
+    """Test service time estimates from the drive model"""
+    response = client.post(
+        "/api/simulate/disk/",
+        json={
+            "algorithm": "FCFS",
+            "request_queue": [66, 66],
+            "initial_head": 50,
+            "disk_size": 200,
+            "drive": {
+                "settle_time": 1.0,
+                "sqrt_coeff": 1.0,
+                "rpm": 6000,
+                "transfer_rate": 150.0,
+                "request_size": 150000
+            }
+        }
+    )
+    assert response.status_code == 200
+    timing = response.json()["timing"]
+    # Seek 16 cylinders: 1 + sqrt(16) = 5ms, then a zero-length seek
+    assert timing["total_seek_time"] == 5.0
+    assert timing["rotational_latency"] == 5.0
+    assert timing["transfer_time"] == 1.0
+    assert timing["total_service_time"] == 5.0 + 2 * (5.0 + 1.0)
+
+def test_drive_model_seek_curve():
+    """Test the seek curve switches to the linear regime"""
+    from app.algorithms.disk_scheduling import DriveModel
+    drive = DriveModel(cylinders=200, settle_time=1.0, sqrt_coeff=1.0,
+                       linear_coeff=0.5, regime_boundary=4)
+    assert drive.seek_table[0] == 0.0
+    assert drive.seek_table[4] == 3.0
+    assert drive.seek_table[16] == 3.0 + 0.5 * 12
+    assert list(drive.seek_times([54, 50], 50)) == [3.0, 3.0]
+
+def test_sptf_uses_rotational_position():
+    """Test SPTF picks the request that rotates under the head first"""
+    response = client.post(
+        "/api/simulate/disk/",
+        json={
+            "algorithm": "SPTF",
+            "request_queue": [50, 50],
+            "request_sectors": [32, 1],
+            "initial_head": 50,
+            "disk_size": 200
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sequence"] == [50, 50]
+    assert data["timing"]["rotational_latency"] < 60000 / 7200 / 2
+    assert data["positioning"]["throughput_gain"] > 0
+    assert data["positioning"]["sptf_total_time"] < data["positioning"]["sstf_total_time"]
+
+def test_sptf_sector_validation():
+    """Test request_sectors must match the queue"""
+    response = client.post(
+        "/api/simulate/disk/",
+        json={
+            "algorithm": "SPTF",
+            "request_queue": [50, 60],
+            "request_sectors": [1],
+            "initial_head": 50,
+            "disk_size": 200
+        }
+    )
+    assert response.status_code == 422
+
+def test_deadline_bounds_wait():
+    """Test Deadline serves an expired request ahead of elevator order"""
+    requests = [{"arrival": 0, "cylinder": 10}]
+    requests += [{"arrival": t, "cylinder": 100 + t % 3} for t in range(0, 60, 2)]
+    payload = {
+        "requests": requests,
+        "initial_head": 100,
+        "disk_size": 200,
+        "seek_time": 0.1,
+        "service_time": 2.0
+    }
+    sstf = client.post(
+        "/api/simulate/disk/dynamic", json={**payload, "algorithm": "SSTF"}
+    ).json()
+    deadline = client.post(
+        "/api/simulate/disk/dynamic",
+        json={**payload, "algorithm": "Deadline", "deadline": 10, "fifo_batch": 2}
+    ).json()
+    far = lambda data: next(r for r in data["requests"] if r["cylinder"] == 10)
+    assert far(deadline)["start"] < far(sstf)["start"]
+    assert deadline["metrics"]["deadline_misses"] is not None
+
+def test_deadline_misses_match_expiry():
+    """Test a request dispatched on expiry counts as a deadline miss"""
+    response = client.post(
+        "/api/simulate/disk/dynamic",
+        json={
+            "algorithm": "Deadline",
+            "requests": [{"arrival": 0, "cylinder": c} for c in [100, 20, 101]],
+            "initial_head": 100,
+            "disk_size": 200,
+            "service_time": 10.0,
+            "deadline": 10,
+            "fifo_batch": 1
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    # 20 expires exactly when 100 finishes (waited 10), and 101 waits behind it
+    assert data["sequence"] == [100, 20, 101]
+    assert [r["start"] for r in data["requests"]] == [0, 10, 100]
+    assert data["metrics"]["deadline_misses"] == 2
+
+def test_fscan_and_nstep_serve_everything():
+    """Test batch schedulers serve every request exactly once"""
+    requests = [{"arrival": t, "cylinder": (t * 37) % 200} for t in range(40)]
+    for algorithm in ["N-Step-SCAN", "FSCAN"]:
+        response = client.post(
+            "/api/simulate/disk/dynamic",
+            json={
+                "algorithm": algorithm,
+                "requests": requests,
+                "initial_head": 50,
+                "disk_size": 200,
+                "batch_size": 4
+            }
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(data["sequence"]) == sorted(r["cylinder"] for r in requests)
+        assert data["metrics"]["max_response_time"] >= data["metrics"]["p99_response_time"]
+
+def test_merge_adjacent_blocks():
+    """Test contiguous and overlapping block requests are merged"""
+    from app.algorithms.disk_scheduling import merge_requests
+    merged = merge_requests([(100, 8), (50, 4), (108, 8), (104, 2), (54, 1)])
+    assert merged == [(100, 16, 3), (50, 5, 2)]
+
+    response = client.post(
+        "/api/simulate/disk/",
+        json={
+            "algorithm": "SSTF",
+            "block_requests": [
+                {"sector": 800, "length": 8},
+                {"sector": 80, "length": 8},
+                {"sector": 808, "length": 8},
+                {"sector": 816, "length": 8}
+            ],
+            "sectors_per_cylinder": 8,
+            "merge": True,
+            "initial_head": 50,
+            "disk_size": 200
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sequence"] == [10, 100]
+    assert data["merge"]["merged_requests"] == 2
+    assert data["merge"]["seek_savings"] == 2
+
+def test_interval_index_merge_counts():
+    """Test back and front merges collapse long runs into one interval"""
+    from app.algorithms.disk_scheduling import IntervalIndex
+    index = IntervalIndex()
+    for i, sector in enumerate(range(8000, 0, -8)):
+        index.add(sector, 8, i)
+    index.add(4, 4, 1000)
+    assert len(index) == 1
+    assert list(index.intervals()) == [(4, 8008, 0, 1001)]
+    assert (index.back_merges, index.front_merges) == (0, 1000)
+
+    index.add(8008, 8, 1001)
+    index.add(9000, 8, 1002)
+    assert index.back_merges == 1
+    assert [start for start, _, _, _ in index.intervals()] == [4, 9000]
+
+def test_raid_layouts():
+    """Test writes fan out to mirrors and parity"""
+    from app.algorithms.disk_array import map_requests
+    blocks = [0, 8, 16, 24]
+    writes = [True, False, True, False]
+    logical, disk, _ = map_requests("RAID0", 4, blocks, writes)
+    assert list(disk) == [0, 1, 2, 3]
+    logical, disk, _ = map_requests("RAID1", 2, blocks, writes)
+    assert len(logical) == 6
+    logical, disk, _ = map_requests("RAID5", 3, blocks, writes)
+    # Stripe 0 keeps parity on disk 2, stripe 1 on disk 1
+    assert list(disk) == [0, 1, 2, 0, 2, 1]
+
+def test_disk_array_simulation():
+    """Test array simulation reports per-disk utilization"""
+    response = client.post(
+        "/api/simulate/disk/array",
+        json={
+            "level": "RAID10",
+            "disks": 4,
+            "algorithm": "LOOK",
+            "workload": {"count": 2000, "arrival_rate": 0.2}
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["per_disk"]) == 4
+    assert data["metrics"]["logical_requests"] == 2000
+    assert data["metrics"]["physical_requests"] > 2000
+    assert all(0 < d["utilization"] <= 100 for d in data["per_disk"])
+
+    response = client.post(
+        "/api/simulate/disk/array",
+        json={"level": "RAID5", "disks": 2, "requests": [{"arrival": 0, "block": 1}]}
+    )
+    assert response.status_code == 400
+
+    # The per-disk seek table is sized by disk_size, which is bounded like the other disk models
+    response = client.post(
+        "/api/simulate/disk/array",
+        json={"level": "RAID0", "disk_size": 10**8, "requests": [{"arrival": 0, "block": 1}]}
+    )
+    assert response.status_code == 422
+
+def test_trace_replay_streams_csv():
+    """Test a CSV trace is parsed across chunk boundaries and replayed"""
+    from app.algorithms.disk_scheduling import replay_trace
+    lines = "timestamp,lba,size,rw\n" + "".join(
+        f"{i * 0.001},{(i * 7919) % 200000},8,{'W' if i % 3 == 0 else 'R'}\n"
+        for i in range(3000)
+    )
+    data = lines.encode()
+    chunks = [data[i:i + 997] for i in range(0, len(data), 997)]
+    options = {"cylinders": 200, "sectors_per_cylinder": 1000, "window": 32}
+    fcfs = replay_trace(chunks, "csv", algorithm="FCFS", **options)
+    look = replay_trace(chunks, "csv", algorithm="LOOK", **options)
+    assert fcfs.requests == look.requests == 3000
+    assert fcfs.writes == 1000
+    assert fcfs.total_seek == fcfs.fcfs_seek
+    assert look.total_seek < fcfs.total_seek
+    assert look.histogram.sum() == 3000
+
+    response = client.post(
+        "/api/simulate/disk/trace?algorithm=LOOK&cylinders=200&sectors_per_cylinder=1000&window=32",
+        content=data,
+        headers={"Content-Type": "text/csv"}
+    )
+    assert response.status_code == 200
+    metrics = response.json()["metrics"]
+    assert metrics["total_seek"] == look.total_seek
+    assert metrics["seek_reduction"] > 0
+
+def test_trace_histogram_is_log_linear():
+    """Test the seek histogram stays small on huge disks and keeps exact extremes"""
+    import numpy as np
+    from app.algorithms.disk_scheduling import TraceReplay
+    replay = TraceReplay("FCFS", cylinders=10_000_000, sectors_per_cylinder=1)
+    lbas = np.array([0, 3, 3, 1000, 9_999_999, 9_999_000, 1_234_567], dtype=np.int64)
+    replay.add(np.arange(7.0), lbas, np.ones(7, dtype=np.int64), np.zeros(7, dtype=bool))
+    replay.close()
+    assert len(replay.histogram) < 10_000
+    # Seeks: 0, 3, 0, 997, 9_998_999, 999, 8_764_433
+    p50, p85, p100 = replay.seek_percentiles([50, 85, 100])
+    assert p50 == 997
+    assert p85 <= 8_764_433 < p85 * 1.002
+    assert p100 == 9_998_999
+
+def test_trace_replay_binary_records():
+    """Test packed binary records and validation of options"""
+    import numpy as np
+    from app.algorithms.disk_scheduling import TRACE_RECORD
+    records = np.zeros(4, dtype=TRACE_RECORD)
+    records["lba"] = [0, 4096, 2048, 6144]
+    records["write"] = [0, 1, 0, 1]
+    response = client.post(
+        "/api/simulate/disk/trace?format=binary&algorithm=SSTF&sectors_per_cylinder=1024&cylinders=10",
+        content=records.tobytes()
+    )
+    assert response.status_code == 200
+    metrics = response.json()["metrics"]
+    assert metrics["writes"] == 2
+    assert metrics["total_seek"] == 6
+
+    response = client.post(
+        "/api/simulate/disk/trace?format=binary",
+        content=records.tobytes()[:-1]
+    )
+    assert response.status_code == 400
+
+    response = client.post("/api/simulate/disk/trace?cylinders=10&initial_head=20", content=b"")
+    assert response.status_code == 422
+
+def test_compact_response_mode():
+    """Test compact mode returns packed seeks instead of trace and chart"""
+    import base64
+    import numpy as np
+    payload = {
+        "algorithm": "SSTF",
+        "request_queue": [98, 183, 37, 122, 14, 124, 65, 67],
+        "initial_head": 53,
+        "disk_size": 200
+    }
+    full = client.post("/api/simulate/disk/", json=payload).json()
+    compact = client.post(
+        "/api/simulate/disk/", json={**payload, "response_mode": "compact"}
+    ).json()
+
+    assert compact["trace"] is None
+    assert compact["visualization"] is None
+    assert compact["sequence"] == full["sequence"]
+    assert compact["metrics"] == full["metrics"]
+    seeks = np.frombuffer(base64.b64decode(compact["packed_seeks"]), dtype="<u4")
+    assert seeks.tolist() == [step["seek_distance"] for step in full["trace"]]
+
+def test_compact_mode_accepts_large_queues():
+    """Test compact mode lifts the full-mode queue and disk size limits"""
+    import base64
+    import numpy as np
+    queue = np.random.default_rng(0).integers(0, 20000, 5000).tolist()
+    payload = {"algorithm": "C-LOOK", "request_queue": queue, "initial_head": 100, "disk_size": 20000}
+    assert client.post("/api/simulate/disk/", json=payload).status_code == 422
+
+    response = client.post("/api/simulate/disk/", json={**payload, "response_mode": "compact"})
+    assert response.status_code == 200
+    data = response.json()
+    assert sorted(data["sequence"]) == sorted(queue)
+    seeks = np.frombuffer(base64.b64decode(data["packed_seeks"]), dtype="<u4")
+    assert len(seeks) == 5000
+    assert int(seeks.sum()) == data["metrics"]["total_seek"]
+
+    too_wide = {**payload, "response_mode": "compact", "disk_size": 70000}
+    assert client.post("/api/simulate/disk/", json=too_wide).status_code == 422
+
+def test_compare_matches_single_runs():
+    """Test compare reports the same metrics as each algorithm alone"""
+    queue = [98, 183, 37, 122, 14, 124, 65, 67, 65, 98]
+    response = client.post(
+        "/api/simulate/disk/compare",
+        json={"request_queue": queue, "initial_head": 53, "direction": "left"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["charts"] is None
+    assert len(data["comparison"]) == 6
+    for algo, metrics in data["comparison"].items():
+        single = client.post(
+            "/api/simulate/disk/",
+            json={
+                "algorithm": algo, "request_queue": queue, "initial_head": 53,
+                "direction": "left", "response_mode": "compact"
+            }
+        ).json()
+        assert metrics == single["metrics"]
+    best = min(data["comparison"], key=lambda a: data["comparison"][a]["total_seek"])
+    assert data["best"] == best
+
+def test_compare_charts_and_validation():
+    """Test optional charts and out-of-range requests"""
+    response = client.post(
+        "/api/simulate/disk/compare",
+        json={
+            "request_queue": [10, 150], "initial_head": 53,
+            "algorithms": ["SSTF", "C-LOOK"], "include_charts": True
+        }
+    )
+    assert response.status_code == 200
+    assert set(response.json()["charts"]) == {"SSTF", "C-LOOK"}
+
+    response = client.post(
+        "/api/simulate/disk/compare",
+        json={"request_queue": [10, 250], "initial_head": 53}
+    )
+    assert response.status_code == 422
@@ -0,0 +1,36 @@
+import asyncio
+import threading
+import pytest
+from app.utils.executor import SimulationExecutor, SimulationBusyError
+
+def test_executor_runs_off_the_event_loop():
+    """Test work runs on a pool thread and its result is awaited"""
+    executor = SimulationExecutor(kind='thread', workers=2, queue_limit=0)
+
+    async def main():
+        return await executor.run(lambda: threading.current_thread().name)
+
+    try:
+        assert asyncio.run(main()).startswith('simulation')
+    finally:
+        executor.shutdown()
+
+def test_executor_rejects_when_queue_is_full():
+    """Test calls beyond workers + queue_limit fail fast"""
+    executor = SimulationExecutor(kind='thread', workers=1, queue_limit=1)
+    release = threading.Event()
+
+    async def main():
+        blocked = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(SimulationBusyError):
+            await executor.run(release.wait)
+        release.set()
+        return await asyncio.gather(*blocked)
+
+    try:
+        assert asyncio.run(main()) == [True, True]
+        assert executor.rejected == 1
+        assert executor.in_flight == 0
+    finally:
+        executor.shutdown()
@@ -0,0 +1,103 @@
+import pytest
+import numpy as np
+from fastapi.testclient import TestClient
+from app.main import app
+
+client = TestClient(app)
+
+def test_ftl_mapping_stays_consistent():
+    """Test mapping tables and valid counts agree after GC"""
+    from app.algorithms.flash_storage import FlashTranslationLayer, replay, generate_writes
+    ftl = FlashTranslationLayer(blocks=32, pages_per_block=16, overprovisioning=0.25)
+    ftl.precondition()
+    replay(ftl, generate_writes(5000, ftl.logical_pages, seed=1))
+
+    mapped = np.flatnonzero(ftl.l2p >= 0)
+    assert (ftl.p2l[ftl.l2p[mapped]] == mapped).all()
+    assert ftl.valid.sum() == len(mapped)
+    per_block = ftl.valid.reshape(32, 16).sum(axis=1)
+    assert (per_block == ftl.valid_count).all()
+    assert ftl.write_amplification > 1
+
+def test_precondition_matches_page_writes():
+    """Test the direct sequential fill reaches the same state as writing every page"""
+    from app.algorithms.flash_storage import FlashTranslationLayer, replay, generate_writes
+    fast = FlashTranslationLayer(blocks=24, pages_per_block=8, overprovisioning=0.3)
+    slow = FlashTranslationLayer(blocks=24, pages_per_block=8, overprovisioning=0.3)
+    fast.precondition()
+    for lpn in range(slow.logical_pages):
+        slow.write(lpn)
+    slow.reset_counters()
+
+    for name in ("l2p", "p2l", "valid", "valid_count", "closed"):
+        assert (getattr(fast, name) == getattr(slow, name)).all()
+    assert (fast.free, fast.host_frontier, fast.now) == (slow.free, slow.host_frontier, slow.now)
+    writes = generate_writes(2000, fast.logical_pages, seed=3)
+    assert (replay(fast, writes) == replay(slow, writes)).all()
+
+def test_wear_leveling_tracks_erase_counts():
+    """Test the coldest closed block and the max erase count follow a full scan"""
+    from app.algorithms.flash_storage import FlashTranslationLayer, generate_writes
+    ftl = FlashTranslationLayer(blocks=32, pages_per_block=8, overprovisioning=0.3, wl_threshold=2)
+    ftl.precondition()
+    for lpn in generate_writes(4000, ftl.logical_pages, pattern="hot-cold", seed=2):
+        ftl.write(lpn)
+        closed = np.flatnonzero(ftl.closed)
+        live = [(e, b) for e, b in ftl.cold if ftl.closed[b] and ftl.erase_count[b] == e]
+        assert sorted(b for _, b in live) == closed.tolist()
+        assert min(live) == (ftl.erase_count[closed].min(), closed[np.argmin(ftl.erase_count[closed])])
+        assert ftl.max_erase_count == ftl.erase_count.max()
+    assert ftl.wl_migrations > 0
+    assert ftl.l2p.dtype == np.int32
+
+def test_valid_count_index():
+    """Test greedy and cost-benefit victim selection"""
+    from app.algorithms.flash_storage import ValidCountIndex
+    index = ValidCountIndex(pages_per_block=4, blocks=3)
+    index.add(0, 4, closed_at=0)
+    index.add(1, 4, closed_at=5)
+    index.add(2, 4, closed_at=9)
+    assert index.greedy() is None
+    index.invalidate(2)
+    index.invalidate(2)
+    index.invalidate(0)
+    assert index.greedy() == 2
+    # Block 0 is older, which outweighs its extra valid page
+    assert index.cost_benefit(now=10) == 0
+    index.remove(2)
+    assert index.greedy() == 0
+
+def test_flash_simulation():
+    """Test flash endpoint reports write amplification and GC stalls"""
+    response = client.post(
+        "/api/simulate/flash/",
+        json={
+            "gc_policy": "cost-benefit",
+            "blocks": 64,
+            "pages_per_block": 32,
+            "workload": {"count": 20000, "pattern": "hot-cold"}
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["metrics"]["host_writes"] == 20000
+    assert data["metrics"]["write_amplification"] > 1
+    assert data["metrics"]["latency_spikes"] > 0
+    assert data["metrics"]["max_write_latency"] >= data["metrics"]["p99_write_latency"]
+    assert len(data["largest_spikes"]) == 10
+
+def test_flash_invalid_trace():
+    """Test writes outside the logical space are rejected"""
+    response = client.post(
+        "/api/simulate/flash/",
+        json={"blocks": 16, "pages_per_block": 16, "overprovisioning": 0.3, "writes": [0, 100000]}
+    )
+    assert response.status_code == 400
+
+def test_flash_geometry_is_bounded():
+    """Test drives past FLASH_MAX_PAGES physical pages are rejected"""
+    response = client.post(
+        "/api/simulate/flash/",
+        json={"blocks": 65536, "pages_per_block": 1024, "writes": [0]}
+    )
+    assert response.status_code == 422
@@ -61,4 +61,127 @@ def test_optimal_algorithm():
     assert response.status_code == 200
     data = response.json()
     # Optimal should have lowest page faults
-    assert data["metrics"]["hit_ratio"] >= 0
\ No newline at end of file
+    assert data["metrics"]["hit_ratio"] >= 0
+
+def test_fault_rate_timeline():
+    """Test windowed fault-rate timeline"""
+    response = client.post(
+        "/api/simulate/page/",
+        json={
+            "algorithm": "FIFO",
+            "page_sequence": [1, 2, 3, 1, 2, 3, 4, 5, 6],
+            "frame_count": 3,
+            "fault_rate_window": 3
+        }
+    )
+    assert response.status_code == 200
+    timeline = response.json()["fault_rate_timeline"]
+    assert len(timeline) == 9
+    # Cold start, all hits, then a new phase of faults
+    assert timeline[2] == 100.0
+    assert timeline[5] == 0.0
+    assert timeline[8] == 100.0
+
+def test_fault_rate_timeline_omitted_by_default():
+    """Test fault-rate timeline is only produced on request"""
+    response = client.post(
+        "/api/simulate/page/",
+        json={"algorithm": "LRU", "page_sequence": [1, 2, 1], "frame_count": 2}
+    )
+    assert response.status_code == 200
+    assert response.json()["fault_rate_timeline"] is None
+
+def test_multiprocess_local_replacement():
+    """Test local replacement keeps processes inside their allocation"""
+    response = client.post(
+        "/api/simulate/page/multiprocess",
+        json={
+            "policy": "LRU",
+            "scope": "local",
+            "allocation": "proportional",
+            "frame_count": 4,
+            "references": [[1, 0], [1, 1], [1, 2], [2, 5], [2, 5], [1, 0], [2, 5]],
+            "processes": [
+                {"pid": 1, "size": 3},
+                {"pid": 2, "size": 1}
+            ]
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()
+    stats = {p["pid"]: p for p in data["processes"]}
+    assert stats[1]["frames"] == 3
+    assert stats[1]["page_faults"] == 3
+    assert stats[2]["page_faults"] == 1
+    assert data["metrics"]["page_faults"] == 4
+
+def test_multiprocess_global_replacement():
+    """Test global replacement steals frames across processes"""
+    response = client.post(
+        "/api/simulate/page/multiprocess",
+        json={
+            "policy": "FIFO",
+            "scope": "global",
+            "frame_count": 2,
+            "references": [[1, 0], [2, 0], [1, 1], [1, 0]]
+        }
+    )
+    assert response.status_code == 200
+    stats = {p["pid"]: p for p in response.json()["processes"]}
+    assert stats[1]["page_faults"] == 3
+    assert stats[2]["frames"] == 0
+
+def test_multiprocess_too_few_frames_for_local():
+    """Test local scope needs a frame per process"""
+    response = client.post(
+        "/api/simulate/page/multiprocess",
+        json={
+            "scope": "local",
+            "frame_count": 1,
+            "references": [[1, 0], [2, 0]]
+        }
+    )
+    assert response.status_code == 400
+
+def test_compare_matches_single_runs():
+    """Test fused compare gives the same fault counts as each algorithm alone"""
+    sequence = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+    response = client.post(
+        "/api/simulate/page/compare",
+        json={"page_sequence": sequence, "frame_count": 3}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_references"] == len(sequence)
+    assert data["best"] == "Optimal"
+    for algo, metrics in data["comparison"].items():
+        single = client.post(
+            "/api/simulate/page/",
+            json={"algorithm": algo, "page_sequence": sequence, "frame_count": 3}
+        ).json()
+        assert metrics == single["metrics"]
+
+def test_compare_policies_randomized():
+    """Test counting-only policies against the tracing implementations"""
+    import random
+    from app.algorithms.page_replacement import fifo, lru, lfu, optimal, compare_policies
+    rng = random.Random(7)
+    for _ in range(200):
+        refs = [rng.randint(0, 9) for _ in range(rng.randint(1, 60))]
+        frames = rng.randint(1, 6)
+        faults = compare_policies(refs, frames)
+        for name, algo in (("FIFO", fifo), ("LRU", lru), ("LFU", lfu), ("Optimal", optimal)):
+            assert faults[name] == algo(refs, frames)[1]
+
+def test_compare_policies_across_chunks(monkeypatch):
+    """Test counters carry their state (and heap keys) across chunk boundaries"""
+    import random
+    from app.algorithms.page_replacement import compare, fifo, lru, lfu, optimal
+    monkeypatch.setattr(compare, "CHUNK", 5)
+    rng = random.Random(11)
+    for _ in range(100):
+        refs = [rng.randint(0, 12) for _ in range(rng.randint(1, 400))]
+        frames = rng.randint(1, 5)
+        faults = compare.compare_policies(refs, frames)
+        for name, algo in (("FIFO", fifo), ("LRU", lru), ("LFU", lfu), ("Optimal", optimal)):
+            assert faults[name] == algo(refs, frames)[1]